@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Ensure src/ is on sys.path for local benchmark runs without installing the package.
+ROOT = os.path.dirname(os.path.dirname(__file__))
+SRC = os.path.join(ROOT, "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
@@ -0,0 +1,101 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List
+
+from contract_tester.traffic import _load_json_file, iter_traffic, normalize_har_entry
+
+
+def write_har(path: str, entries: int, payload_bytes: int) -> None:
+    filler = "x" * payload_bytes
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"log": {"version": "1.2", "entries": [')
+        for i in range(entries):
+            entry = {
+                "request": {"method": "GET", "url": f"https://api.example.com/users/{i}?page=1"},
+                "response": {
+                    "status": 200,
+                    "content": {
+                        "mimeType": "application/json",
+                        "text": json.dumps({"id": i, "name": "Ada", "blob": filler}),
+                    },
+                },
+            }
+            if i:
+                f.write(",")
+            f.write(json.dumps(entry))
+        f.write("]}}")
+
+
+def _measure(fn) -> Dict:
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"entries": count, "seconds": round(elapsed, 3), "peak_mb": round(peak / 2**20, 2)}
+
+
+def _streaming(path: str) -> int:
+    count = 0
+    for _ in iter_traffic(path):
+        count += 1
+    return count
+
+
+def _whole_file(path: str) -> int:
+    data = _load_json_file(Path(path))
+    normalized = [normalize_har_entry(e) for e in data["log"]["entries"]]
+    return len([e for e in normalized if e])
+
+
+def run(sizes: List[int], payload_bytes: int, include_whole_file: bool) -> List[Dict]:
+    rows = []
+    with tempfile.TemporaryDirectory() as td:
+        for size in sizes:
+            path = os.path.join(td, f"bench_{size}.har")
+            write_har(path, size, payload_bytes)
+            row = {
+                "entries": size,
+                "file_mb": round(os.path.getsize(path) / 2**20, 2),
+                "streaming": _measure(lambda: _streaming(path)),
+            }
+            if include_whole_file:
+                row["whole_file"] = _measure(lambda: _whole_file(path))
+            rows.append(row)
+            os.remove(path)
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Peak memory of HAR ingestion against file size")
+    parser.add_argument("--sizes", default="1000,4000,16000", help="Comma-separated entry counts")
+    parser.add_argument("--payload-bytes", type=int, default=2048, help="Response body filler size")
+    parser.add_argument(
+        "--no-whole-file", action="store_true", help="Skip the json.load comparison run"
+    )
+    parser.add_argument("--json", action="store_true", help="Output JSON")
+    args = parser.parse_args()
+
+    rows = run(
+        [int(x) for x in args.sizes.split(",") if x], args.payload_bytes, not args.no_whole_file
+    )
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    print(f"{'entries':>8} {'file MB':>8} {'stream peak MB':>15} {'json.load peak MB':>18}")
+    for row in rows:
+        whole = row.get("whole_file", {}).get("peak_mb", "-")
+        print(
+            f"{row['entries']:>8} {row['file_mb']:>8} {row['streaming']['peak_mb']:>15} {whole:>18}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
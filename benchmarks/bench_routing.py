@@ -0,0 +1,113 @@
+import argparse
+import json
+import random
+import time
+from typing import Dict, List
+
+from contract_tester.openapi import (
+    _extract_path_params,
+    _match_template_score,
+    _normalize_path,
+    _split_path,
+    build_router,
+)
+
+
+def make_paths(count: int) -> Dict:
+    paths: Dict = {}
+    i = 0
+    while len(paths) < count:
+        base = f"/svc{i % 17}/res{i}"
+        for suffix, op_id in (("", "list"), ("/{id}", "get"), ("/{id}/items/{itemId}", "item")):
+            if len(paths) < count:
+                paths[base + suffix] = {"get": {"operationId": f"{op_id}{i}"}}
+        i += 1
+    return paths
+
+
+def make_requests(paths: Dict, count: int, seed: int = 1) -> List[str]:
+    rng = random.Random(seed)
+    templates = list(paths)
+    out = []
+    for _ in range(count):
+        template = rng.choice(templates)
+        out.append(
+            "/".join(str(rng.randint(1, 9999)) if p.startswith("{") else p for p in template.split("/"))
+        )
+    return out
+
+
+def _linear_resolve(paths: Dict, path: str, method: str):
+    norm_path = _normalize_path(path)
+    best = None
+    best_score = -1
+    req_parts = _split_path(norm_path)
+    for template, methods in paths.items():
+        score = _match_template_score(_normalize_path(template), req_parts)
+        if score is None:
+            continue
+        op = methods.get(method)
+        if op and score > best_score:
+            best_score = score
+            best = (op, _extract_path_params(_normalize_path(template), req_parts))
+    return best
+
+
+def run(sizes: List[int], lookups: int, linear_max: int) -> List[Dict]:
+    rows = []
+    for size in sizes:
+        paths = make_paths(size)
+        spec = {"paths": paths}
+        requests = make_requests(paths, lookups)
+
+        start = time.perf_counter()
+        router = build_router(spec)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for req in requests:
+            router.resolve(req, "GET")
+        router_s = time.perf_counter() - start
+
+        row = {
+            "paths": size,
+            "lookups": lookups,
+            "build_ms": round(build_s * 1000, 3),
+            "router_us_per_lookup": round(router_s / lookups * 1e6, 3),
+            "linear_us_per_lookup": None,
+        }
+        if size <= linear_max:
+            start = time.perf_counter()
+            for req in requests:
+                _linear_resolve(paths, req, "get")
+            row["linear_us_per_lookup"] = round((time.perf_counter() - start) / lookups * 1e6, 3)
+        rows.append(row)
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark path routing against spec size")
+    parser.add_argument("--sizes", default="50,200,800,3200", help="Comma-separated path counts")
+    parser.add_argument("--lookups", type=int, default=20000, help="Lookups per size")
+    parser.add_argument(
+        "--linear-max", type=int, default=800, help="Largest size to also time the linear scan on"
+    )
+    parser.add_argument("--json", action="store_true", help="Output JSON")
+    args = parser.parse_args()
+
+    rows = run([int(x) for x in args.sizes.split(",") if x], args.lookups, args.linear_max)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    print(f"{'paths':>7} {'build ms':>10} {'router us':>10} {'linear us':>10}")
+    for row in rows:
+        linear = row["linear_us_per_lookup"]
+        print(
+            f"{row['paths']:>7} {row['build_ms']:>10} {row['router_us_per_lookup']:>10} "
+            f"{linear if linear is not None else '-':>10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,122 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks import ROOT, SRC
+
+BASELINE_PATH = Path(__file__).with_name("startup_baseline.json")
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+HEAVY_MODULES = ("jsonschema", "yaml", "cryptography")
+
+CASES: Dict[str, List[str]] = {
+    "version": ["--version"],
+    "validate": [
+        "validate",
+        "--spec",
+        os.path.join(FIXTURES, "sample_spec.json"),
+        "--traffic",
+        os.path.join(FIXTURES, "sample_traffic.json"),
+        "--json",
+    ],
+    "diff": [
+        "diff",
+        "--old",
+        os.path.join(FIXTURES, "sample_spec.json"),
+        "--new",
+        os.path.join(FIXTURES, "sample_spec.json"),
+        "--json",
+    ],
+}
+
+_RUNNER = """
+import json, sys
+sys.path.insert(0, {src!r})
+from contract_tester.cli import main
+try:
+    main({argv!r})
+except SystemExit:
+    pass
+heavy = sorted({{m.split(".")[0] for m in sys.modules}} & set({heavy!r}))
+sys.stderr.write("\\n" + json.dumps(heavy) + "\\n")
+"""
+
+
+def run_case(argv: List[str]) -> Dict:
+    code = _RUNNER.format(src=SRC, argv=argv, heavy=list(HEAVY_MODULES))
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    heavy = json.loads(proc.stderr.strip().splitlines()[-1])
+    return {"ms": elapsed * 1000, "heavy_modules": heavy}
+
+
+def run(repeat: int) -> Dict[str, Dict]:
+    out: Dict[str, Dict] = {}
+    for name, argv in CASES.items():
+        samples = [run_case(argv) for _ in range(repeat)]
+        out[name] = {
+            "median_ms": round(statistics.median(s["ms"] for s in samples), 1),
+            "heavy_modules": samples[-1]["heavy_modules"],
+        }
+    return out
+
+
+def check(results: Dict[str, Dict], baseline: Dict, tolerance: float, slack_ms: float) -> List[str]:
+    problems = []
+    for name, row in results.items():
+        base = baseline.get("cases", {}).get(name)
+        if not base:
+            continue
+        budget = base["median_ms"] * (1 + tolerance) + slack_ms
+        if row["median_ms"] > budget:
+            problems.append(f"{name}: {row['median_ms']} ms exceeds budget {budget:.1f} ms")
+        extra = sorted(set(row["heavy_modules"]) - set(base["heavy_modules"]))
+        if extra:
+            problems.append(f"{name}: now imports {', '.join(extra)}")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark CLI cold-start time")
+    parser.add_argument("--repeat", type=int, default=7, help="Runs per case (median is reported)")
+    parser.add_argument("--record", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--check", action="store_true", help="Fail if results regress against the baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.5, help="Allowed relative slowdown over baseline (default: 0.5)"
+    )
+    parser.add_argument("--slack-ms", type=float, default=50.0, help="Allowed absolute slowdown (default: 50)")
+    parser.add_argument("--json", action="store_true", help="Output JSON")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'case':>10} {'median ms':>10}  heavy imports")
+        for name, row in results.items():
+            print(f"{name:>10} {row['median_ms']:>10}  {', '.join(row['heavy_modules']) or '-'}")
+
+    if args.record:
+        baseline = {"python": sys.version.split()[0], "repeat": args.repeat, "cases": results}
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline written to {BASELINE_PATH}", file=sys.stderr)
+    if args.check:
+        if not BASELINE_PATH.is_file():
+            print(f"No baseline at {BASELINE_PATH}; run with --record first", file=sys.stderr)
+            return 2
+        baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+        problems = check(results, baseline, args.tolerance, args.slack_ms)
+        for problem in problems:
+            print(f"REGRESSION {problem}", file=sys.stderr)
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,143 @@
+import argparse
+import copy
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.generate import TRAFFIC_FORMATS, generate, make_spec
+
+from contract_tester import __version__
+from contract_tester.diff import diff_specs
+from contract_tester.openapi import build_router, load_spec, resolve_operation
+from contract_tester.report import build_html_report
+from contract_tester.traffic import load_traffic
+from contract_tester.validate import validate_traffic_against_spec
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def _row(seconds: float, items: int) -> Dict:
+    return {
+        "seconds": round(seconds, 6),
+        "items": items,
+        "per_second": round(items / seconds, 1) if seconds > 0 else None,
+    }
+
+
+def _changed_spec(spec: Dict) -> Dict:
+    new_spec = copy.deepcopy(spec)
+    templates = list(new_spec["paths"])
+    for template in templates[::10]:
+        del new_spec["paths"][template]
+    new_spec["components"]["schemas"]["ItemV1"]["required"].append("tags")
+    return new_spec
+
+
+def run(paths: int, entries: int, error_rate: float, payload_bytes: int, repeat: int, seed: int) -> Dict:
+    results: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory() as td:
+        files = generate(Path(td), paths, entries, error_rate, payload_bytes, list(TRAFFIC_FORMATS), seed)
+
+        for fmt in ("yaml", "json"):
+            path = files[f"spec_{fmt}"]
+            results[f"load_spec.{fmt}"] = _row(_time(lambda: load_spec(path), repeat), paths)
+        spec = load_spec(files["spec_json"])
+
+        traffic: List[Dict] = []
+        for fmt in TRAFFIC_FORMATS:
+            path = files[fmt]
+            results[f"load_traffic.{fmt}"] = _row(_time(lambda: load_traffic(path), repeat), entries)
+            traffic = load_traffic(path)
+
+        router = build_router(spec)
+        lookups = [(e["path"], e["method"].lower()) for e in traffic]
+        results["resolve_operation"] = _row(
+            _time(lambda: [resolve_operation(spec, p, m, router=router) for p, m in lookups], repeat),
+            len(lookups),
+        )
+
+        result = validate_traffic_against_spec(spec, traffic)
+        results["validate_traffic_against_spec"] = _row(
+            _time(lambda: validate_traffic_against_spec(spec, traffic), repeat), len(traffic)
+        )
+        results["validate_traffic_against_spec"]["error_count"] = result["error_count"]
+
+        new_spec = _changed_spec(make_spec(paths))
+        results["diff_specs"] = _row(_time(lambda: diff_specs(spec, new_spec), repeat), paths)
+        results["build_html_report"] = _row(_time(lambda: build_html_report(result), repeat), result["error_count"])
+
+    return {
+        "meta": {
+            "tool_version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "params": {
+                "paths": paths,
+                "entries": entries,
+                "error_rate": error_rate,
+                "payload_bytes": payload_bytes,
+                "repeat": repeat,
+                "seed": seed,
+            },
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict, previous: Dict) -> List[Dict]:
+    rows = []
+    for name, row in current["results"].items():
+        before = previous.get("results", {}).get(name)
+        ratio: Optional[float] = None
+        if before and before.get("seconds"):
+            ratio = round(row["seconds"] / before["seconds"], 3)
+        rows.append({"name": name, "seconds": row["seconds"], "previous": (before or {}).get("seconds"), "ratio": ratio})
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time the main pipeline stages on synthetic inputs")
+    parser.add_argument("--paths", type=int, default=200, help="Path templates in the generated spec")
+    parser.add_argument("--entries", type=int, default=5000, help="Generated traffic entries")
+    parser.add_argument("--error-rate", type=float, default=0.05, help="Fraction of entries with schema errors")
+    parser.add_argument("--payload-bytes", type=int, default=256, help="Filler bytes per response item")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage (median is reported)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    parser.add_argument("--out", help="Write results JSON to this path")
+    parser.add_argument("--compare", help="Previous results JSON to compare against")
+    args = parser.parse_args()
+
+    current = run(args.paths, args.entries, args.error_rate, args.payload_bytes, args.repeat, args.seed)
+    if args.out:
+        Path(args.out).write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+
+    previous = None
+    if args.compare:
+        previous = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+    print(f"{'stage':<32} {'seconds':>10} {'items/s':>12} {'vs prev':>8}")
+    ratios = {row["name"]: row["ratio"] for row in compare(current, previous)} if previous else {}
+    for name, row in current["results"].items():
+        ratio = ratios.get(name)
+        per_second = row["per_second"] if row["per_second"] is not None else "-"
+        print(f"{name:<32} {row['seconds']:>10.4f} {per_second:>12} {f'{ratio}x' if ratio else '-':>8}")
+    if args.out:
+        print(f"\nResults written to {args.out}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
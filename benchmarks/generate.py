@@ -0,0 +1,299 @@
+import argparse
+import json
+import random
+import shlex
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+BASE_URL = "https://api.example.com"
+TRAFFIC_FORMATS = ("har", "json", "jsonl", "curl")
+
+
+def _item_schema() -> Dict:
+    return {
+        "type": "object",
+        "required": ["id", "name"],
+        "properties": {
+            "id": {"type": "integer"},
+            "name": {"type": "string"},
+            "note": {"type": "string", "nullable": True},
+            "tags": {"type": "array", "items": {"type": "string"}},
+            "pet": {"$ref": "#/components/schemas/Pet"},
+            "blob": {"type": "string"},
+        },
+    }
+
+
+def _pet_schema() -> Dict:
+    return {
+        "oneOf": [
+            {
+                "type": "object",
+                "required": ["kind"],
+                "properties": {"kind": {"enum": ["cat"]}, "lives": {"type": "integer"}},
+            },
+            {
+                "type": "object",
+                "required": ["kind"],
+                "properties": {"kind": {"enum": ["dog"]}, "good": {"type": "boolean"}},
+            },
+        ]
+    }
+
+
+def _json_content(schema_name: str) -> Dict:
+    return {"application/json": {"schema": {"$ref": f"#/components/schemas/{schema_name}"}}}
+
+
+def make_spec(paths: int) -> Dict:
+    # Refs are both chained (Item -> ItemV1) and nested: ItemList's items
+    # refer to Item and ItemV1.pet to Pet.
+    spec: Dict = {
+        "openapi": "3.0.3",
+        "info": {"title": "Synthetic benchmark API", "version": "1.0.0"},
+        "components": {
+            "schemas": {
+                "Item": {"$ref": "#/components/schemas/ItemV1"},
+                "ItemV1": _item_schema(),
+                "ItemList": {"type": "array", "items": {"$ref": "#/components/schemas/Item"}},
+                "Pet": _pet_schema(),
+                "Note": {"type": "string", "nullable": True},
+                "Error": {
+                    "type": "object",
+                    "required": ["code"],
+                    "properties": {"code": {"type": "integer"}, "message": {"type": "string"}},
+                },
+            }
+        },
+        "paths": {},
+    }
+    id_param = {"name": "id", "in": "path", "required": True, "schema": {"type": "integer"}}
+    i = 0
+    while len(spec["paths"]) < paths:
+        collection = f"/res{i}"
+        templates = {
+            collection: {
+                "get": {
+                    "operationId": f"list{i}",
+                    "parameters": [{"name": "limit", "in": "query", "schema": {"type": "integer"}}],
+                    "responses": {"200": {"content": _json_content("ItemList")}},
+                },
+                "post": {
+                    "operationId": f"create{i}",
+                    "requestBody": {"required": True, "content": _json_content("Item")},
+                    "responses": {"201": {"content": _json_content("Item")}},
+                },
+            },
+            f"{collection}/{{id}}": {
+                "parameters": [id_param],
+                "get": {
+                    "operationId": f"get{i}",
+                    "responses": {
+                        "200": {"content": _json_content("Item")},
+                        "404": {"content": _json_content("Error")},
+                    },
+                },
+            },
+            f"{collection}/{{id}}/note": {
+                "parameters": [id_param],
+                "get": {"operationId": f"note{i}", "responses": {"200": {"content": _json_content("Note")}}},
+            },
+        }
+        for template, path_item in templates.items():
+            if len(spec["paths"]) < paths:
+                spec["paths"][template] = path_item
+        i += 1
+    return spec
+
+
+def _make_item(rng: random.Random, item_id: int, filler: str) -> Dict:
+    pet = {"kind": "cat", "lives": rng.randint(1, 9)} if rng.random() < 0.5 else {"kind": "dog", "good": True}
+    return {
+        "id": item_id,
+        "name": f"item-{item_id}",
+        "note": "fragile",
+        "tags": ["a", "b"],
+        "pet": pet,
+        "blob": filler,
+    }
+
+
+def iter_entries(
+    spec: Dict, count: int, error_rate: float = 0.0, payload_bytes: int = 128, seed: int = 1
+) -> Iterator[Dict]:
+    rng = random.Random(seed)
+    templates = list(spec["paths"])
+    filler = "x" * payload_bytes
+    for _ in range(count):
+        template = rng.choice(templates)
+        item_id = rng.randint(1, 99999)
+        path = template.replace("{id}", str(item_id))
+        entry: Dict = {
+            "method": "GET",
+            "path": path,
+            "status": 200,
+            "response_json": None,
+            "query": {},
+            "headers": {"accept": "application/json"},
+            "request_json": None,
+            "request_text": None,
+            "request_content_type": None,
+        }
+        broken = rng.random() < error_rate
+        if template.endswith("/note"):
+            entry["response_json"] = 42 if broken else None
+        elif template.endswith("{id}"):
+            entry["response_json"] = _make_item(rng, item_id, filler)
+        elif rng.random() < 0.3:
+            body = _make_item(rng, item_id, filler)
+            entry.update(
+                method="POST",
+                status=201,
+                request_json=body,
+                request_text=json.dumps(body),
+                request_content_type="application/json",
+                response_json=dict(body),
+            )
+        else:
+            entry["query"] = {"limit": "3"}
+            entry["response_json"] = [_make_item(rng, item_id + n, filler) for n in range(3)]
+        if broken and entry["response_json"] is not None and not isinstance(entry["response_json"], int):
+            target = entry["response_json"][0] if isinstance(entry["response_json"], list) else entry["response_json"]
+            if item_id % 2:
+                target["pet"] = {"kind": "fish"}
+            else:
+                target["id"] = str(target["id"])
+        yield entry
+
+
+def make_entries(
+    spec: Dict, count: int, error_rate: float = 0.0, payload_bytes: int = 128, seed: int = 1
+) -> List[Dict]:
+    return list(iter_entries(spec, count, error_rate, payload_bytes, seed))
+
+
+def _url(entry: Dict) -> str:
+    query = "&".join(f"{k}={v}" for k, v in entry["query"].items())
+    return f"{BASE_URL}{entry['path']}" + (f"?{query}" if query else "")
+
+
+def _response_text(entry: Dict) -> str:
+    return json.dumps(entry["response_json"])
+
+
+def write_spec(spec: Dict, path: Path) -> None:
+    if path.suffix.lower() in {".yaml", ".yml"}:
+        import yaml
+
+        path.write_text(yaml.safe_dump(spec, sort_keys=False), encoding="utf-8")
+    else:
+        path.write_text(json.dumps(spec), encoding="utf-8")
+
+
+def write_json(entries: Iterable[Dict], path: Path) -> None:
+    path.write_text(json.dumps(list(entries)), encoding="utf-8")
+
+
+def write_jsonl(entries: Iterable[Dict], path: Path) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def write_har(entries: Iterable[Dict], path: Path) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        f.write('{"log": {"version": "1.2", "entries": [')
+        for i, entry in enumerate(entries):
+            request: Dict = {
+                "method": entry["method"],
+                "url": _url(entry),
+                "headers": [{"name": k, "value": v} for k, v in entry["headers"].items()],
+                "queryString": [{"name": k, "value": v} for k, v in entry["query"].items()],
+            }
+            if entry["request_text"] is not None:
+                request["postData"] = {"mimeType": entry["request_content_type"], "text": entry["request_text"]}
+            har_entry = {
+                "request": request,
+                "response": {
+                    "status": entry["status"],
+                    "content": {"mimeType": "application/json", "text": _response_text(entry)},
+                },
+            }
+            if i:
+                f.write(",")
+            f.write(json.dumps(har_entry))
+        f.write("]}}")
+
+
+def write_curl(entries: Iterable[Dict], path: Path) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        for entry in entries:
+            cmd = ["curl", "-s", "-X", entry["method"], _url(entry)]
+            for name, value in entry["headers"].items():
+                cmd += ["-H", f"{name}: {value}"]
+            if entry["request_text"] is not None:
+                cmd += ["-H", f"Content-Type: {entry['request_content_type']}", "-d", entry["request_text"]]
+            f.write(" ".join(shlex.quote(part) for part in cmd) + "\n")
+            f.write(_response_text(entry) + "\n")
+            f.write(f"HTTPSTATUS:{entry['status']}\n")
+
+
+WRITERS = {"har": write_har, "json": write_json, "jsonl": write_jsonl, "curl": write_curl}
+SUFFIXES = {"har": ".har", "json": ".json", "jsonl": ".jsonl", "curl": ".log"}
+
+
+def write_traffic(entries: Iterable[Dict], out_dir: Path, fmt: str, stem: str = "traffic") -> Path:
+    path = out_dir / f"{stem}{SUFFIXES[fmt]}"
+    WRITERS[fmt](entries, path)
+    return path
+
+
+def generate(
+    out_dir: Path,
+    paths: int,
+    entries: int,
+    error_rate: float,
+    payload_bytes: int,
+    formats: Optional[List[str]] = None,
+    seed: int = 1,
+) -> Dict[str, Path]:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    spec = make_spec(paths)
+    written = {"spec_yaml": out_dir / "spec.yaml", "spec_json": out_dir / "spec.json"}
+    write_spec(spec, written["spec_yaml"])
+    write_spec(spec, written["spec_json"])
+    traffic = make_entries(spec, entries, error_rate, payload_bytes, seed)
+    for fmt in formats or TRAFFIC_FORMATS:
+        written[fmt] = write_traffic(traffic, out_dir, fmt)
+    return written
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate synthetic specs and traffic for benchmarks")
+    parser.add_argument("--out-dir", default="bench_data", help="Output directory")
+    parser.add_argument("--paths", type=int, default=200, help="Path templates in the spec")
+    parser.add_argument("--entries", type=int, default=10000, help="Traffic entries")
+    parser.add_argument("--error-rate", type=float, default=0.05, help="Fraction of entries with schema errors")
+    parser.add_argument("--payload-bytes", type=int, default=256, help="Filler bytes per response item")
+    parser.add_argument(
+        "--formats", default=",".join(TRAFFIC_FORMATS), help="Comma-separated traffic formats to write"
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    args = parser.parse_args()
+
+    written = generate(
+        Path(args.out_dir),
+        args.paths,
+        args.entries,
+        args.error_rate,
+        args.payload_bytes,
+        [f for f in args.formats.split(",") if f],
+        args.seed,
+    )
+    for name, path in written.items():
+        print(f"{name}: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
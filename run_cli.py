@@ -1,5 +1,9 @@
+import multiprocessing
+
 from contract_tester.cli import main
 
 
 if __name__ == "__main__":
+    # Required for --workers in the frozen (PyInstaller) executable.
+    multiprocessing.freeze_support()
     raise SystemExit(main())
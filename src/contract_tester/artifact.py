@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+from . import __version__
+from .compiled import CompiledSpec, pick_json_schema_from_content
+from .openapi import ARTIFACT_KEY, get_paths, iter_operations, load_spec, resolve_schema, route_templates
+
+ARTIFACT_FORMAT = 1
+ARTIFACT_SUFFIX = ".ctspec.json"
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _iter_schema_refs(spec: Dict) -> Iterator[str]:
+    def _ref(schema: object) -> Optional[str]:
+        if isinstance(schema, dict) and isinstance(schema.get("$ref"), str):
+            return schema["$ref"]
+        return None
+
+    for path_item in get_paths(spec).values():
+        if isinstance(path_item, dict):
+            for param in path_item.get("parameters") or []:
+                if isinstance(param, dict) and _ref(param.get("schema")):
+                    yield param["schema"]["$ref"]
+    for _, _, op in iter_operations(spec):
+        for param in op.get("parameters") or []:
+            if isinstance(param, dict) and _ref(param.get("schema")):
+                yield param["schema"]["$ref"]
+        request_body = op.get("requestBody")
+        if isinstance(request_body, dict):
+            ref = _ref(pick_json_schema_from_content(request_body.get("content") or {}))
+            if ref:
+                yield ref
+        for response in (op.get("responses") or {}).values():
+            if isinstance(response, dict):
+                ref = _ref(pick_json_schema_from_content(response.get("content") or {}))
+                if ref:
+                    yield ref
+
+
+def default_artifact_path(spec_path: Union[str, Path]) -> Path:
+    p = Path(spec_path)
+    return p.with_name(p.stem + ARTIFACT_SUFFIX)
+
+
+def build_artifact(spec: Dict, source: Path, artifact_path: Path) -> Dict:
+    # Round-trip through JSON so the artifact holds exactly what a load will see
+    # (e.g. YAML integer status keys become strings).
+    normalized = json.loads(json.dumps(spec, default=str))
+    schemas: Dict[str, Dict] = {}
+    for ref in _iter_schema_refs(normalized):
+        if ref not in schemas:
+            resolved = resolve_schema(normalized, {"$ref": ref})
+            if isinstance(resolved, dict) and "$ref" not in resolved:
+                schemas[ref] = resolved
+    try:
+        source_ref = os.path.relpath(source.resolve(), artifact_path.resolve().parent)
+    except ValueError:
+        source_ref = str(source.resolve())
+    return {
+        ARTIFACT_KEY: ARTIFACT_FORMAT,
+        "tool_version": __version__,
+        "source": {"path": source_ref, "sha256": _sha256_file(source)},
+        "spec": normalized,
+        "routes": route_templates(normalized),
+        "schemas": schemas,
+    }
+
+
+def _write_json_atomic(path: Path, data: Dict) -> None:
+    fd, tmp = tempfile.mkstemp(prefix=path.name, suffix=".tmp", dir=str(path.parent or "."))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def write_artifact(spec_path: Union[str, Path], out_path: Union[str, Path, None] = None) -> Dict:
+    source = Path(spec_path)
+    out = Path(out_path) if out_path else default_artifact_path(source)
+    spec = load_spec(source)
+    data = build_artifact(spec, source, out)
+    _write_json_atomic(out, data)
+    return data
+
+
+def _source_path(artifact_path: Path, data: Dict) -> Optional[Path]:
+    source = data.get("source")
+    if not isinstance(source, dict) or not isinstance(source.get("path"), str):
+        return None
+    p = Path(source["path"])
+    if not p.is_absolute():
+        p = artifact_path.parent / p
+    return p
+
+
+def fresh_artifact(artifact_path: Path, data: Dict) -> Dict:
+    source = _source_path(artifact_path, data)
+    current = data.get(ARTIFACT_KEY) == ARTIFACT_FORMAT
+    if source is not None and source.is_file():
+        expected = (data.get("source") or {}).get("sha256")
+        if current and expected == _sha256_file(source):
+            return data
+        rebuilt = build_artifact(load_spec(source), source, artifact_path)
+        try:
+            _write_json_atomic(artifact_path, rebuilt)
+        except OSError:
+            pass
+        return rebuilt
+    if not current:
+        raise ValueError(
+            f"Compiled spec {artifact_path} uses an unsupported format; re-run 'contract-tester compile'"
+        )
+    if not isinstance(data.get("spec"), dict):
+        raise ValueError(f"Compiled spec {artifact_path} is missing the spec")
+    return data
+
+
+def load_compiled_spec(path: Union[str, Path]) -> CompiledSpec:
+    p = Path(path)
+    if p.name.endswith(ARTIFACT_SUFFIX) or p.suffix.lower() == ".json":
+        try:
+            raw = json.loads(p.read_text(encoding="utf-8"))
+        except ValueError:
+            raw = None
+        if isinstance(raw, dict) and ARTIFACT_KEY in raw:
+            data = fresh_artifact(p, raw)
+            return CompiledSpec(
+                data["spec"], templates=data.get("routes"), resolved_schemas=data.get("schemas")
+            )
+        if isinstance(raw, dict):
+            return CompiledSpec(load_spec(p, data=raw))
+    return CompiledSpec(load_spec(p))
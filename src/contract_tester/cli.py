@@ -1,24 +1,140 @@
 import argparse
 import json
 import sys
-from typing import List, Optional
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
-from .diff import diff_specs
+from .errorstore import DEFAULT_MAX_EXAMPLES, top_error_groups
 from .license import DEMO_MAX_PATHS, DEMO_MAX_TRAFFIC, get_license_status
-from .openapi import load_spec
 from .output import err, ok, strong, supports_color, warn
-from .report import build_html_report
-from .traffic import load_traffic
-from .validate import validate_traffic_against_spec
 from . import __version__
 
+if TYPE_CHECKING:
+    from .compiled import CompiledSpec
+    from .profiling import Profiler
+
+# Subcommand dependencies (jsonschema, yaml, cryptography, report/diff) are
+# imported inside the command handlers so --version and --help start fast.
+
+
+class _SkippedLines:
+    def __init__(self, keep: int = 5) -> None:
+        self.count = 0
+        self.keep = keep
+        self.samples: List[Tuple[int, str]] = []
+
+    def __call__(self, lineno: int, reason: str) -> None:
+        self.count += 1
+        if len(self.samples) < self.keep:
+            self.samples.append((lineno, reason))
+
+
+class _VersionAction(argparse.Action):
+    def __init__(self, option_strings: List[str], dest: str = argparse.SUPPRESS, **kwargs: object) -> None:
+        super().__init__(option_strings, dest=dest, default=argparse.SUPPRESS, nargs=0, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None) -> None:
+        license_tag = "licensed" if get_license_status()["valid"] else "demo"
+        print(f"{parser.prog} {__version__} ({license_tag})")
+        parser.exit()
+
 
 def _cmd_validate(args: argparse.Namespace) -> int:
     color = supports_color() and (not args.no_color)
     if args.max_errors is not None and args.max_errors <= 0:
         raise ValueError("--max-errors must be a positive integer")
-    spec = load_spec(args.spec)
-    traffic = load_traffic(args.traffic)
+    if args.workers < 0:
+        raise ValueError("--workers must be zero (one per CPU) or a positive integer")
+    if args.max_examples < 0:
+        raise ValueError("--max-examples must be zero or a positive integer")
+    if args.cache_size is not None and args.cache_size <= 0:
+        raise ValueError("--cache-size must be a positive integer")
+    if args.profile and args.mem_report:
+        raise ValueError("--profile and --mem-report can't be combined (tracemalloc skews timings)")
+    if (args.profile or args.mem_report) and (args.workers != 1 or args.pipeline):
+        flag = "--profile" if args.profile else "--mem-report"
+        raise ValueError(f"{flag} needs a single process; drop --workers/--pipeline")
+    if args.pipeline and args.workers != 1:
+        raise ValueError("--pipeline and --workers are alternative modes; pick one")
+    if args.queue_depth <= 0:
+        raise ValueError("--queue-depth must be a positive integer")
+    if args.read_ahead <= 0:
+        raise ValueError("--read-ahead must be a positive integer")
+    from .multifile import expand_traffic_paths
+
+    args.traffic_paths = expand_traffic_paths(args.traffic)
+    if len(args.traffic_paths) > 1 and (args.pipeline or args.shard is not None):
+        flag = "--pipeline" if args.pipeline else "--shard"
+        raise ValueError(f"{flag} takes a single traffic file")
+    if args.shard is not None:
+        if args.workers != 1 or args.pipeline:
+            raise ValueError("--shard runs one process per shard; drop --workers/--pipeline")
+        if args.max_errors is not None:
+            raise ValueError("--max-errors can't be combined with --shard (the cut-off is global)")
+        if args.report:
+            raise ValueError("--report can't be combined with --shard; build it with merge --report")
+    if args.follow:
+        if len(args.traffic_paths) > 1:
+            raise ValueError("--follow takes a single traffic file")
+        if args.workers != 1 or args.pipeline or args.shard is not None or args.state is not None:
+            raise ValueError("--follow tails in a single process; drop --workers/--pipeline/--shard/--state")
+        if args.max_errors is not None:
+            raise ValueError("--max-errors can't be combined with --follow")
+        if args.profile or args.mem_report:
+            raise ValueError("--profile and --mem-report can't be combined with --follow")
+        if args.window <= 0 or args.summary_interval <= 0:
+            raise ValueError("--window and --summary-interval must be positive")
+    if args.state is not None:
+        if len(args.traffic_paths) > 1:
+            raise ValueError("--state takes a single traffic file")
+        if args.workers != 1 or args.pipeline or args.shard is not None:
+            raise ValueError("--state resumes a single-process run; drop --workers/--pipeline/--shard")
+        if args.max_errors is not None:
+            raise ValueError("--max-errors can't be combined with --state (totals span several runs)")
+        if args.profile or args.mem_report:
+            raise ValueError("--profile and --mem-report can't be combined with --state")
+    if args.profile:
+        from .profiling import Profiler
+
+        return _run_validate(args, color, Profiler())
+    if args.mem_report:
+        from .profiling import MemoryProfiler
+
+        mem = MemoryProfiler().start()
+        try:
+            return _run_validate(args, color, mem)
+        finally:
+            mem.stop()
+    return _run_validate(args, color, None)
+
+
+def _run_validate(args: argparse.Namespace, color: bool, profiler: Optional["Profiler"]) -> int:
+    from .artifact import load_compiled_spec
+    from .memo import ValidationCache
+    from .parallel import validate_traffic_parallel
+    from .traffic import iter_traffic
+    from .validate import validate_traffic_against_spec
+
+    if profiler is not None:
+        profiler.mark("spec_load")
+    spec = load_compiled_spec(args.spec)
+    if profiler is not None:
+        profiler.mark(None)
+    shard = None
+    if args.shard is not None:
+        from .shard import parse_shard
+
+        shard = parse_shard(args.shard)
+    skipped = _SkippedLines()
+    files = None
+    traffic: Optional[Iterable[Dict]] = None
+    if len(args.traffic_paths) > 1:
+        from .multifile import TrafficFiles
+
+        traffic = files = TrafficFiles(args.traffic_paths, on_error=skipped, read_ahead=args.read_ahead)
+    elif not args.pipeline and args.state is None and not args.follow:
+        traffic = iter_traffic(args.traffic_paths[0], on_error=skipped)
+    traffic_limit = None
     license_status = get_license_status()
     if not license_status["valid"]:
         print(
@@ -27,9 +143,11 @@ def _cmd_validate(args: argparse.Namespace) -> int:
                 color,
             )
         )
-        if len(traffic) > DEMO_MAX_TRAFFIC:
-            traffic = traffic[:DEMO_MAX_TRAFFIC]
-        if isinstance(spec.get("paths"), dict) and len(spec.get("paths", {})) > DEMO_MAX_PATHS:
+        traffic_limit = DEMO_MAX_TRAFFIC
+        if traffic is not None:
+            traffic = islice(traffic, DEMO_MAX_TRAFFIC)
+        paths = spec.spec.get("paths")
+        if isinstance(paths, dict) and len(paths) > DEMO_MAX_PATHS:
             print(
                 err(
                     f"Demo mode: spec has more than {DEMO_MAX_PATHS} paths. Add a license to run.",
@@ -38,27 +156,186 @@ def _cmd_validate(args: argparse.Namespace) -> int:
                 file=sys.stderr,
             )
             return 2
-    result = validate_traffic_against_spec(
+    if args.follow:
+        return _run_follow(args, spec, color, license_status, traffic_limit)
+    partial = None
+    state = None
+    if args.state is not None:
+        from .state import load_state, validate_traffic_resumable
+
+        result, state = validate_traffic_resumable(
+            spec,
+            args.traffic_paths[0],
+            load_state(args.state),
+            ignore_unknown=args.ignore_unknown,
+            cache=ValidationCache(args.cache_size) if args.cache_size else None,
+            max_examples=args.max_examples,
+            traffic_limit=traffic_limit,
+            on_error=skipped,
+        )
+    elif shard is not None:
+        from .shard import validate_traffic_shard
+
+        result, partial = validate_traffic_shard(
+            spec,
+            traffic,
+            shard[0],
+            shard[1],
+            key=args.shard_key,
+            ignore_unknown=args.ignore_unknown,
+            cache=ValidationCache(args.cache_size) if args.cache_size else None,
+            max_examples=args.max_examples,
+            profiler=profiler,
+            traffic_limit=traffic_limit,
+        )
+    elif args.pipeline:
+        from .pipeline import validate_traffic_pipelined
+
+        result = validate_traffic_pipelined(
+            spec,
+            args.traffic_paths[0],
+            mode=args.pipeline,
+            queue_depth=args.queue_depth,
+            limit=traffic_limit,
+            on_error=skipped,
+            max_errors=args.max_errors,
+            ignore_unknown=args.ignore_unknown,
+            cache=ValidationCache(args.cache_size) if args.cache_size else None,
+            max_examples=args.max_examples,
+        )
+    elif args.workers != 1:
+        result = validate_traffic_parallel(
+            spec,
+            traffic,
+            workers=args.workers,
+            max_errors=args.max_errors,
+            ignore_unknown=args.ignore_unknown,
+            cache_size=args.cache_size,
+            max_examples=args.max_examples,
+            files=files,
+        )
+    else:
+        result = validate_traffic_against_spec(
+            spec,
+            traffic,
+            max_errors=args.max_errors,
+            ignore_unknown=args.ignore_unknown,
+            cache=ValidationCache(args.cache_size) if args.cache_size else None,
+            max_examples=args.max_examples,
+            profiler=profiler,
+            files=files,
+        )
+    result["license_status"] = license_status
+    if skipped.count:
+        result["skipped_lines"] = skipped.count
+        print(warn(f"Skipped {skipped.count} malformed traffic line(s):", color), file=sys.stderr)
+        for lineno, reason in skipped.samples:
+            print(f"- line {lineno}: {reason}", file=sys.stderr)
+    partial_out = None
+    if partial is not None and shard is not None:
+        from .shard import default_partial_path, write_partial
+
+        partial["license_status"] = license_status
+        partial["skipped_lines"] = skipped.count
+        partial_out = args.partial_out or default_partial_path(*shard)
+        write_partial(partial_out, partial)
+    if state is not None:
+        from .state import write_state
+
+        write_state(args.state, state)
+
+    if profiler is not None:
+        if args.report:
+            # Built before the profile is taken, so the report counts as "reporting".
+            profiler.mark("reporting")
+            _write_report(args.report, result)
+        result["memory" if args.mem_report else "profile"] = profiler.result()
+
+    _emit_result(args, result, color, write_report=profiler is None)
+    if partial_out is not None and not args.json:
+        print(f"\nPartial result written to {partial_out}")
+    return 1 if result["error_count"] else 0
+
+
+def _run_follow(
+    args: argparse.Namespace, spec: "CompiledSpec", color: bool, license_status: Dict, traffic_limit: Optional[int]
+) -> int:
+    import signal
+    import threading
+
+    from .follow import TrafficFollower
+    from .memo import ValidationCache
+
+    def _skipped(lineno: int, reason: str) -> None:
+        print(warn(f"Skipped malformed traffic line {lineno}: {reason}", color), file=sys.stderr)
+
+    def _summary(summary: Dict) -> None:
+        if args.json:
+            print(json.dumps({"follow_summary": summary}), flush=True)
+            return
+        window = summary["window"]
+        since = summary["since_last"]
+        print(
+            f"{summary['time']}  {strong('checks', color)} {summary['total_checks']} (+{since['checks']})"
+            f"  {strong('errors', color)} {summary['error_count']} (+{since['error_count']})"
+            f"  last {window['seconds'] / 60:g} min: {window['checks']} checks, {window['error_count']} errors",
+            flush=True,
+        )
+        for key, count in list(window["error_group_counts"].items())[:3]:
+            print(f"  - {key} ({count})", flush=True)
+
+    follower = TrafficFollower(
         spec,
-        traffic,
-        max_errors=args.max_errors,
+        args.traffic_paths[0],
         ignore_unknown=args.ignore_unknown,
+        cache=ValidationCache(args.cache_size) if args.cache_size else None,
+        max_examples=args.max_examples,
+        window=args.window * 60,
+        summary_interval=args.summary_interval,
+        max_entries=traffic_limit,
+        on_error=_skipped,
+        on_summary=_summary,
     )
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+    result = follower.run(stop)
     result["license_status"] = license_status
+    _emit_result(args, result, color, compact=True)
+    return 1 if result["error_count"] else 0
+
+
+def _write_report(path: str, result: Dict) -> None:
+    from .report import build_html_report
+
+    html = build_html_report(result)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+
+
+def _emit_result(
+    args: argparse.Namespace, result: Dict, color: bool, compact: bool = False, write_report: bool = True
+) -> None:
+    if args.report and write_report:
+        _write_report(args.report, result)
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        # Compact output keeps a --follow stream one JSON document per line.
+        print(json.dumps(result) if compact else json.dumps(result, indent=2))
     else:
         print(f"{strong('Total checks:', color)} {result['total_checks']}")
         print(f"{strong('Errors:', color)} {result['error_count']}")
+        cache_stats = result.get("cache")
+        if cache_stats:
+            print(f"{strong('Cache:', color)} {cache_stats['hits']} hits, {cache_stats['misses']} misses")
         if result["stopped_early"]:
             print(warn("Stopped early due to max error limit.", color))
         if result["error_count"]:
-            grouped = result.get("errors_grouped", {})
-            if grouped:
+            top_groups = top_error_groups(result, 5)
+            if top_groups:
                 print("\nTop error groups:")
-                for key in list(grouped.keys())[:5]:
-                    print(f"- {key} ({len(grouped[key])})")
+                for key, count in top_groups:
+                    print(f"- {key} ({count})")
                 print("\nTop errors:")
             else:
                 print("\nTop errors:")
@@ -74,18 +351,126 @@ def _cmd_validate(args: argparse.Namespace) -> int:
             else:
                 for err_msg in result["errors"][:10]:
                     print(f"- {err_msg}")
+        if "files" in result:
+            _print_files(result["files"], color)
+        if "proxy" in result:
+            _print_proxy(result["proxy"], color)
+        if "pipeline" in result:
+            _print_pipeline(result["pipeline"], color)
+        if "profile" in result:
+            _print_profile(result["profile"], color)
+        if "memory" in result:
+            _print_memory(result["memory"], color)
+        if "shard" in result:
+            shard = result["shard"]
+            print(
+                f"\n{strong('Shard:', color)} {shard['index']}/{shard['count']} by {shard['key']}"
+                f" ({result['total_checks']} of {shard['entries_seen']} entries)"
+            )
+        if "state" in result:
+            _print_state(result["state"], color)
+        if "follow" in result:
+            follow = result["follow"]
+            print(
+                f"\n{strong('Followed:', color)} {follow['path']} for {follow['elapsed_s']:.0f}s"
+                f" (reopened {follow['reopened']}x, truncated {follow['truncated']}x)"
+            )
+
+    if args.report and not args.json:
+        print(f"\nReport written to {args.report}")
+
 
-    if args.report:
-        html = build_html_report(result)
-        with open(args.report, "w", encoding="utf-8") as f:
-            f.write(html)
-        if not args.json:
-            print(f"\nReport written to {args.report}")
+def _cmd_merge(args: argparse.Namespace) -> int:
+    from .shard import load_partial, merge_partials
 
+    color = supports_color() and (not args.no_color)
+    result = merge_partials([load_partial(path) for path in args.partials])
+    if result.get("skipped_lines"):
+        print(warn(f"Skipped {result['skipped_lines']} malformed traffic line(s).", color), file=sys.stderr)
+    _emit_result(args, result, color)
     return 1 if result["error_count"] else 0
 
 
+def _print_files(files: List[Dict], color: bool, top: int = 10) -> None:
+    failing = sorted((row for row in files if row["error_count"]), key=lambda row: -row["error_count"])
+    print(f"\n{strong('Files:', color)} {len(files)} ({len(failing)} with errors)")
+    for row in failing[:top]:
+        print(f"- {row['path']}: {row['error_count']} errors in {row['total_checks']} entries")
+    if len(failing) > top:
+        print(f"- ... and {len(failing) - top} more files with errors")
+
+
+def _print_state(state: Dict, color: bool) -> None:
+    if state["resumed"]:
+        start = f"resumed at byte {state['start_offset']}"
+    elif state["reset_reason"]:
+        start = f"started over ({state['reset_reason']})"
+    else:
+        start = "started fresh"
+    print(
+        f"\n{strong('State:', color)} {start}; {state['new_entries']} new entries,"
+        f" now at byte {state['offset']}"
+    )
+
+
+def _print_proxy(proxy: Dict, color: bool) -> None:
+    latency = proxy["added_latency_ms"]
+
+    def _fmt(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:.2f}"
+
+    print(f"\n{strong('Proxy:', color)} {proxy['exchanges']} exchanges with {proxy['upstream']}")
+    print(f"  validated {proxy['validated']}, dropped {proxy['dropped']} (queue size {proxy['queue_size']})")
+    if proxy["failed"]:
+        print(f"  {proxy['failed']} exchanges could not be validated")
+    print(f"  added latency ms: p50 {_fmt(latency['p50'])}, p99 {_fmt(latency['p99'])}, max {_fmt(latency['max'])}")
+
+
+def _print_profile(profile: Dict, color: bool, top: int = 5) -> None:
+    print(f"\n{strong('Profile:', color)}")
+    print(f"  {'phase':<14} {'wall ms':>10} {'cpu ms':>10}")
+    for name, row in profile["phases"].items():
+        print(f"  {name:<14} {row['wall_s'] * 1000:>10.1f} {row['cpu_s'] * 1000:>10.1f}")
+    if profile["slowest_operations"]:
+        print("Slowest operations:")
+        for row in profile["slowest_operations"][:top]:
+            print(f"- {row['operation']}: {row['seconds'] * 1000:.1f} ms ({row['calls']} entries)")
+    if profile["slowest_schemas"]:
+        print("Slowest schemas:")
+        for row in profile["slowest_schemas"][:top]:
+            print(f"- {row['schema']}: {row['seconds'] * 1000:.1f} ms ({row['calls']} checks)")
+
+
+def _print_pipeline(pipeline: Dict, color: bool) -> None:
+    print(f"\n{strong('Pipeline:', color)} {pipeline['mode']}, queue depth {pipeline['queue_depth']}")
+    for name, row in pipeline["stages"].items():
+        rate = row["items_per_s"]
+        waited = row.get("blocked_s", row.get("starved_s"))
+        wait_label = "blocked" if "blocked_s" in row else "starved"
+        print(
+            f"  {name:<9} {row['items']:>9} items"
+            f"  {'-' if rate is None else f'{rate:.0f}':>9} items/s"
+            f"  {wait_label} {'-' if waited is None else f'{waited * 1000:.0f}'} ms"
+        )
+    if pipeline["bottleneck"]:
+        print(f"  bottleneck: {pipeline['bottleneck']}")
+
+
+def _print_memory(memory: Dict, color: bool) -> None:
+    def _fmt(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:.1f}"
+
+    print(f"\n{strong('Memory:', color)}")
+    print(f"  {'phase':<14} {'traced MB':>10} {'RSS MB':>10}")
+    for name, row in memory["phases"].items():
+        print(f"  {name:<14} {_fmt(row['peak_traced_mb']):>10} {_fmt(row['peak_rss_mb']):>10}")
+    print(f"  {'peak':<14} {_fmt(memory['peak_traced_mb']):>10} {_fmt(memory['peak_rss_mb']):>10}")
+
+
 def _cmd_diff(args: argparse.Namespace) -> int:
+    from .diff import diff_specs
+    from .openapi import load_spec
+
     color = supports_color() and (not args.no_color)
     old_spec = load_spec(args.old)
     new_spec = load_spec(args.new)
@@ -122,14 +507,142 @@ def _cmd_diff(args: argparse.Namespace) -> int:
     return 1 if result["breaking_changes"] else 0
 
 
+def _cmd_compile(args: argparse.Namespace) -> int:
+    from .artifact import default_artifact_path, write_artifact
+
+    color = supports_color() and (not args.no_color)
+    out = args.out or str(default_artifact_path(args.spec))
+    artifact = write_artifact(args.spec, out)
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "artifact": out,
+                    "source_sha256": artifact["source"]["sha256"],
+                    "routes": len(artifact["routes"]),
+                    "schemas": len(artifact["schemas"]),
+                },
+                indent=2,
+            )
+        )
+    else:
+        print(ok(f"Compiled spec written to {out}", color))
+        print(f"{strong('Routes:', color)} {len(artifact['routes'])}")
+        print(f"{strong('Resolved schemas:', color)} {len(artifact['schemas'])}")
+    return 0
+
+
+def _cmd_serve(args: argparse.Namespace) -> int:
+    import signal
+
+    from .server import ValidationServer, ValidationService
+
+    color = supports_color() and (not args.no_color)
+    if args.cache_size is not None and args.cache_size < 0:
+        raise ValueError("--cache-size must be zero (off) or a positive integer")
+    license_status = get_license_status()
+    if not license_status["valid"]:
+        print(warn(f"Demo mode: limiting the server to {DEMO_MAX_TRAFFIC} entries.", color), file=sys.stderr)
+    service = ValidationService(
+        args.spec,
+        license_status,
+        ignore_unknown=args.ignore_unknown,
+        cache_size=args.cache_size,
+        reload_interval=args.reload_interval,
+    )
+    server = ValidationServer(args.socket, service)
+
+    def _stop(signum, frame) -> None:
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, _stop)
+    print(ok(f"Validating against {args.spec} on {args.socket}", color), file=sys.stderr, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    stats = service.stats()
+    print(f"Served {stats['checked']} entries, {stats['error_count']} errors.", file=sys.stderr)
+    return 0
+
+
+def _parse_listen(value: str) -> Tuple[Optional[str], int]:
+    host, sep, port = value.rpartition(":")
+    try:
+        number = int(port)
+    except ValueError:
+        raise ValueError(f"--listen must look like [HOST]:PORT, got {value!r}") from None
+    if not 0 <= number <= 65535:
+        raise ValueError(f"--listen port out of range: {number}")
+    return (host.strip("[]") or None) if sep else None, number
+
+
+def _cmd_proxy(args: argparse.Namespace) -> int:
+    import asyncio
+    import signal
+
+    from .artifact import load_compiled_spec
+    from .memo import ValidationCache
+    from .proxy import ValidatingProxy
+
+    color = supports_color() and (not args.no_color)
+    if args.queue_size <= 0:
+        raise ValueError("--queue-size must be a positive integer")
+    if args.max_examples < 0:
+        raise ValueError("--max-examples must be zero or a positive integer")
+    if args.cache_size is not None and args.cache_size <= 0:
+        raise ValueError("--cache-size must be a positive integer")
+    host, port = _parse_listen(args.listen)
+    spec = load_compiled_spec(args.spec)
+    license_status = get_license_status()
+    max_entries = None
+    if not license_status["valid"]:
+        paths = spec.spec.get("paths")
+        if isinstance(paths, dict) and len(paths) > DEMO_MAX_PATHS:
+            print(err(f"Demo mode: spec has more than {DEMO_MAX_PATHS} paths. Add a license to run.", color), file=sys.stderr)
+            return 2
+        print(warn(f"Demo mode: validating the first {DEMO_MAX_TRAFFIC} exchanges only.", color), file=sys.stderr)
+        max_entries = DEMO_MAX_TRAFFIC
+    spec.warm()
+    proxy = ValidatingProxy(
+        spec,
+        args.upstream,
+        queue_size=args.queue_size,
+        ignore_unknown=args.ignore_unknown,
+        cache=ValidationCache(args.cache_size) if args.cache_size else None,
+        max_examples=args.max_examples,
+        max_entries=max_entries,
+    )
+
+    async def _run() -> None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        bound = await proxy.start(host, port)
+        print(
+            ok(f"Proxying {host or '*'}:{bound} -> {args.upstream}, validating against {args.spec}", color),
+            file=sys.stderr,
+            flush=True,
+        )
+        await stop.wait()
+        await proxy.close()
+
+    asyncio.run(_run())
+    result = proxy.result()
+    result["license_status"] = license_status
+    _emit_result(args, result, color)
+    return 1 if result["error_count"] else 0
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="contract-tester", description="Local API Contract Tester (MVP)")
-    license_status = get_license_status()
-    license_tag = "licensed" if license_status["valid"] else "demo"
     parser.add_argument(
         "--version",
-        action="version",
-        version=f"%(prog)s {__version__} ({license_tag})",
+        action=_VersionAction,
+        help="Show program's version number and license mode and exit",
     )
     parser.add_argument(
         "--license-status",
@@ -144,8 +657,22 @@ def build_parser() -> argparse.ArgumentParser:
     sub = parser.add_subparsers(dest="command")
 
     p_validate = sub.add_parser("validate", help="Validate traffic against an OpenAPI spec")
-    p_validate.add_argument("--spec", required=True, help="Path to OpenAPI JSON/YAML")
-    p_validate.add_argument("--traffic", required=True, help="Path to HAR or normalized traffic JSON")
+    p_validate.add_argument("--spec", required=True, help="Path to OpenAPI JSON/YAML or compiled spec")
+    p_validate.add_argument(
+        "--traffic",
+        required=True,
+        nargs="+",
+        help=(
+            "HAR, normalized traffic JSON/JSON Lines or curl log files, globs or directories"
+            " ('-' reads JSON Lines from stdin)"
+        ),
+    )
+    p_validate.add_argument(
+        "--read-ahead",
+        type=int,
+        default=4,
+        help="Traffic files parsed concurrently ahead of validation when several are given (default: 4)",
+    )
     p_validate.add_argument(
         "--ignore-unknown",
         action="store_true",
@@ -163,17 +690,179 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Stop after this many errors (useful for large logs)",
     )
+    p_validate.add_argument(
+        "--max-examples",
+        type=int,
+        default=DEFAULT_MAX_EXAMPLES,
+        help=f"Example errors kept per group; the rest are only counted (default: {DEFAULT_MAX_EXAMPLES})",
+    )
+    p_validate.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Validate in this many processes (0 = one per CPU, default: 1)",
+    )
+    p_validate.add_argument(
+        "--cache-size",
+        type=int,
+        default=None,
+        help="Reuse validation results for up to this many distinct payloads (default: off)",
+    )
+    p_validate.add_argument(
+        "--pipeline",
+        choices=("thread", "process"),
+        default=None,
+        help="Parse traffic in a separate thread or process, overlapping parsing and validation",
+    )
+    p_validate.add_argument(
+        "--queue-depth",
+        type=int,
+        default=8,
+        help="Parsed batches buffered between pipeline stages (default: 8)",
+    )
+    p_validate.add_argument(
+        "--profile",
+        action="store_true",
+        help="Report wall/CPU time per phase and the slowest operations and schemas",
+    )
+    p_validate.add_argument(
+        "--mem-report",
+        action="store_true",
+        help="Report peak traced (tracemalloc) and resident memory per phase",
+    )
+    p_validate.add_argument(
+        "--shard",
+        default=None,
+        metavar="I/N",
+        help="Validate only shard I of N and write a partial result for merge",
+    )
+    p_validate.add_argument(
+        "--shard-key",
+        choices=("position", "content"),
+        default="position",
+        help="Assign entries to shards by position in the input or by a hash of their content",
+    )
+    p_validate.add_argument(
+        "--partial-out",
+        default=None,
+        help="Partial result path for --shard (default: partial-I-of-N.json)",
+    )
+    p_validate.add_argument(
+        "--state",
+        default=None,
+        help="Resume from and update this state file: only traffic appended since the last run is read",
+    )
+    p_validate.add_argument(
+        "--follow",
+        action="store_true",
+        help="Keep reading a growing JSON Lines or curl log like tail -F until Ctrl+C or SIGTERM",
+    )
+    p_validate.add_argument(
+        "--window",
+        type=float,
+        default=5.0,
+        help="Minutes covered by the rolling counts in --follow summaries (default: 5)",
+    )
+    p_validate.add_argument(
+        "--summary-interval",
+        type=float,
+        default=60.0,
+        help="Seconds between --follow summaries (default: 60)",
+    )
     p_validate.add_argument("--no-color", action="store_true", help="Disable ANSI colors")
     p_validate.add_argument("--json", action="store_true", help="Output JSON")
     p_validate.set_defaults(func=_cmd_validate)
 
+    p_merge = sub.add_parser("merge", help="Combine partial results from validate --shard runs")
+    p_merge.add_argument("partials", nargs="+", help="Partial result files, one per shard")
+    p_merge.add_argument(
+        "--report",
+        nargs="?",
+        const="report.html",
+        help="Write an HTML report to this path (default: report.html)",
+    )
+    p_merge.add_argument("--no-color", action="store_true", help="Disable ANSI colors")
+    p_merge.add_argument("--json", action="store_true", help="Output JSON")
+    p_merge.set_defaults(func=_cmd_merge)
+
     p_diff = sub.add_parser("diff", help="Compare two OpenAPI specs for breaking changes")
-    p_diff.add_argument("--old", required=True, help="Old spec")
-    p_diff.add_argument("--new", required=True, help="New spec")
+    p_diff.add_argument("--old", required=True, help="Old spec (OpenAPI or compiled)")
+    p_diff.add_argument("--new", required=True, help="New spec (OpenAPI or compiled)")
     p_diff.add_argument("--no-color", action="store_true", help="Disable ANSI colors")
     p_diff.add_argument("--json", action="store_true", help="Output JSON")
     p_diff.set_defaults(func=_cmd_diff)
 
+    p_compile = sub.add_parser("compile", help="Precompile an OpenAPI spec for faster repeated runs")
+    p_compile.add_argument("--spec", required=True, help="Path to OpenAPI JSON/YAML")
+    p_compile.add_argument(
+        "--out",
+        default=None,
+        help="Artifact path (default: <spec name>.ctspec.json next to the spec)",
+    )
+    p_compile.add_argument("--no-color", action="store_true", help="Disable ANSI colors")
+    p_compile.add_argument("--json", action="store_true", help="Output JSON")
+    p_compile.set_defaults(func=_cmd_compile)
+
+    p_serve = sub.add_parser("serve", help="Validate traffic entries sent over a Unix socket (NDJSON)")
+    p_serve.add_argument("--spec", required=True, help="Path to OpenAPI JSON/YAML or compiled spec")
+    p_serve.add_argument("--socket", required=True, help="Unix socket path to listen on")
+    p_serve.add_argument(
+        "--ignore-unknown",
+        action="store_true",
+        help="Ignore traffic entries that don't match any operation",
+    )
+    p_serve.add_argument(
+        "--cache-size",
+        type=int,
+        default=4096,
+        help="Reuse validation results for up to this many distinct payloads (0 = off, default: 4096)",
+    )
+    p_serve.add_argument(
+        "--reload-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between checks for spec changes (0 = never reload, default: 1)",
+    )
+    p_serve.add_argument("--no-color", action="store_true", help="Disable ANSI colors")
+    p_serve.set_defaults(func=_cmd_serve)
+
+    p_proxy = sub.add_parser("proxy", help="Forward HTTP traffic to an upstream and validate it live")
+    p_proxy.add_argument("--spec", required=True, help="Path to OpenAPI JSON/YAML or compiled spec")
+    p_proxy.add_argument("--upstream", required=True, help="Upstream base URL, e.g. http://127.0.0.1:8080")
+    p_proxy.add_argument("--listen", default="127.0.0.1:9000", help="[HOST]:PORT to listen on (default: 127.0.0.1:9000)")
+    p_proxy.add_argument(
+        "--queue-size",
+        type=int,
+        default=1000,
+        help="Exchanges waiting for validation before new ones are dropped (default: 1000)",
+    )
+    p_proxy.add_argument(
+        "--ignore-unknown",
+        action="store_true",
+        help="Ignore traffic entries that don't match any operation",
+    )
+    p_proxy.add_argument(
+        "--max-examples",
+        type=int,
+        default=DEFAULT_MAX_EXAMPLES,
+        help=f"Example errors kept per group; the rest are only counted (default: {DEFAULT_MAX_EXAMPLES})",
+    )
+    p_proxy.add_argument(
+        "--cache-size",
+        type=int,
+        default=None,
+        help="Reuse validation results for up to this many distinct payloads (default: off)",
+    )
+    p_proxy.add_argument(
+        "--report",
+        nargs="?",
+        const="report.html",
+        help="Write an HTML report on exit to this path (default: report.html)",
+    )
+    p_proxy.add_argument("--no-color", action="store_true", help="Disable ANSI colors")
+    p_proxy.add_argument("--json", action="store_true", help="Output JSON on exit")
+    p_proxy.set_defaults(func=_cmd_proxy)
+
     return parser
 
 
@@ -0,0 +1,245 @@
+import json
+from typing import Dict, List, Optional, Tuple, Union
+
+from jsonschema import Draft7Validator
+
+from .openapi import PathRouter, build_router, resolve_schema
+
+HTTP_METHODS = frozenset({"get", "put", "post", "delete", "options", "head", "patch", "trace"})
+
+
+def _openapi_schema_to_jsonschema(schema: Dict) -> Dict:
+    if not isinstance(schema, dict):
+        return {}
+
+    schema = dict(schema)
+
+    if schema.get("nullable") is True:
+        schema.pop("nullable", None)
+        return {"anyOf": [schema, {"type": "null"}]}
+
+    if "properties" in schema and "type" not in schema:
+        schema["type"] = "object"
+
+    return schema
+
+
+def pick_json_schema_from_content(content: Dict) -> Optional[Dict]:
+    if not isinstance(content, dict):
+        return None
+
+    app_json = content.get("application/json") or {}
+    if isinstance(app_json, dict) and app_json.get("schema") is not None:
+        return app_json.get("schema")
+
+    for ctype, item in content.items():
+        if not isinstance(ctype, str) or not isinstance(item, dict):
+            continue
+        ctype_l = ctype.lower()
+        if "json" in ctype_l:
+            schema = item.get("schema")
+            if schema is not None:
+                return schema
+    return None
+
+
+def _pick_response_schema(operation: Dict, status: int) -> Optional[Dict]:
+    responses = operation.get("responses", {}) or {}
+    status_key = str(status)
+    response = responses.get(status_key)
+    if not response:
+        status_class = f"{str(status)[0]}XX" if status >= 100 else None
+        if status_class:
+            response = responses.get(status_class)
+    if not response:
+        response = responses.get("default")
+    if not response:
+        return None
+
+    content = response.get("content", {}) or {}
+    return pick_json_schema_from_content(content)
+
+
+def _merge_parameters(path_item: Optional[Dict], operation: Dict) -> List[Dict]:
+    params: Dict[Tuple[str, str], Dict] = {}
+    for source in (path_item, operation):
+        if not isinstance(source, dict):
+            continue
+        for item in (source.get("parameters") or []):
+            if not isinstance(item, dict):
+                continue
+            name = item.get("name")
+            loc = item.get("in")
+            if not name or not loc:
+                continue
+            params[(name, loc)] = item
+    return list(params.values())
+
+
+def _resolve_schema_cached(
+    spec: Dict, schema: Optional[Dict], cache: Dict[str, Dict]
+) -> Optional[Dict]:
+    if not isinstance(schema, dict):
+        return schema
+    ref = schema.get("$ref")
+    if isinstance(ref, str):
+        if ref in cache:
+            return cache[ref]
+        resolved = resolve_schema(spec, schema)
+        if isinstance(resolved, dict):
+            cache[ref] = resolved
+        return resolved
+    return schema
+
+
+def _validator_for_schema(
+    spec: Dict,
+    schema: Optional[Dict],
+    cache_resolved: Optional[Dict[str, Dict]] = None,
+    cache_validator: Optional[Dict[str, Draft7Validator]] = None,
+) -> Optional[Draft7Validator]:
+    if not isinstance(schema, dict):
+        return None
+    if cache_resolved is None:
+        cache_resolved = {}
+    if cache_validator is None:
+        cache_validator = {}
+    resolved = _resolve_schema_cached(spec, schema, cache_resolved)
+    jsonschema = _openapi_schema_to_jsonschema(resolved or {})
+    try:
+        key = json.dumps(jsonschema, sort_keys=True, separators=(",", ":"))
+    except Exception:
+        key = repr(jsonschema)
+    validator = cache_validator.get(key)
+    if validator is None:
+        root = jsonschema
+        components = spec.get("components")
+        if '"$ref"' in key and isinstance(components, dict) and "components" not in jsonschema:
+            # Nested "#/components/..." refs resolve against the validator's root
+            # schema; Draft 7 ignores the extra keyword.
+            root = dict(jsonschema, components=components)
+        validator = Draft7Validator(root)
+        cache_validator[key] = validator
+    return validator
+
+
+class ParamPlan:
+    __slots__ = ("name", "loc", "lookup", "required", "validator")
+
+    def __init__(
+        self, name: str, loc: str, required: bool, validator: Optional[Draft7Validator]
+    ) -> None:
+        self.name = name
+        self.loc = loc
+        self.lookup = str(name).lower() if loc == "header" else name
+        self.required = required
+        self.validator = validator
+
+
+class OperationPlan:
+    __slots__ = (
+        "op",
+        "path_item",
+        "params",
+        "has_request_body",
+        "body_required",
+        "body_schema",
+        "body_validator",
+        "_compiled",
+        "_responses",
+    )
+
+    def __init__(self, compiled: "CompiledSpec", op: Dict, path_item: Optional[Dict]) -> None:
+        self._compiled = compiled
+        self._responses: Dict[int, Tuple[bool, Optional[Draft7Validator]]] = {}
+        self.op = op
+        self.path_item = path_item
+
+        self.params: List[ParamPlan] = []
+        for param in _merge_parameters(path_item, op):
+            loc = param.get("in")
+            if loc not in {"path", "query", "header"}:
+                continue
+            schema = param.get("schema")
+            validator = compiled.validator_for(schema) if isinstance(schema, dict) else None
+            self.params.append(
+                ParamPlan(param["name"], loc, bool(param.get("required")), validator)
+            )
+
+        request_body = op.get("requestBody")
+        self.has_request_body = isinstance(request_body, dict)
+        self.body_required = False
+        self.body_schema: Optional[Dict] = None
+        self.body_validator: Optional[Draft7Validator] = None
+        if isinstance(request_body, dict):
+            self.body_required = bool(request_body.get("required"))
+            self.body_schema = pick_json_schema_from_content(request_body.get("content", {}) or {})
+            self.body_validator = compiled.validator_for(self.body_schema)
+
+    def response_validator(self, status: int) -> Tuple[bool, Optional[Draft7Validator]]:
+        entry = self._responses.get(status)
+        if entry is None:
+            schema = _pick_response_schema(self.op, status)
+            entry = (bool(schema), self._compiled.validator_for(schema) if schema else None)
+            self._responses[status] = entry
+        return entry
+
+
+class CompiledSpec:
+    def __init__(
+        self,
+        spec: Dict,
+        templates: Optional[List[str]] = None,
+        resolved_schemas: Optional[Dict[str, Dict]] = None,
+    ) -> None:
+        self.spec = spec
+        self.router: PathRouter = build_router(spec, templates=templates)
+        self._schema_cache: Dict[str, Dict] = dict(resolved_schemas or {})
+        self._validator_cache: Dict[str, Draft7Validator] = {}
+        self._plans: Dict[int, OperationPlan] = {}
+
+    def validator_for(self, schema: Optional[Dict]) -> Optional[Draft7Validator]:
+        return _validator_for_schema(
+            self.spec,
+            schema,
+            cache_resolved=self._schema_cache,
+            cache_validator=self._validator_cache,
+        )
+
+    def plan_for(self, op: Dict, path_item: Optional[Dict]) -> OperationPlan:
+        plan = self._plans.get(id(op))
+        if plan is None:
+            plan = OperationPlan(self, op, path_item)
+            self._plans[id(op)] = plan
+        return plan
+
+    def warm(self) -> int:
+        # Builds every operation plan and declared response validator up front,
+        # so a long-running process doesn't pay for them on first use.
+        plans = 0
+        for path_item in (self.spec.get("paths") or {}).values():
+            if not isinstance(path_item, dict):
+                continue
+            for method, op in path_item.items():
+                if method.lower() not in HTTP_METHODS or not isinstance(op, dict):
+                    continue
+                plan = self.plan_for(op, path_item)
+                plans += 1
+                for status in op.get("responses") or {}:
+                    if str(status).isdigit():
+                        plan.response_validator(int(status))
+        return plans
+
+    def resolve(
+        self, path: str, method: str
+    ) -> Tuple[Optional[OperationPlan], Optional[str], Dict[str, str]]:
+        op, template, path_item, path_params = self.router.resolve(path, method)
+        if not op:
+            return None, None, {}
+        return self.plan_for(op, path_item), template, path_params
+
+
+def compile_spec(spec: Union[Dict, CompiledSpec]) -> CompiledSpec:
+    if isinstance(spec, CompiledSpec):
+        return spec
+    return CompiledSpec(spec)
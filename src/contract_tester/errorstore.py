@@ -0,0 +1,125 @@
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_MAX_EXAMPLES = 20
+
+GroupKey = Tuple[object, ...]
+
+
+def group_key_str(group: GroupKey) -> str:
+    return "|".join(str(part) for part in group)
+
+
+Example = Tuple[int, int, Dict[str, str]]
+
+
+class _Group:
+    __slots__ = ("count", "examples", "first")
+
+    def __init__(self, first: Tuple[int, int]) -> None:
+        self.count = 0
+        self.examples: List[Example] = []
+        # (entry, seq) of the group's first finding; fixes group order on merge.
+        self.first = first
+
+
+class ErrorStore:
+    def __init__(self, max_examples: Optional[int] = DEFAULT_MAX_EXAMPLES) -> None:
+        if max_examples is not None and max_examples < 0:
+            raise ValueError("max_examples must be zero or a positive integer")
+        self.max_examples = max_examples
+        self.total = 0
+        self.groups: Dict[GroupKey, _Group] = {}
+        self._seq = 0
+
+    def wants_example(self, group: GroupKey) -> bool:
+        if self.max_examples is None:
+            return True
+        existing = self.groups.get(group)
+        return existing is None or len(existing.examples) < self.max_examples
+
+    def add(self, group: GroupKey, entry: int, detail: Optional[Dict[str, str]] = None) -> None:
+        self.total += 1
+        seq = self._seq
+        self._seq += 1
+        existing = self.groups.get(group)
+        if existing is None:
+            existing = self.groups[group] = _Group((entry, seq))
+        existing.count += 1
+        if detail is not None and (
+            self.max_examples is None or len(existing.examples) < self.max_examples
+        ):
+            existing.examples.append((entry, seq, detail))
+
+    def top_groups(self, k: int) -> List[Tuple[GroupKey, int]]:
+        best = heapq.nlargest(k, self.groups.items(), key=lambda item: item[1].count)
+        return [(group, stats.count) for group, stats in best]
+
+    def examples(self) -> List[Dict[str, str]]:
+        merged = heapq.merge(*(g.examples for g in self.groups.values()), key=lambda x: x[:2])
+        return [detail for _, _, detail in merged]
+
+    def dump_groups(self) -> List[Dict]:
+        return [
+            {
+                "group": list(group),
+                "count": stats.count,
+                "first": list(stats.first),
+                "examples": [[entry, seq, detail] for entry, seq, detail in stats.examples],
+            }
+            for group, stats in self.groups.items()
+        ]
+
+    def result_fields(self) -> Dict:
+        grouped = {
+            group_key_str(group): [detail["message"] for _, _, detail in stats.examples]
+            for group, stats in self.groups.items()
+        }
+        details = self.examples()
+        return {
+            "error_count": self.total,
+            "errors": [detail["message"] for detail in details],
+            "errors_grouped": grouped,
+            "error_group_counts": {
+                group_key_str(group): stats.count for group, stats in self.groups.items()
+            },
+            "error_details": details,
+        }
+
+
+def merge_groups(dumps: Iterable[List[Dict]], max_examples: Optional[int] = DEFAULT_MAX_EXAMPLES) -> ErrorStore:
+    # Each dump must cover disjoint entries with global entry indices; then the
+    # first examples overall are among each dump's first examples, and ordering
+    # by (entry, seq) reproduces the store a single pass would have built.
+    store = ErrorStore(max_examples=max_examples)
+    for groups in dumps:
+        for item in groups:
+            group = tuple(item["group"])
+            first = (item["first"][0], item["first"][1])
+            existing = store.groups.get(group)
+            if existing is None:
+                existing = store.groups[group] = _Group(first)
+            else:
+                existing.first = min(existing.first, first)
+            existing.count += item["count"]
+            existing.examples.extend((entry, seq, detail) for entry, seq, detail in item["examples"])
+            store.total += item["count"]
+    for stats in store.groups.values():
+        stats.examples.sort(key=lambda x: x[:2])
+        if max_examples is not None:
+            del stats.examples[max_examples:]
+    store.groups = dict(sorted(store.groups.items(), key=lambda item: item[1].first))
+    return store
+
+
+def group_counts(result: Dict) -> Dict[str, int]:
+    counts = result.get("error_group_counts")
+    if isinstance(counts, dict):
+        return counts
+    grouped = result.get("errors_grouped", {}) or {}
+    return {key: len(items) for key, items in grouped.items()}
+
+
+def top_error_groups(result: Dict, k: int) -> List[Tuple[str, int]]:
+    counts: Iterable[Tuple[str, int]] = group_counts(result).items()
+    return heapq.nlargest(k, counts, key=lambda item: item[1])
@@ -0,0 +1,200 @@
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import IO, Callable, Deque, Dict, Iterable, Optional, Union
+
+from .compiled import CompiledSpec, compile_spec
+from .errorstore import DEFAULT_MAX_EXAMPLES, group_key_str
+from .memo import ValidationCache
+from .traffic import READ_CHUNK_SIZE, IncrementalReader, LineErrorHandler, TrafficEntry, incremental_format
+from .validate import ValidationSummary, iter_validate
+
+DEFAULT_WINDOW_MINUTES = 5.0
+DEFAULT_SUMMARY_INTERVAL = 60.0
+DEFAULT_POLL_INTERVAL = 0.25
+# The rolling window is kept as this many fixed-width time buckets.
+WINDOW_BUCKETS = 60
+
+
+class _Bucket:
+    __slots__ = ("index", "checks", "errors", "groups")
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.checks = 0
+        self.errors = 0
+        self.groups: Dict[str, int] = {}
+
+
+class RollingCounts:
+    # Checks, errors and per-group counts over the last ``window`` seconds.
+    # Memory is bounded by WINDOW_BUCKETS times the number of error groups.
+    def __init__(self, window: float) -> None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self.width = window / WINDOW_BUCKETS
+        self.buckets: Deque[_Bucket] = deque()
+
+    def _bucket(self, now: float) -> _Bucket:
+        index = int(now // self.width)
+        if not self.buckets or self.buckets[-1].index != index:
+            self.buckets.append(_Bucket(index))
+            self._expire(index)
+        return self.buckets[-1]
+
+    def _expire(self, index: int) -> None:
+        while self.buckets and self.buckets[0].index <= index - WINDOW_BUCKETS:
+            self.buckets.popleft()
+
+    def add_checks(self, count: int, now: float) -> None:
+        if count:
+            self._bucket(now).checks += count
+
+    def add_error(self, group: str, now: float) -> None:
+        bucket = self._bucket(now)
+        bucket.errors += 1
+        bucket.groups[group] = bucket.groups.get(group, 0) + 1
+
+    def snapshot(self, now: float) -> Dict:
+        self._expire(int(now // self.width))
+        groups: Dict[str, int] = {}
+        for bucket in self.buckets:
+            for group, count in bucket.groups.items():
+                groups[group] = groups.get(group, 0) + count
+        return {
+            "seconds": self.window,
+            "checks": sum(bucket.checks for bucket in self.buckets),
+            "error_count": sum(bucket.errors for bucket in self.buckets),
+            "error_group_counts": dict(sorted(groups.items(), key=lambda item: -item[1])),
+        }
+
+
+class TrafficFollower:
+    # Tails a growing JSON Lines or curl log like ``tail -F``: validates
+    # entries as they are appended, reopens the path after rotation and starts
+    # over after truncation. Entries are not retained.
+    def __init__(
+        self,
+        spec: Union[Dict, CompiledSpec],
+        path: Union[str, Path],
+        ignore_unknown: bool = False,
+        cache: Optional[ValidationCache] = None,
+        max_examples: Optional[int] = DEFAULT_MAX_EXAMPLES,
+        window: float = DEFAULT_WINDOW_MINUTES * 60,
+        summary_interval: float = DEFAULT_SUMMARY_INTERVAL,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_entries: Optional[int] = None,
+        on_error: Optional[LineErrorHandler] = None,
+        on_summary: Optional[Callable[[Dict], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if summary_interval <= 0:
+            raise ValueError("summary interval must be positive")
+        self.spec = compile_spec(spec)
+        self.path = Path(path)
+        self.kind = incremental_format(self.path)
+        self.ignore_unknown = ignore_unknown
+        self.cache = cache
+        self.summary = ValidationSummary(max_examples=max_examples)
+        self.rolling = RollingCounts(window)
+        self.summary_interval = summary_interval
+        self.poll_interval = poll_interval
+        self.max_entries = max_entries
+        self.on_error = on_error
+        self.on_summary = on_summary
+        self.clock = clock
+        self.reopened = 0
+        self.truncated = 0
+        self._reported = (0, 0)
+        self._started = clock()
+
+    def _validate(self, entries: Iterable[TrafficEntry]) -> None:
+        summary = self.summary
+        base = summary.total_checks
+        findings = iter_validate(self.spec, summary.count(entries), ignore_unknown=self.ignore_unknown, cache=self.cache)
+        for finding in findings:
+            finding.entry += base
+            summary.add(finding)
+            self.rolling.add_error(group_key_str(finding.group), self.clock())
+        self.rolling.add_checks(summary.total_checks - base, self.clock())
+
+    def _limited(self, entries: Iterable[TrafficEntry]) -> Iterable[TrafficEntry]:
+        for entry in entries:
+            if self.limit_reached():
+                return
+            yield entry
+
+    def _open(self) -> IO[bytes]:
+        return open(self.path, "rb")
+
+    def _rotated(self, fp: IO[bytes]) -> bool:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return False  # mid-rotation; keep draining the old file
+        current = os.fstat(fp.fileno())
+        return (st.st_dev, st.st_ino) != (current.st_dev, current.st_ino)
+
+    def limit_reached(self) -> bool:
+        return self.max_entries is not None and self.summary.total_checks >= self.max_entries
+
+    def run(self, stop: threading.Event) -> Dict:
+        fp = self._open()
+        reader = IncrementalReader(self.kind, on_error=self.on_error)
+        next_summary = self.clock() + self.summary_interval
+        try:
+            while not stop.is_set() and not self.limit_reached():
+                data = fp.read(READ_CHUNK_SIZE)
+                if data:
+                    self._validate(self._limited(reader.feed(data)))
+                else:
+                    self._validate(self._limited(reader.flush(final=False)))
+                    if self._rotated(fp):
+                        # Whatever the writer left in the old file is complete now.
+                        self._validate(self._limited(reader.flush(final=True)))
+                        fp.close()
+                        fp = self._open()
+                        reader = IncrementalReader(self.kind, on_error=self.on_error)
+                        self.reopened += 1
+                        continue
+                    if os.fstat(fp.fileno()).st_size < fp.tell():
+                        fp.seek(0)
+                        reader = IncrementalReader(self.kind, on_error=self.on_error)
+                        self.truncated += 1
+                        continue
+                    stop.wait(self.poll_interval)
+                if self.clock() >= next_summary:
+                    if self.on_summary is not None:
+                        self.on_summary(self.rolling_summary())
+                    next_summary = self.clock() + self.summary_interval
+        finally:
+            fp.close()
+        return self.result()
+
+    def rolling_summary(self) -> Dict:
+        checks, errors = self.summary.total_checks, self.summary.store.total
+        since = {"checks": checks - self._reported[0], "error_count": errors - self._reported[1]}
+        self._reported = (checks, errors)
+        return {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "total_checks": checks,
+            "error_count": errors,
+            "since_last": since,
+            "window": self.rolling.snapshot(self.clock()),
+        }
+
+    def result(self) -> Dict:
+        result = self.summary.result()
+        if self.cache is not None:
+            result["cache"] = self.cache.stats()
+        result["follow"] = {
+            "path": str(self.path),
+            "elapsed_s": round(self.clock() - self._started, 3),
+            "reopened": self.reopened,
+            "truncated": self.truncated,
+            "window": self.rolling.snapshot(self.clock()),
+        }
+        return result
@@ -0,0 +1,96 @@
+import json
+import re
+from typing import IO, Any, Iterator, Sequence
+
+_WS = re.compile(r"[ \t\r\n]*")
+_DECODER = json.JSONDecoder()
+# Parses that fail or stop this close to the end of the buffer may be cut off mid-token
+# (``tru``, a half escape, a number), so they are retried with more input.
+_TAIL_SLACK = 8
+
+
+class _Reader:
+    def __init__(self, fp: IO[str], chunk_size: int) -> None:
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, min_size: int = 0) -> bool:
+        if self.eof:
+            return False
+        chunk = self.fp.read(max(self.chunk_size, min_size))
+        if not chunk:
+            self.eof = True
+            return False
+        # Compact only once there is more input: callers keep using positions
+        # into the current buffer when a fill fails at EOF.
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in JSON stream, found {found!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as exc:
+                truncated = exc.msg.startswith("Unterminated string") or (
+                    exc.pos >= len(self.buf) - _TAIL_SLACK
+                )
+                if truncated and self._fill(len(self.buf) - self.pos):
+                    continue
+                raise ValueError(f"Invalid JSON in stream: {exc.msg}") from None
+            if end > len(self.buf) - _TAIL_SLACK and self._fill(len(self.buf) - self.pos):
+                # A number cut at the buffer edge parses short (``1.`` as ``1``).
+                continue
+            self.pos = end
+            return value
+
+
+def iter_array_items(
+    fp: IO[str], path: Sequence[str], chunk_size: int = 1 << 20
+) -> Iterator[Any]:
+    reader = _Reader(fp, chunk_size)
+    reader.expect("{")
+    for depth, key in enumerate(path):
+        while True:
+            char = reader.peek()
+            if char == ",":
+                reader.pos += 1
+                continue
+            if char != '"':
+                return
+            name = reader.value()
+            reader.expect(":")
+            if name == key:
+                break
+            reader.value()
+        opener = "[" if depth == len(path) - 1 else "{"
+        if reader.peek() != opener:
+            return
+        reader.pos += 1
+
+    while True:
+        char = reader.peek()
+        if char == ",":
+            reader.pos += 1
+            continue
+        if char in {"]", ""}:
+            return
+        yield reader.value()
@@ -1,19 +1,18 @@
 import base64
 import hashlib
+import hmac
 import json
 import os
 from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import NotRequired, Optional, Set, Tuple, TypedDict
-
-from cryptography.exceptions import InvalidSignature
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import ec
+from typing import Dict, List, NotRequired, Optional, Set, Tuple, TypedDict
 
 
 DEMO_MAX_TRAFFIC = 25
 DEMO_MAX_PATHS = 30
 LICENSE_PREFIX = "CT1"
+LICENSE_CACHE_ENV = "CONTRACT_TESTER_LICENSE_CACHE"
+LICENSE_CACHE_MAX_ENTRIES = 16
 
 # Replace this key for production with your own P-256 public key.
 DEFAULT_PUBLIC_KEY_PEM = """-----BEGIN PUBLIC KEY-----
@@ -103,6 +102,8 @@ def _get_public_key_pem() -> str:
 
 
 def _load_public_key():
+    from cryptography.hazmat.primitives import serialization
+
     raw = _get_public_key_pem().encode("utf-8")
     return serialization.load_pem_public_key(raw)
 
@@ -151,6 +152,11 @@ def verify_license_key(key: Optional[str]) -> LicenseStatus:
     except Exception:
         return _status(False, "malformed", "License key encoding is invalid.")
 
+    # cryptography is slow to import; only pay for it when there is a key to check.
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec
+
     try:
         public_key = _load_public_key()
         if not isinstance(public_key, ec.EllipticCurvePublicKey):
@@ -214,9 +220,105 @@ def verify_license_key(key: Optional[str]) -> LicenseStatus:
     )
 
 
+def _file_identity(path: Path) -> Optional[List[object]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [str(path), st.st_mtime_ns, st.st_size]
+
+
+def _verification_fingerprint(token: str) -> str:
+    # Everything verify_license_key() depends on besides the clock's date.
+    parts = [
+        _token_fingerprint(token),
+        hashlib.sha256(_get_public_key_pem().encode("utf-8")).hexdigest(),
+        [_file_identity(p) for p in _revocation_locations()],
+        datetime.now(timezone.utc).date().isoformat(),
+    ]
+    return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+
+def _license_cache_path() -> Optional[Path]:
+    value = os.environ.get(LICENSE_CACHE_ENV, "").strip()
+    if not value or value == "0":
+        return None
+    if value == "1":
+        return Path(os.path.expanduser("~")) / ".contract_tester" / "license_cache.json"
+    return Path(value)
+
+
+def _cache_mac(token: str, fingerprint: str, status: LicenseStatus) -> str:
+    # Binds a cache entry to the key it was verified for; the key itself is
+    # never written, so an entry can't be made without it.
+    message = json.dumps([fingerprint, status], sort_keys=True).encode("utf-8")
+    return hmac.new(token.encode("utf-8"), message, hashlib.sha256).hexdigest()
+
+
+def _read_license_cache(path: Path) -> Dict[str, Dict]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    entries = data.get("entries") if isinstance(data, dict) else None
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write_license_cache(path: Path, token: str, fingerprint: str, status: LicenseStatus) -> None:
+    entries = _read_license_cache(path)
+    entries.pop(fingerprint, None)
+    entries[fingerprint] = {"status": status, "mac": _cache_mac(token, fingerprint, status)}
+    while len(entries) > LICENSE_CACHE_MAX_ENTRIES:
+        entries.pop(next(iter(entries)))
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps({"entries": entries}), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+_verified: Dict[str, LicenseStatus] = {}
+
+
+def _verify_cached(key: str) -> LicenseStatus:
+    fingerprint = _verification_fingerprint(key)
+    status = _verified.get(fingerprint)
+    if status is not None:
+        return status
+    cache_path = _license_cache_path()
+    if cache_path is not None:
+        cached = _read_license_cache(cache_path).get(fingerprint)
+        if isinstance(cached, dict):
+            status, mac = cached.get("status"), cached.get("mac")
+            if (
+                isinstance(status, dict)
+                and isinstance(status.get("valid"), bool)
+                and isinstance(mac, str)
+                and hmac.compare_digest(mac, _cache_mac(key, fingerprint, status))
+            ):
+                _verified[fingerprint] = status
+                return status
+    status = verify_license_key(key)
+    status["source"] = None
+    status["key"] = None
+    _verified[fingerprint] = status
+    if cache_path is not None:
+        _write_license_cache(cache_path, key, fingerprint, status)
+    return status
+
+
+def clear_license_cache() -> None:
+    _verified.clear()
+
+
 def get_license_status() -> LicenseStatus:
     key, source = load_license_key()
-    status = verify_license_key(key)
+    status = _verify_cached(key).copy() if key else verify_license_key(key)
     status["source"] = source
     status["key"] = key if status.get("valid") is True else None
     return status
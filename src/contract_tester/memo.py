@@ -0,0 +1,61 @@
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+DEFAULT_CACHE_SIZE = 10000
+
+
+def body_digest(body: Any) -> bytes:
+    canonical = json.dumps(
+        body, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=repr
+    )
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+
+class ValidationCache:
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        if max_size <= 0:
+            raise ValueError("cache size must be a positive integer")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+
+    def key(self, scope: Hashable, body: Any) -> Tuple[Hashable, ...]:
+        return (scope, body_digest(body))
+
+    def get(self, key: Tuple[Hashable, ...]) -> Tuple[bool, Any]:
+        if key not in self._data:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        self._data.move_to_end(key)
+        return True, self._data[key]
+
+    def put(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "max_size": self.max_size,
+            "size": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def merge_stats(a: Optional[Dict[str, int]], b: Optional[Dict[str, int]]) -> Optional[Dict[str, int]]:
+    if a is None:
+        return dict(b) if b is not None else None
+    if b is None:
+        return dict(a)
+    return {
+        "max_size": max(a["max_size"], b["max_size"]),
+        "size": max(a["size"], b["size"]),
+        "hits": a["hits"] + b["hits"],
+        "misses": a["misses"] + b["misses"],
+    }
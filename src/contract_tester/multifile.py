@@ -0,0 +1,139 @@
+import glob
+import queue
+import threading
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .errorstore import GroupKey, group_key_str
+from .pipeline import DEFAULT_PIPELINE_BATCH_SIZE, Message, run_producer
+from .traffic import JSONL_SUFFIXES, STDIN_PATH, LineErrorHandler, TrafficEntry, format_suffix
+
+TRAFFIC_SUFFIXES = frozenset({".har", ".json", ".log"} | JSONL_SUFFIXES)
+DEFAULT_READ_AHEAD = 4
+# Batches a reader may parse ahead of validation, per file.
+READ_AHEAD_BATCHES = 4
+
+
+def expand_traffic_paths(patterns: Sequence[str]) -> List[str]:
+    paths: List[str] = []
+    seen = set()
+    for pattern in patterns:
+        if pattern == STDIN_PATH:
+            if len(patterns) > 1:
+                raise ValueError("'-' (stdin) can't be combined with other traffic paths")
+            return [pattern]
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(
+                str(f)
+                for f in path.rglob("*")
+                if f.is_file() and format_suffix(f) in TRAFFIC_SUFFIXES
+            )
+        elif glob.has_magic(pattern):
+            matches = sorted(f for f in glob.glob(pattern, recursive=True) if Path(f).is_file())
+        else:
+            matches = [pattern]
+        if not matches:
+            raise ValueError(f"No traffic files match {pattern}")
+        for match in matches:
+            if match not in seen:
+                seen.add(match)
+                paths.append(match)
+    return paths
+
+
+class TrafficFiles:
+    # Concatenates several traffic files into one entry stream (entry indices
+    # run across files) and tallies findings back to the file they came from.
+    def __init__(
+        self,
+        paths: Sequence[str],
+        on_error: Optional[LineErrorHandler] = None,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+    ) -> None:
+        if read_ahead <= 0:
+            raise ValueError("read_ahead must be a positive integer")
+        self.paths = list(paths)
+        self.on_error = on_error
+        self.read_ahead = read_ahead
+        self.starts: List[int] = []
+        self.counts: List[int] = []
+        self.skipped = [0] * len(self.paths)
+        self.errors = [0] * len(self.paths)
+        self.groups: List[Dict[GroupKey, int]] = [{} for _ in self.paths]
+
+    def __iter__(self) -> Iterator[TrafficEntry]:
+        # Each file is streamed by a reader thread into its own bounded queue,
+        # so at most READ_AHEAD_BATCHES batches per file are held ahead of
+        # validation. Line errors travel with their batch and are replayed on
+        # the consuming thread, in file order.
+        pool = ThreadPoolExecutor(max_workers=self.read_ahead, thread_name_prefix="traffic-reader")
+        stop = threading.Event()
+        pending: Deque[Tuple[str, "queue.Queue[Message]"]] = deque()
+        queued = iter(self.paths)
+        position = 0
+
+        def _submit() -> None:
+            path = next(queued, None)
+            if path is not None:
+                q: "queue.Queue[Message]" = queue.Queue(maxsize=READ_AHEAD_BATCHES)
+                pool.submit(run_producer, path, None, DEFAULT_PIPELINE_BATCH_SIZE, q, stop)
+                pending.append((path, q))
+
+        try:
+            for _ in range(self.read_ahead):
+                _submit()
+            while pending:
+                path, q = pending.popleft()
+                index = len(self.starts)
+                self.starts.append(position)
+                self.counts.append(0)
+                while True:
+                    kind, payload = q.get()
+                    if kind == "done":
+                        break
+                    if kind == "error":
+                        if isinstance(payload, ValueError):
+                            raise ValueError(f"{path}: {payload}") from None
+                        raise payload
+                    entries, skipped = payload
+                    self.skipped[index] += len(skipped)
+                    if self.on_error is not None:
+                        for lineno, reason in skipped:
+                            self.on_error(lineno, f"{path}: {reason}")
+                    self.counts[index] += len(entries)
+                    position += len(entries)
+                    yield from entries
+                    del entries, payload
+                _submit()
+        finally:
+            stop.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def add(self, entry: int, group: GroupKey) -> None:
+        index = bisect_right(self.starts, entry) - 1
+        self.errors[index] += 1
+        groups = self.groups[index]
+        groups[group] = groups.get(group, 0) + 1
+
+    def result(self, total_checks: int) -> List[Dict]:
+        rows = []
+        for index, path in enumerate(self.paths):
+            checked = 0
+            if index < len(self.starts):
+                checked = max(0, min(self.counts[index], total_checks - self.starts[index]))
+            rows.append(
+                {
+                    "path": path,
+                    "total_checks": checked,
+                    "error_count": self.errors[index],
+                    "error_group_counts": {
+                        group_key_str(group): count for group, count in self.groups[index].items()
+                    },
+                    "skipped_lines": self.skipped[index],
+                }
+            )
+        return rows
@@ -1,18 +1,26 @@
 import json
 from pathlib import Path
-from typing import Dict, Iterator, Tuple, Union, Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
-import yaml
+ARTIFACT_KEY = "contract_tester_artifact"
 
 
-def load_spec(path: Union[str, Path]) -> Dict:
+def load_spec(path: Union[str, Path], data: Optional[Dict] = None) -> Dict:
+    # ``data`` is the already-parsed file, for callers that have read it.
     p = Path(path)
-    raw = p.read_text(encoding="utf-8")
-    if p.suffix.lower() in {".yaml", ".yml"}:
-        data = yaml.safe_load(raw)
-    else:
-        data = json.loads(raw)
+    if data is None:
+        raw = p.read_text(encoding="utf-8")
+        if p.suffix.lower() in {".yaml", ".yml"}:
+            import yaml
 
+            data = yaml.safe_load(raw)
+        else:
+            data = json.loads(raw)
+
+    if isinstance(data, dict) and ARTIFACT_KEY in data:
+        from .artifact import fresh_artifact
+
+        return fresh_artifact(p, data)["spec"]
     if not isinstance(data, dict):
         raise ValueError("OpenAPI spec must be a JSON/YAML object")
     if "paths" not in data:
@@ -25,32 +33,17 @@ def get_paths(spec: Dict) -> Dict:
 
 
 def get_operation(spec: Dict, path: str, method: str) -> Optional[Dict]:
-    paths = get_paths(spec)
-    norm_path = _normalize_path(path)
-    ops = paths.get(norm_path, {}) or {}
-    direct = ops.get(method.lower())
-    if direct:
-        return direct
-
-    best_op = None
-    best_score = -1
-    req_parts = _split_path(norm_path)
-    for template, methods in paths.items():
-        if not isinstance(methods, dict):
-            continue
-        score = _match_template_score(_normalize_path(template), req_parts)
-        if score is None:
-            continue
-        op = methods.get(method.lower())
-        if op and score > best_score:
-            best_score = score
-            best_op = op
-    return best_op
+    op, _, _, _ = resolve_operation(spec, path, method)
+    return op
 
 
 def resolve_operation(
-    spec: Dict, path: str, method: str
+    spec: Dict, path: str, method: str, router: Optional["PathRouter"] = None
 ) -> Tuple[Optional[Dict], Optional[str], Optional[Dict], Dict]:
+    # Repeated lookups should pass a router (CompiledSpec keeps one); a
+    # one-off lookup scans the templates, which is cheaper than building it.
+    if router is not None:
+        return router.resolve(path, method)
     paths = get_paths(spec)
     norm_path = _normalize_path(path)
     methods = paths.get(norm_path)
@@ -81,6 +74,103 @@ def resolve_operation(
     return best_op, best_template, best_methods, best_params
 
 
+class _RouteNode:
+    __slots__ = ("literals", "param", "routes")
+
+    def __init__(self) -> None:
+        self.literals: Dict[str, "_RouteNode"] = {}
+        self.param: Optional["_RouteNode"] = None
+        self.routes: List[Tuple[int, str, Dict]] = []
+
+
+class _Match:
+    __slots__ = ("score", "order", "op", "template", "methods")
+
+    def __init__(self) -> None:
+        self.score = -1
+        self.order = 0
+        self.op: Optional[Dict] = None
+        self.template: Optional[str] = None
+        self.methods: Optional[Dict] = None
+
+
+class PathRouter:
+    def __init__(self, paths: Dict, templates: Optional[List[str]] = None):
+        self.paths = paths
+        self._root = _RouteNode()
+        if templates is not None and len(templates) != len(paths):
+            templates = None
+        for order, (template, methods) in enumerate(paths.items()):
+            if not isinstance(methods, dict):
+                continue
+            norm = templates[order] if templates is not None else _normalize_path(template)
+            node = self._root
+            for part in _split_path(norm):
+                if _is_param_segment(part):
+                    if node.param is None:
+                        node.param = _RouteNode()
+                    node = node.param
+                else:
+                    child = node.literals.get(part)
+                    if child is None:
+                        child = node.literals[part] = _RouteNode()
+                    node = child
+            node.routes.append((order, norm, methods))
+
+    def resolve(
+        self, path: str, method: str
+    ) -> Tuple[Optional[Dict], Optional[str], Optional[Dict], Dict]:
+        norm_path = _normalize_path(path)
+        method_l = method.lower()
+        methods = self.paths.get(norm_path)
+        if isinstance(methods, dict):
+            direct = methods.get(method_l)
+            if direct:
+                return direct, norm_path, methods, {}
+
+        req_parts = _split_path(norm_path)
+        best = _Match()
+        self._search(self._root, req_parts, 0, 0, method_l, best)
+        if best.op is None or best.template is None:
+            return None, None, None, {}
+        return best.op, best.template, best.methods, _extract_path_params(best.template, req_parts)
+
+    def _search(
+        self, node: _RouteNode, parts: list, idx: int, score: int, method: str, best: _Match
+    ) -> None:
+        # Same ranking as the old linear scan: most literal segments wins, ties go to
+        # the template declared first. Literals are tried first so that the
+        # parameter branch can usually be pruned without being walked.
+        if idx == len(parts):
+            for order, template, methods in node.routes:
+                op = methods.get(method)
+                if not op:
+                    continue
+                if score > best.score or (score == best.score and order < best.order):
+                    best.score = score
+                    best.order = order
+                    best.op = op
+                    best.template = template
+                    best.methods = methods
+                break
+            return
+        if score + (len(parts) - idx) < best.score:
+            return
+        child = node.literals.get(parts[idx])
+        if child is not None:
+            self._search(child, parts, idx + 1, score + 1, method, best)
+        if node.param is not None:
+            self._search(node.param, parts, idx + 1, score, method, best)
+
+
+def build_router(spec: Dict, templates: Optional[List[str]] = None) -> PathRouter:
+    return PathRouter(get_paths(spec), templates=templates)
+
+
+def route_templates(spec: Dict) -> List[str]:
+    return [_normalize_path(template) for template in get_paths(spec)]
+
+
 def iter_operations(spec: Dict) -> Iterator[Tuple[str, str, Dict]]:
     for path, methods in get_paths(spec).items():
         if not isinstance(methods, dict):
@@ -148,13 +238,17 @@ def _normalize_path(path: str) -> str:
     return path
 
 
+def _is_param_segment(part: str) -> bool:
+    return part.startswith("{") and part.endswith("}")
+
+
 def _match_template_score(template: str, req_parts: list) -> Optional[int]:
     tmpl_parts = _split_path(template)
     if len(tmpl_parts) != len(req_parts):
         return None
     score = 0
     for t, r in zip(tmpl_parts, req_parts):
-        if t.startswith("{") and t.endswith("}"):
+        if _is_param_segment(t):
             continue
         if t == r:
             score += 1
@@ -169,7 +263,7 @@ def _extract_path_params(template: str, req_parts: list) -> Dict[str, str]:
     if len(tmpl_parts) != len(req_parts):
         return params
     for t, r in zip(tmpl_parts, req_parts):
-        if t.startswith("{") and t.endswith("}"):
+        if _is_param_segment(t):
             name = t[1:-1].strip()
             if name:
                 params[name] = r
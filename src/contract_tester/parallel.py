@@ -0,0 +1,139 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .compiled import CompiledSpec
+from .errorstore import DEFAULT_MAX_EXAMPLES, GroupKey
+from .memo import ValidationCache, merge_stats
+from .validate import Finding, ValidationSummary, iter_validate, validate_traffic_against_spec
+
+if TYPE_CHECKING:
+    from .multifile import TrafficFiles
+
+DEFAULT_BATCH_SIZE = 500
+
+_worker_spec: Optional[CompiledSpec] = None
+_worker_ignore_unknown = False
+_worker_cache: Optional[ValidationCache] = None
+
+BatchResult = Tuple[List[Finding], Optional[Dict[str, int]]]
+
+
+def _init_worker(spec: Dict, ignore_unknown: bool, cache_size: Optional[int]) -> None:
+    global _worker_spec, _worker_ignore_unknown, _worker_cache
+    _worker_spec = CompiledSpec(spec)
+    _worker_ignore_unknown = ignore_unknown
+    _worker_cache = ValidationCache(cache_size) if cache_size else None
+
+
+def _validate_batch(
+    start: int, entries: List[Dict], max_errors: Optional[int], max_examples: Optional[int]
+) -> BatchResult:
+    assert _worker_spec is not None, "worker not initialized"
+    cache = _worker_cache
+    hits, misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
+    findings: List[Finding] = []
+    per_group: Dict[GroupKey, int] = {}
+    for finding in iter_validate(
+        _worker_spec, entries, ignore_unknown=_worker_ignore_unknown, cache=cache
+    ):
+        finding.entry += start
+        seen = per_group.get(finding.group, 0) + 1
+        per_group[finding.group] = seen
+        if max_examples is not None and seen > max_examples:
+            # Only a batch's first examples per group can be among the first overall,
+            # so the rest travel back count-only instead of being rendered here.
+            finding.strip()
+        findings.append(finding)
+        # Nothing past the global limit can be reported, so neither can it be from one batch.
+        if max_errors and len(findings) >= max_errors:
+            break
+    stats = None
+    if cache is not None:
+        stats = cache.stats()
+        stats["hits"] -= hits
+        stats["misses"] -= misses
+    return findings, stats
+
+
+def _batches(entries: Iterable[Dict], size: int) -> Iterator[Tuple[int, List[Dict]]]:
+    it = iter(entries)
+    start = 0
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield start, batch
+        start += len(batch)
+
+
+def resolve_workers(workers: int) -> int:
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def validate_traffic_parallel(
+    spec: Union[Dict, CompiledSpec],
+    traffic: Iterable[Dict],
+    workers: int,
+    max_errors: Optional[int] = None,
+    ignore_unknown: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    cache_size: Optional[int] = None,
+    max_examples: Optional[int] = DEFAULT_MAX_EXAMPLES,
+    files: Optional["TrafficFiles"] = None,
+) -> Dict:
+    workers = resolve_workers(workers)
+    if workers == 1:
+        return validate_traffic_against_spec(
+            spec,
+            traffic,
+            max_errors=max_errors,
+            ignore_unknown=ignore_unknown,
+            cache=ValidationCache(cache_size) if cache_size else None,
+            max_examples=max_examples,
+            files=files,
+        )
+
+    raw_spec = spec.spec if isinstance(spec, CompiledSpec) else spec
+    summary = ValidationSummary(max_errors=max_errors, max_examples=max_examples, files=files)
+    cache_stats: Optional[Dict[str, int]] = None
+    pending: Deque["Future[BatchResult]"] = deque()
+
+    def _fold(future: "Future[BatchResult]") -> bool:
+        nonlocal cache_stats
+        findings, stats = future.result()
+        cache_stats = merge_stats(cache_stats, stats)
+        for finding in findings:
+            if summary.add(finding):
+                summary.total_checks = finding.entry + 1
+                return True
+        return False
+
+    def _result() -> Dict:
+        result = summary.result()
+        if cache_stats is not None:
+            result["cache"] = cache_stats
+        return result
+
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(raw_spec, ignore_unknown, cache_size),
+    )
+    try:
+        # Batches are folded strictly in submission order, so findings, groups and the
+        # --max-errors cut-off come out exactly as in a single-process run.
+        for start, batch in _batches(summary.count(traffic), batch_size):
+            pending.append(pool.submit(_validate_batch, start, batch, max_errors, max_examples))
+            if len(pending) >= workers * 2 and _fold(pending.popleft()):
+                return _result()
+        while pending:
+            if _fold(pending.popleft()):
+                return _result()
+        return _result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,203 @@
+import multiprocessing
+import queue
+import threading
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from .compiled import CompiledSpec
+from .errorstore import DEFAULT_MAX_EXAMPLES
+from .memo import ValidationCache
+from .traffic import STDIN_PATH, LineErrorHandler, TrafficEntry, iter_traffic
+from .validate import ValidationSummary, iter_validate
+
+PIPELINE_MODES = ("thread", "process")
+DEFAULT_QUEUE_DEPTH = 8
+DEFAULT_PIPELINE_BATCH_SIZE = 200
+_POLL_S = 0.1
+
+# Messages from the parse stage: ("batch", (entries, skipped_lines)),
+# ("done", stage_stats) or ("error", exception).
+Message = Tuple[str, Any]
+
+
+def _produce(
+    path: str,
+    limit: Optional[int],
+    batch_size: int,
+    put: Callable[[Message], bool],
+) -> Dict:
+    skipped: List[Tuple[int, str]] = []
+    entries = iter_traffic(path, on_error=lambda lineno, reason: skipped.append((lineno, reason)))
+    if limit is not None:
+        entries = islice(entries, limit)
+    started = time.perf_counter()
+    blocked = 0.0
+    items = 0
+    while True:
+        batch = list(islice(entries, batch_size))
+        if not batch and not skipped:
+            break
+        items += len(batch)
+        wait_start = time.perf_counter()
+        delivered = put(("batch", (batch, skipped)))
+        blocked += time.perf_counter() - wait_start
+        if not delivered or not batch:
+            break
+        skipped = []
+    elapsed = time.perf_counter() - started
+    return {"items": items, "busy_s": elapsed - blocked, "blocked_s": blocked}
+
+
+def _blocking_put(q: Any, stop: Any) -> Callable[[Message], bool]:
+    def put(message: Message) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(message, timeout=_POLL_S)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    return put
+
+
+def run_producer(path: str, limit: Optional[int], batch_size: int, q: Any, stop: Any) -> None:
+    put = _blocking_put(q, stop)
+    try:
+        stats = _produce(path, limit, batch_size, put)
+    except BaseException as exc:  # forwarded to the consumer, which re-raises it
+        put(("error", exc))
+        return
+    put(("done", stats))
+
+
+def _process_producer(path: str, limit: Optional[int], batch_size: int, q: Any, stop: Any) -> None:
+    run_producer(path, limit, batch_size, q, stop)
+    if stop.is_set():
+        # Nobody is reading any more; don't block exit flushing the queue.
+        q.cancel_join_thread()
+
+
+def _stage_row(items: int, busy: Optional[float], waited: Optional[float], wait_key: str) -> Dict:
+    return {
+        "items": items,
+        "busy_s": None if busy is None else round(busy, 6),
+        wait_key: None if waited is None else round(waited, 6),
+        "items_per_s": round(items / busy, 1) if busy else None,
+    }
+
+
+def _get(q: Any, worker: Any) -> Message:
+    while True:
+        try:
+            return q.get(timeout=_POLL_S)
+        except queue.Empty:
+            if worker.is_alive():
+                continue
+        try:
+            return q.get(timeout=_POLL_S)
+        except queue.Empty:
+            raise RuntimeError("traffic parser stopped unexpectedly") from None
+
+
+def validate_traffic_pipelined(
+    spec: Union[Dict, CompiledSpec],
+    traffic_path: Union[str, Path],
+    mode: str = "thread",
+    queue_depth: int = DEFAULT_QUEUE_DEPTH,
+    batch_size: int = DEFAULT_PIPELINE_BATCH_SIZE,
+    limit: Optional[int] = None,
+    on_error: Optional[LineErrorHandler] = None,
+    max_errors: Optional[int] = None,
+    ignore_unknown: bool = False,
+    cache: Optional[ValidationCache] = None,
+    max_examples: Optional[int] = DEFAULT_MAX_EXAMPLES,
+) -> Dict:
+    if mode not in PIPELINE_MODES:
+        raise ValueError(f"Unknown pipeline mode: {mode}")
+    if queue_depth <= 0:
+        raise ValueError("queue depth must be a positive integer")
+    if mode == "process" and str(traffic_path) == STDIN_PATH:
+        raise ValueError("process pipelines can't read stdin; use the thread mode")
+
+    worker: Union[threading.Thread, Any]
+    if mode == "thread":
+        q: Any = queue.Queue(maxsize=queue_depth)
+        stop: Any = threading.Event()
+        worker = threading.Thread(
+            target=run_producer,
+            args=(str(traffic_path), limit, batch_size, q, stop),
+            name="traffic-parser",
+            daemon=True,
+        )
+    else:
+        ctx = multiprocessing.get_context()
+        q = ctx.Queue(maxsize=queue_depth)
+        stop = ctx.Event()
+        worker = ctx.Process(
+            target=_process_producer,
+            args=(str(traffic_path), limit, batch_size, q, stop),
+            name="traffic-parser",
+            daemon=True,
+        )
+
+    parse_stats: Optional[Dict] = None
+    received = 0
+    starved = 0.0
+
+    def _entries() -> Iterator[TrafficEntry]:
+        nonlocal parse_stats, received, starved
+        while True:
+            wait_start = time.perf_counter()
+            kind, payload = _get(q, worker)
+            starved += time.perf_counter() - wait_start
+            if kind == "error":
+                raise payload
+            if kind == "done":
+                parse_stats = payload
+                return
+            batch, skipped = payload
+            if on_error is not None:
+                for lineno, reason in skipped:
+                    on_error(lineno, reason)
+            received += len(batch)
+            yield from batch
+
+    summary = ValidationSummary(max_errors=max_errors, max_examples=max_examples)
+    started = time.perf_counter()
+    worker.start()
+    try:
+        for finding in iter_validate(
+            spec, summary.count(_entries()), ignore_unknown=ignore_unknown, cache=cache
+        ):
+            if summary.add(finding):
+                break
+    finally:
+        stop.set()
+        worker.join(timeout=5)
+        if mode == "process" and worker.is_alive():
+            worker.terminate()
+    elapsed = time.perf_counter() - started
+
+    result = summary.result()
+    if cache is not None:
+        result["cache"] = cache.stats()
+    if parse_stats is None:
+        # Stopped early: the parse stage never reported its own timings.
+        parse = _stage_row(received, None, None, "blocked_s")
+        bottleneck = None
+    else:
+        parse = _stage_row(parse_stats["items"], parse_stats["busy_s"], parse_stats["blocked_s"], "blocked_s")
+        # Whichever stage spent longer waiting on the other one is not the bottleneck.
+        bottleneck = "parse" if starved >= parse_stats["blocked_s"] else "validate"
+    validate = _stage_row(summary.total_checks, elapsed - starved, starved, "starved_s")
+    result["pipeline"] = {
+        "mode": mode,
+        "queue_depth": queue_depth,
+        "batch_size": batch_size,
+        "stages": {"parse": parse, "validate": validate},
+        "bottleneck": bottleneck,
+    }
+    return result
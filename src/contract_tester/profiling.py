@@ -0,0 +1,218 @@
+import heapq
+import os
+import threading
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+PHASES = (
+    "spec_load",
+    "traffic_load",
+    "routing",
+    "params",
+    "request_body",
+    "response",
+    "reporting",
+)
+VALIDATION_PHASES = frozenset({"params", "request_body", "response"})
+DEFAULT_TOP = 10
+
+T = TypeVar("T")
+
+
+class Profiler:
+    # Time is charged to whichever phase was marked last, so phases never
+    # overlap: marking "reporting" mid-response pauses the response clock
+    # until the caller marks the previous phase again.
+    def __init__(self) -> None:
+        self.phase: Optional[str] = None
+        self.operation: Optional[str] = None
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        self._phases: Dict[str, List[float]] = {}
+        self._operations: Dict[str, List[float]] = {}
+        self._schemas: Dict[str, List[float]] = {}
+
+    def mark(self, phase: Optional[str]) -> Optional[str]:
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        previous = self.phase
+        if previous is not None:
+            row = self._phases[previous]
+            row[0] += wall - self._wall
+            row[1] += cpu - self._cpu
+            if self.operation is not None and previous in VALIDATION_PHASES:
+                self._operations[self.operation][0] += wall - self._wall
+        if phase is not None and phase not in self._phases:
+            self._phases[phase] = [0.0, 0.0]
+        self.phase = phase
+        self._wall = wall
+        self._cpu = cpu
+        return previous
+
+    def begin_operation(self, key: Optional[str]) -> None:
+        self.operation = key
+        if key is not None:
+            row = self._operations.setdefault(key, [0.0, 0])
+            row[1] += 1
+
+    def add_schema(self, label: str, seconds: float) -> None:
+        row = self._schemas.setdefault(label, [0.0, 0])
+        row[0] += seconds
+        row[1] += 1
+
+    def iter_phase(self, phase: str, items: Iterable[T]) -> Iterator[T]:
+        it = iter(items)
+        while True:
+            previous = self.mark(phase)
+            try:
+                item = next(it)
+            except StopIteration:
+                self.mark(previous)
+                return
+            self.mark(previous)
+            yield item
+
+    def result(self, top: int = DEFAULT_TOP) -> Dict:
+        self.mark(self.phase)
+        order = {name: i for i, name in enumerate(PHASES)}
+        phases = {
+            name: {"wall_s": round(row[0], 6), "cpu_s": round(row[1], 6)}
+            for name, row in sorted(self._phases.items(), key=lambda kv: order.get(kv[0], len(order)))
+        }
+        slowest_ops = heapq.nlargest(top, self._operations.items(), key=lambda kv: kv[1][0])
+        slowest_schemas = heapq.nlargest(top, self._schemas.items(), key=lambda kv: kv[1][0])
+        return {
+            "phases": phases,
+            "total_wall_s": round(sum(row[0] for row in self._phases.values()), 6),
+            "total_cpu_s": round(sum(row[1] for row in self._phases.values()), 6),
+            "slowest_operations": [
+                {"operation": key, "seconds": round(row[0], 6), "calls": int(row[1])} for key, row in slowest_ops
+            ],
+            "slowest_schemas": [
+                {"schema": key, "seconds": round(row[0], 6), "calls": int(row[1])} for key, row in slowest_schemas
+            ],
+        }
+
+
+MEMORY_PHASES = ("spec_load", "traffic_load", "validation", "reporting")
+_MEMORY_PHASE_OF = {"routing": "validation", "params": "validation", "request_body": "validation", "response": "validation"}
+DEFAULT_RSS_INTERVAL = 0.05
+
+
+def _rss_reader() -> Tuple[Optional[str], Optional[Callable[[], int]]]:
+    try:
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        with open("/proc/self/statm", "rb") as f:
+            f.read()
+
+        def _proc_rss() -> int:
+            with open("/proc/self/statm", "rb") as f:
+                return int(f.read().split()[1]) * page_size
+
+        return "proc", _proc_rss
+    except (AttributeError, OSError, ValueError):
+        pass
+    try:
+        import psutil  # type: ignore[import-not-found]
+    except ImportError:
+        return None, None
+    process = psutil.Process()
+    return "psutil", lambda: int(process.memory_info().rss)
+
+
+def _mb(value: Optional[int]) -> Optional[float]:
+    return None if value is None else round(value / 2**20, 2)
+
+
+class MemoryProfiler(Profiler):
+    # Same marking protocol as Profiler, so it plugs into the same hooks; the
+    # fine-grained validation phases are folded into a single "validation".
+    def __init__(self, rss_interval: float = DEFAULT_RSS_INTERVAL) -> None:
+        super().__init__()
+        self.rss_interval = rss_interval
+        self.rss_source, self._read_rss = _rss_reader()
+        self._fine: Optional[str] = None
+        self._traced_peaks: Dict[str, int] = {}
+        self._rss_peaks: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._started_tracing = False
+
+    def start(self) -> "MemoryProfiler":
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        tracemalloc.reset_peak()
+        if self._read_rss is not None and self.rss_interval > 0:
+            self._sampler = threading.Thread(target=self._sample_loop, name="rss-sampler", daemon=True)
+            self._sampler.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _sample_rss(self) -> None:
+        phase = self.phase
+        if phase is None or self._read_rss is None:
+            return
+        try:
+            rss = self._read_rss()
+        except Exception:
+            return
+        if rss > self._rss_peaks.get(phase, 0):
+            self._rss_peaks[phase] = rss
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.rss_interval):
+            self._sample_rss()
+
+    def mark(self, phase: Optional[str]) -> Optional[str]:
+        previous = self._fine
+        self._fine = phase
+        coarse = _MEMORY_PHASE_OF.get(phase, phase) if phase is not None else None
+        if coarse == self.phase:
+            return previous
+        self._flush()
+        self.phase = coarse
+        self._sample_rss()
+        return previous
+
+    def _flush(self) -> None:
+        if self.phase is not None:
+            self._sample_rss()
+            _, peak = tracemalloc.get_traced_memory()
+            if peak > self._traced_peaks.get(self.phase, 0):
+                self._traced_peaks[self.phase] = peak
+        tracemalloc.reset_peak()
+
+    def begin_operation(self, key: Optional[str]) -> None:
+        pass
+
+    def add_schema(self, label: str, seconds: float) -> None:
+        pass
+
+    def result(self, top: int = DEFAULT_TOP) -> Dict:
+        self._flush()
+        order = {name: i for i, name in enumerate(MEMORY_PHASES)}
+        names = sorted(set(self._traced_peaks) | set(self._rss_peaks), key=lambda n: order.get(n, len(order)))
+        phases = {
+            name: {
+                "peak_traced_mb": _mb(self._traced_peaks.get(name, 0)),
+                "peak_rss_mb": _mb(self._rss_peaks.get(name)),
+            }
+            for name in names
+        }
+        rss_peak = max(self._rss_peaks.values()) if self._rss_peaks else None
+        return {
+            "phases": phases,
+            "peak_traced_mb": _mb(max(self._traced_peaks.values(), default=0)),
+            "peak_rss_mb": _mb(rss_peak),
+            "rss_source": self.rss_source,
+        }
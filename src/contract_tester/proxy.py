@@ -0,0 +1,352 @@
+import asyncio
+import gzip
+import json
+import queue
+import threading
+import time
+import zlib
+from collections import deque
+from http import HTTPStatus
+from typing import Deque, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import urlsplit
+
+from .compiled import CompiledSpec, compile_spec
+from .errorstore import DEFAULT_MAX_EXAMPLES
+from .memo import ValidationCache
+from .traffic import TrafficEntry, normalize_har_entry
+from .validate import ValidationSummary, iter_validate
+
+STATS_PATH = "/_contract_tester/stats"
+DEFAULT_QUEUE_SIZE = 1000
+LATENCY_SAMPLES = 10000
+
+Headers = List[Tuple[str, str]]
+# (method, target, request headers, request body, status, response headers, response body)
+Exchange = Tuple[str, str, Headers, bytes, int, Headers, bytes]
+
+
+class _HttpError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _header(headers: Headers, name: str) -> Optional[str]:
+    value = None
+    for key, item in headers:
+        if key.lower() == name:
+            value = item
+    return value
+
+
+def _wants_close(version: str, headers: Headers) -> bool:
+    connection = (_header(headers, "connection") or "").lower()
+    if "close" in connection:
+        return True
+    return version == "HTTP/1.0" and "keep-alive" not in connection
+
+
+async def _read_head(reader: asyncio.StreamReader) -> Optional[Tuple[List[str], Headers, bytes]]:
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as exc:
+        if not exc.partial.strip():
+            return None
+        raise _HttpError(400, "incomplete message head") from None
+    except asyncio.LimitOverrunError:
+        raise _HttpError(431, "message head too large") from None
+    lines = head[:-4].decode("latin-1").split("\r\n")
+    start = lines[0].split(" ", 2)
+    if len(start) < 2:
+        raise _HttpError(400, "malformed start line")
+    headers: Headers = []
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if not sep or not name.strip():
+            raise _HttpError(400, "malformed header line")
+        headers.append((name.strip(), value.strip()))
+    return start, headers, head
+
+
+async def _read_body(
+    reader: asyncio.StreamReader, headers: Headers, until_close: bool = False
+) -> Tuple[bytes, bytes]:
+    # Returns (bytes as framed on the wire, decoded payload).
+    transfer = (_header(headers, "transfer-encoding") or "").lower()
+    if "chunked" in transfer:
+        raw = bytearray()
+        body = bytearray()
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            raw += line
+            try:
+                size = int(line.split(b";", 1)[0].strip(), 16)
+            except ValueError:
+                raise _HttpError(400, "malformed chunk size") from None
+            if size == 0:
+                while True:
+                    trailer = await reader.readuntil(b"\r\n")
+                    raw += trailer
+                    if trailer == b"\r\n":
+                        return bytes(raw), bytes(body)
+            chunk = await reader.readexactly(size + 2)
+            raw += chunk
+            body += chunk[:-2]
+    length = _header(headers, "content-length")
+    if length is not None:
+        try:
+            data = await reader.readexactly(int(length))
+        except ValueError:
+            raise _HttpError(400, "malformed Content-Length") from None
+        return data, data
+    if until_close:
+        data = await reader.read()
+        return data, data
+    return b"", b""
+
+
+def _decode_content(body: bytes, headers: Headers) -> bytes:
+    encoding = (_header(headers, "content-encoding") or "").lower()
+    try:
+        if encoding == "gzip":
+            return gzip.decompress(body)
+        if encoding == "deflate":
+            return zlib.decompress(body)
+    except (OSError, EOFError, zlib.error):
+        return b""
+    return body
+
+
+def exchange_entry(exchange: Exchange) -> Optional[TrafficEntry]:
+    # Shapes the exchange like a HAR entry so bodies are parsed exactly as
+    # HAR traffic is.
+    method, target, req_headers, req_body, status, res_headers, res_body = exchange
+    request: Dict = {
+        "method": method,
+        "url": target,
+        "headers": [{"name": name, "value": value} for name, value in req_headers],
+    }
+    if req_body:
+        request["postData"] = {
+            "mimeType": _header(req_headers, "content-type") or "",
+            "text": _decode_content(req_body, req_headers).decode("utf-8", errors="replace"),
+        }
+    content = {
+        "mimeType": _header(res_headers, "content-type") or "",
+        "text": _decode_content(res_body, res_headers),
+    }
+    response = {"status": status, "content": content}
+    return normalize_har_entry({"request": request, "response": response})
+
+
+def _percentile(samples: List[float], q: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(q * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def _ms(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value * 1000, 3)
+
+
+class ValidatingProxy:
+    def __init__(
+        self,
+        spec: Union[Dict, CompiledSpec],
+        upstream: str,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        ignore_unknown: bool = False,
+        cache: Optional[ValidationCache] = None,
+        max_examples: Optional[int] = DEFAULT_MAX_EXAMPLES,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        parsed = urlsplit(upstream)
+        if parsed.scheme != "http" or not parsed.hostname:
+            raise ValueError(f"upstream must be an http:// URL, got {upstream!r}")
+        if queue_size <= 0:
+            raise ValueError("queue size must be a positive integer")
+        self.upstream_host = parsed.hostname
+        self.upstream_port = parsed.port or 80
+        self.spec = compile_spec(spec)
+        self.ignore_unknown = ignore_unknown
+        self.cache = cache
+        self.max_entries = max_entries
+        self.queue_size = queue_size
+        self.summary = ValidationSummary(max_examples=max_examples)
+        self.lock = threading.Lock()
+        self.exchanges = 0
+        self.dropped = 0
+        self.unparsed = 0
+        self.over_limit = 0
+        self.failed = 0
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._queue: "queue.Queue[Optional[Exchange]]" = queue.Queue(maxsize=queue_size)
+        self._worker = threading.Thread(target=self._validate_loop, name="proxy-validator", daemon=True)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._clients: Set[asyncio.StreamWriter] = set()
+
+    async def start(self, host: Optional[str], port: int) -> int:
+        self._worker.start()
+        self._server = await asyncio.start_server(self._handle_client, host or None, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # Idle keep-alive connections would otherwise hold wait_closed() open.
+            for client in list(self._clients):
+                client.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._worker.is_alive():
+            # Blocking put: whatever is still queued gets validated first.
+            await asyncio.get_running_loop().run_in_executor(None, self._queue.put, None)
+            await asyncio.get_running_loop().run_in_executor(None, self._worker.join)
+
+    def _validate_loop(self) -> None:
+        while True:
+            exchange = self._queue.get()
+            if exchange is None:
+                return
+            try:
+                self._validate(exchange)
+            except Exception:
+                # One exchange that can't be validated must not stop the rest.
+                with self.lock:
+                    self.failed += 1
+
+    def _validate(self, exchange: Exchange) -> None:
+        entry = exchange_entry(exchange)
+        with self.lock:
+            if entry is None:
+                self.unparsed += 1
+                return
+            if self.max_entries is not None and self.summary.total_checks >= self.max_entries:
+                self.over_limit += 1
+                return
+            index = self.summary.total_checks
+            findings = list(
+                iter_validate(self.spec, (entry,), ignore_unknown=self.ignore_unknown, cache=self.cache)
+            )
+            self.summary.total_checks += 1
+            for finding in findings:
+                finding.entry = index
+                self.summary.add(finding)
+
+    def _enqueue(self, exchange: Exchange) -> None:
+        try:
+            self._queue.put_nowait(exchange)
+        except queue.Full:
+            self.dropped += 1
+
+    def stats(self) -> Dict:
+        samples = list(self.latencies)
+        with self.lock:
+            validated = self.summary.total_checks
+            errors = self.summary.store.total
+            unparsed = self.unparsed
+            over_limit = self.over_limit
+            failed = self.failed
+        return {
+            "upstream": f"http://{self.upstream_host}:{self.upstream_port}",
+            "exchanges": self.exchanges,
+            "validated": validated,
+            "error_count": errors,
+            "queued": self._queue.qsize(),
+            "queue_size": self.queue_size,
+            "dropped": self.dropped,
+            "unparsed": unparsed,
+            "over_limit": over_limit,
+            "failed": failed,
+            "added_latency_ms": {
+                "p50": _ms(_percentile(samples, 0.5)),
+                "p99": _ms(_percentile(samples, 0.99)),
+                "max": _ms(max(samples) if samples else None),
+                "samples": len(samples),
+            },
+        }
+
+    def result(self) -> Dict:
+        with self.lock:
+            result = self.summary.result()
+        if self.cache is not None:
+            result["cache"] = self.cache.stats()
+        result["proxy"] = self.stats()
+        return result
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, body: bytes, ctype: str) -> None:
+        head = (
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\nContent-Type: {ctype}\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        upstream: Optional[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = None
+        self._clients.add(writer)
+        try:
+            while True:
+                try:
+                    request = await _read_head(reader)
+                    if request is None:
+                        return
+                    start, req_headers, req_head = request
+                    req_raw, req_body = await _read_body(reader, req_headers)
+                except _HttpError as exc:
+                    await self._respond(writer, exc.status, str(exc).encode(), "text/plain")
+                    return
+                received = time.perf_counter()
+                method, target = start[0].upper(), start[1]
+                version = start[2] if len(start) > 2 else "HTTP/1.0"
+                if method == "GET" and target.split("?", 1)[0] == STATS_PATH:
+                    body = json.dumps(self.stats()).encode("utf-8")
+                    await self._respond(writer, 200, body, "application/json")
+                    return
+
+                try:
+                    if upstream is None:
+                        upstream = await asyncio.open_connection(self.upstream_host, self.upstream_port)
+                    up_reader, up_writer = upstream
+                    sent = time.perf_counter()
+                    up_writer.write(req_head + req_raw)
+                    await up_writer.drain()
+                    response = await _read_head(up_reader)
+                    if response is None:
+                        raise ConnectionError("upstream closed the connection")
+                    res_start, res_headers, res_head = response
+                    status = int(res_start[1])
+                    framed = _header(res_headers, "content-length") is not None or "chunked" in (
+                        _header(res_headers, "transfer-encoding") or ""
+                    ).lower()
+                    no_body = method == "HEAD" or status < 200 or status in (204, 304)
+                    until_close = not no_body and not framed
+                    res_raw, res_body = (b"", b"") if no_body else await _read_body(
+                        up_reader, res_headers, until_close=until_close
+                    )
+                    answered = time.perf_counter()
+                except (OSError, ValueError, _HttpError, asyncio.IncompleteReadError) as exc:
+                    message = f"upstream error: {exc or type(exc).__name__}".encode()
+                    await self._respond(writer, 502, message, "text/plain")
+                    return
+
+                writer.write(res_head + res_raw)
+                await writer.drain()
+                self.latencies.append((time.perf_counter() - received) - (answered - sent))
+                self.exchanges += 1
+                self._enqueue((method, target, req_headers, req_body, status, res_headers, res_body))
+
+                if until_close or _wants_close(res_start[0], res_headers):
+                    upstream[1].close()
+                    upstream = None
+                if until_close or _wants_close(version, req_headers):
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            return
+        finally:
+            self._clients.discard(writer)
+            if upstream is not None:
+                upstream[1].close()
+            writer.close()
@@ -2,6 +2,11 @@ from datetime import datetime
 from html import escape
 from typing import Dict, List
 
+from .errorstore import group_counts, top_error_groups
+
+REPORT_MAX_GROUPS = 50
+REPORT_MAX_FILES = 100
+
 
 def build_html_report(result: Dict) -> str:
     total = result.get("total_checks", 0)
@@ -12,10 +17,14 @@ def build_html_report(result: Dict) -> str:
     license_status = result.get("license_status", {}) or {}
     demo_mode = not license_status.get("valid", True)
 
-    grouped = result.get("errors_grouped", {}) or {}
+    top_groups = top_error_groups(result, REPORT_MAX_GROUPS)
     group_rows = "\n".join(
-        f"<li><strong>{escape(k)}</strong> ({len(v)})</li>" for k, v in grouped.items()
+        f"<li><strong>{escape(k)}</strong> ({count})</li>" for k, count in top_groups
     ) or "<li>None</li>"
+    hidden_groups = len(group_counts(result)) - len(top_groups)
+    if hidden_groups > 0:
+        group_rows += f"\n<li>... and {hidden_groups} more groups</li>"
+    shown_errors = len(error_details) if error_details else len(errors)
     if error_details:
         rows = "\n".join(
             f"<li>{escape(str(item.get('message', '')))}"
@@ -31,6 +40,24 @@ def build_html_report(result: Dict) -> str:
         rows = "\n".join(f"<li>{escape(e)}</li>" for e in errors)
     rows = rows or "<li>None</li>"
 
+    files: List[Dict] = result.get("files") or []
+    file_section = ""
+    if files:
+        shown_files = sorted(files, key=lambda row: -row.get("error_count", 0))[:REPORT_MAX_FILES]
+        file_rows = "\n".join(
+            f"<tr><td>{escape(str(row.get('path', '')))}</td><td>{row.get('total_checks', 0)}</td>"
+            f"<td>{row.get('error_count', 0)}</td></tr>"
+            for row in shown_files
+        )
+        hidden_files = len(files) - len(shown_files)
+        if hidden_files > 0:
+            file_rows += f"\n<tr><td colspan=\"3\">... and {hidden_files} more files</td></tr>"
+        file_section = (
+            f"<h2>Files ({len(files)})</h2>\n  <table>\n"
+            "<tr><th>File</th><th>Checks</th><th>Errors</th></tr>\n"
+            f"{file_rows}\n  </table>"
+        )
+
     return f"""<!doctype html>
 <html>
 <head>
@@ -46,6 +73,8 @@ def build_html_report(result: Dict) -> str:
     .banner {{ padding: 10px 12px; border-radius: 6px; background: #fff3cd; color: #6b4f00; margin: 12px 0; }}
     .promo {{ padding: 12px; border-radius: 6px; background: #eef6ff; color: #123a6b; margin: 12px 0; }}
     .promo strong {{ display: block; margin-bottom: 4px; }}
+    table {{ border-collapse: collapse; }}
+    td, th {{ padding: 2px 10px; text-align: left; }}
   </style>
 </head>
 <body>
@@ -58,11 +87,13 @@ def build_html_report(result: Dict) -> str:
   <p><strong>Total checks:</strong> {total}</p>
   <p><strong>Errors:</strong> <span class="err">{error_count}</span></p>
   <p><strong>Stopped early:</strong> {str(stopped_early).lower()}</p>
+  {file_section}
   <h2>Error groups</h2>
   <ol>
     {group_rows}
   </ol>
   <h2>Errors</h2>
+  {(f'<p class="meta">Showing {shown_errors} example(s) of {error_count} errors.</p>' if shown_errors < error_count else '')}
   <ol>
     {rows}
   </ol>
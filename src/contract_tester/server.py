@@ -0,0 +1,228 @@
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from .artifact import load_compiled_spec
+from .compiled import CompiledSpec
+from .license import DEMO_MAX_PATHS, DEMO_MAX_TRAFFIC, LicenseStatus
+from .memo import ValidationCache
+from .traffic import normalize_entry
+from .validate import iter_validate
+
+DEFAULT_RELOAD_INTERVAL = 1.0
+DEFAULT_SERVER_CACHE_SIZE = 4096
+
+# NDJSON protocol: one request object per line, one reply object per line.
+#   {"id": 1, "entry": {...}}         -> {"id": 1, "ok": bool, "errors": [...]}
+#   {"id": 2, "entries": [{...}, ...]} -> one {"id": 2, "index": i, "ok", "errors"} per entry,
+#                                         then {"id": 2, "done": true, "count", "error_count"}
+#   {"op": "ping" | "stats" | "reload"}
+# Requests that can't be served get {"ok": false, "error": "..."}; "id" is echoed when given.
+
+Identity = Optional[Tuple[int, int, int]]
+
+
+def _identity(path: Path) -> Identity:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class ValidationService:
+    def __init__(
+        self,
+        spec_path: Union[str, Path],
+        license_status: LicenseStatus,
+        ignore_unknown: bool = False,
+        cache_size: Optional[int] = DEFAULT_SERVER_CACHE_SIZE,
+        reload_interval: float = DEFAULT_RELOAD_INTERVAL,
+    ) -> None:
+        self.spec_path = Path(spec_path)
+        self.license_status = license_status
+        self.ignore_unknown = ignore_unknown
+        self.cache_size = cache_size
+        self.reload_interval = reload_interval
+        self.lock = threading.Lock()
+        self.identity = _identity(self.spec_path)
+        self.spec = self._load()
+        self.cache = ValidationCache(cache_size) if cache_size else None
+        self.generation = 1
+        self.reload_error: Optional[str] = None
+        self.checked = 0
+        self.error_count = 0
+        self.started = time.time()
+        self._checked_at = time.monotonic()
+
+    @property
+    def demo(self) -> bool:
+        return not self.license_status.get("valid", False)
+
+    def _load(self) -> CompiledSpec:
+        spec = load_compiled_spec(self.spec_path)
+        paths = spec.spec.get("paths")
+        if self.demo and isinstance(paths, dict) and len(paths) > DEMO_MAX_PATHS:
+            raise ValueError(f"Demo mode: spec has more than {DEMO_MAX_PATHS} paths. Add a license to run.")
+        spec.warm()
+        return spec
+
+    def maybe_reload(self, force: bool = False) -> None:
+        # Called with the lock held, before each request.
+        now = time.monotonic()
+        if not force and (self.reload_interval <= 0 or now - self._checked_at < self.reload_interval):
+            return
+        self._checked_at = now
+        identity = _identity(self.spec_path)
+        if identity == self.identity and not force:
+            return
+        # Remember the identity even if loading fails: a half-written file gets
+        # a new identity once the writer finishes, which triggers another try.
+        self.identity = identity
+        try:
+            spec = self._load()
+        except Exception as exc:
+            self.reload_error = f"{type(exc).__name__}: {exc}"
+            return
+        self.spec = spec
+        # Cached outcomes are keyed by validator scope and are meaningless for a new spec.
+        self.cache = ValidationCache(self.cache_size) if self.cache_size else None
+        self.generation += 1
+        self.reload_error = None
+
+    def validate_entry(self, raw: object) -> Dict:
+        entry = normalize_entry(raw) if isinstance(raw, dict) else None
+        if entry is None:
+            return {"ok": False, "error": "not a traffic entry (needs method, path and status)"}
+        with self.lock:
+            if self.demo and self.checked >= DEMO_MAX_TRAFFIC:
+                return {
+                    "ok": False,
+                    "error": f"Demo mode: limited to {DEMO_MAX_TRAFFIC} entries per server. Add a license to run.",
+                }
+            try:
+                errors = [
+                    finding.detail()
+                    for finding in iter_validate(
+                        self.spec, (entry,), ignore_unknown=self.ignore_unknown, cache=self.cache
+                    )
+                ]
+            except Exception as exc:
+                # Reported to this client only; the connection and any batch carry on.
+                return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+            self.checked += 1
+            self.error_count += len(errors)
+        return {"ok": not errors, "errors": errors}
+
+    def stats(self) -> Dict:
+        stats: Dict = {
+            "spec": str(self.spec_path),
+            "generation": self.generation,
+            "reload_error": self.reload_error,
+            "checked": self.checked,
+            "error_count": self.error_count,
+            "uptime_s": round(time.time() - self.started, 3),
+            "license_valid": not self.demo,
+        }
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        return stats
+
+    def handle(self, request: object) -> Iterator[Dict]:
+        if not isinstance(request, dict):
+            yield {"ok": False, "error": "request must be a JSON object"}
+            return
+        tag = {"id": request["id"]} if "id" in request else {}
+        with self.lock:
+            self.maybe_reload(force=request.get("op") == "reload")
+        if "entry" in request:
+            yield dict(tag, **self.validate_entry(request["entry"]))
+        elif "entries" in request:
+            entries = request["entries"]
+            if not isinstance(entries, list):
+                yield dict(tag, ok=False, error="'entries' must be a list")
+                return
+            error_count = 0
+            for index, raw in enumerate(entries):
+                reply = self.validate_entry(raw)
+                error_count += len(reply.get("errors", ()))
+                yield dict(tag, index=index, **reply)
+            yield dict(tag, done=True, count=len(entries), error_count=error_count)
+        elif request.get("op") == "ping":
+            yield dict(tag, ok=True)
+        elif request.get("op") == "stats":
+            # Built under the lock but sent outside it: a slow reader mustn't
+            # stall validation on other connections.
+            with self.lock:
+                stats = self.stats()
+            yield dict(tag, ok=True, stats=stats)
+        elif request.get("op") == "reload":
+            yield dict(tag, ok=self.reload_error is None, generation=self.generation, error=self.reload_error)
+        else:
+            yield dict(tag, ok=False, error="expected 'entry', 'entries' or a known 'op'")
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "ValidationServer"
+
+    def handle(self) -> None:
+        service = self.server.service
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as exc:
+                replies: Iterator[Dict] = iter([{"ok": False, "error": f"invalid JSON ({getattr(exc, 'msg', exc)})"}])
+            else:
+                replies = service.handle(request)
+            try:
+                for reply in replies:
+                    self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+            except (BrokenPipeError, ConnectionResetError):
+                return
+
+
+def _remove_stale_socket(path: str) -> None:
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise ValueError(f"{path} exists and is not a socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise ValueError(f"{path} is in use by another server")
+
+
+class ValidationServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, service: ValidationService) -> None:
+        _remove_stale_socket(socket_path)
+        self.service = service
+        self.socket_path = socket_path
+        old_umask = os.umask(0o177)  # socket is only reachable by the owner
+        try:
+            super().__init__(socket_path, _Handler)
+        finally:
+            os.umask(old_umask)
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
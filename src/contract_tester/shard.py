@@ -0,0 +1,184 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from . import __version__
+from .compiled import CompiledSpec
+from .errorstore import DEFAULT_MAX_EXAMPLES, merge_groups
+from .memo import ValidationCache, merge_stats
+from .profiling import Profiler
+from .traffic import TrafficEntry
+from .validate import ValidationSummary, iter_validate
+
+PARTIAL_KEY = "contract_tester_partial"
+PARTIAL_FORMAT = 1
+SHARD_KEYS = ("position", "content")
+
+# Settings that change which findings a shard reports; every partial being
+# merged must agree on them.
+_RUN_FIELDS = ("count", "key", "spec_sha256", "entries_seen", "traffic_limit", "ignore_unknown", "max_examples")
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    index, sep, count = value.partition("/")
+    try:
+        i, n = int(index), int(count)
+    except ValueError:
+        raise ValueError(f"--shard must look like i/N (e.g. 1/4), got {value!r}") from None
+    if not sep or n <= 0 or not 1 <= i <= n:
+        raise ValueError(f"--shard must look like i/N with 1 <= i <= N, got {value!r}")
+    return i, n
+
+
+def _content_hash(entry: Dict) -> int:
+    data = entry.to_dict() if isinstance(entry, TrafficEntry) else entry
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), "big")
+
+
+def shard_of(position: int, entry: Dict, count: int, key: str = "position") -> int:
+    # 1-based like --shard; both keys are stable across machines and runs
+    # (no dependence on PYTHONHASHSEED).
+    if key == "content":
+        return _content_hash(entry) % count + 1
+    return position % count + 1
+
+
+def spec_fingerprint(spec: Union[Dict, CompiledSpec]) -> str:
+    raw = spec.spec if isinstance(spec, CompiledSpec) else spec
+    encoded = json.dumps(raw, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class _ShardFilter:
+    def __init__(self, entries: Iterable[Dict], index: int, count: int, key: str) -> None:
+        self.entries = entries
+        self.index = index
+        self.count = count
+        self.key = key
+        self.seen = 0
+        self.position = -1
+
+    def __iter__(self) -> Iterator[Dict]:
+        for position, entry in enumerate(self.entries):
+            self.seen = position + 1
+            if shard_of(position, entry, self.count, self.key) == self.index:
+                self.position = position
+                yield entry
+
+
+def validate_traffic_shard(
+    spec: Union[Dict, CompiledSpec],
+    traffic: Iterable[Dict],
+    index: int,
+    count: int,
+    key: str = "position",
+    ignore_unknown: bool = False,
+    cache: Optional[ValidationCache] = None,
+    max_examples: Optional[int] = DEFAULT_MAX_EXAMPLES,
+    profiler: Optional[Profiler] = None,
+    traffic_limit: Optional[int] = None,
+) -> Tuple[Dict, Dict]:
+    if key not in SHARD_KEYS:
+        raise ValueError(f"Unknown shard key: {key}")
+    if not 1 <= index <= count:
+        raise ValueError("shard index must be between 1 and the shard count")
+    selected = _ShardFilter(traffic, index, count, key)
+    summary = ValidationSummary(max_examples=max_examples)
+    entries = summary.count(selected)
+    if profiler is not None:
+        entries = profiler.iter_phase("traffic_load", entries)
+    for finding in iter_validate(spec, entries, ignore_unknown=ignore_unknown, cache=cache, profiler=profiler):
+        # Findings are yielded before the next entry is pulled, so they always
+        # belong to the entry the filter passed through last.
+        finding.entry = selected.position
+        if profiler is None:
+            summary.add(finding)
+        else:
+            previous = profiler.mark("reporting")
+            summary.add(finding)
+            profiler.mark(previous)
+    if profiler is not None:
+        profiler.mark("reporting")
+        profiler.begin_operation(None)
+    result = summary.result()
+    partial: Dict = {
+        PARTIAL_KEY: PARTIAL_FORMAT,
+        "tool_version": __version__,
+        "shard": index,
+        "count": count,
+        "key": key,
+        "spec_sha256": spec_fingerprint(spec),
+        "entries_seen": selected.seen,
+        "traffic_limit": traffic_limit,
+        "ignore_unknown": ignore_unknown,
+        "max_examples": max_examples,
+        "total_checks": summary.total_checks,
+        "groups": summary.store.dump_groups(),
+    }
+    if cache is not None:
+        result["cache"] = partial["cache"] = cache.stats()
+    result["shard"] = {"index": index, "count": count, "key": key, "entries_seen": selected.seen}
+    return result, partial
+
+
+def default_partial_path(index: int, count: int) -> str:
+    return f"partial-{index}-of-{count}.json"
+
+
+def write_partial(path: Union[str, Path], partial: Dict) -> None:
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(partial), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def load_partial(path: Union[str, Path]) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"{path} is not a partial result file: {exc}") from None
+    if not isinstance(data, dict) or PARTIAL_KEY not in data:
+        raise ValueError(f"{path} is not a partial result file (run validate --shard i/N)")
+    if data[PARTIAL_KEY] != PARTIAL_FORMAT:
+        raise ValueError(f"{path} has unsupported partial format {data[PARTIAL_KEY]!r}")
+    return data
+
+
+def merge_partials(partials: List[Dict]) -> Dict:
+    if not partials:
+        raise ValueError("no partial results to merge")
+    first = partials[0]
+    for partial in partials[1:]:
+        for field in _RUN_FIELDS:
+            if partial.get(field) != first.get(field):
+                raise ValueError(
+                    f"partials disagree on {field}: {first.get(field)!r} vs {partial.get(field)!r}"
+                )
+    count = first["count"]
+    indices = sorted(partial["shard"] for partial in partials)
+    duplicates = sorted({i for i in indices if indices.count(i) > 1})
+    if duplicates:
+        raise ValueError("duplicate shard(s): " + ", ".join(f"{i}/{count}" for i in duplicates))
+    missing = sorted(set(range(1, count + 1)) - set(indices))
+    if missing:
+        raise ValueError("missing shard(s): " + ", ".join(f"{i}/{count}" for i in missing))
+
+    summary = ValidationSummary(max_examples=first["max_examples"])
+    summary.total_checks = sum(partial["total_checks"] for partial in partials)
+    summary.store = merge_groups((partial["groups"] for partial in partials), first["max_examples"])
+    result = summary.result()
+    cache_stats = None
+    for partial in partials:
+        cache_stats = merge_stats(cache_stats, partial.get("cache"))
+    if cache_stats is not None:
+        result["cache"] = cache_stats
+    if "license_status" in first:
+        result["license_status"] = first["license_status"]
+    if first.get("skipped_lines"):
+        # Every shard reads the whole input, so each saw the same malformed lines.
+        result["skipped_lines"] = first["skipped_lines"]
+    return result
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from . import __version__
+from .compiled import CompiledSpec
+from .errorstore import DEFAULT_MAX_EXAMPLES, merge_groups
+from .memo import ValidationCache
+from .shard import spec_fingerprint
+from .traffic import IncrementalReader, LineErrorHandler, incremental_format, iter_traffic_from
+from .validate import ValidationSummary, iter_validate
+
+STATE_KEY = "contract_tester_state"
+STATE_FORMAT = 1
+# Bytes hashed at the start of the file to notice in-place rewrites.
+HEAD_BYTES = 4096
+
+
+def _head_digest(path: Union[str, Path], length: int) -> str:
+    with open(path, "rb") as fp:
+        return hashlib.sha256(fp.read(length)).hexdigest()
+
+
+def load_state(path: Union[str, Path]) -> Optional[Dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"{path} is not a state file: {exc}") from None
+    if not isinstance(data, dict) or STATE_KEY not in data:
+        raise ValueError(f"{path} is not a state file (written by validate --state)")
+    if data[STATE_KEY] != STATE_FORMAT:
+        raise ValueError(f"{path} has unsupported state format {data[STATE_KEY]!r}")
+    return data
+
+
+def write_state(path: Union[str, Path], state: Dict) -> None:
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(state), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def resume_reason(state: Dict, traffic: Union[str, Path], settings: Dict) -> Optional[str]:
+    # Why ``state`` can't be continued for ``traffic`` (None when it can).
+    if state.get("settings") != settings:
+        return "spec or settings changed"
+    st = os.stat(traffic)
+    if [st.st_dev, st.st_ino] != state["file"]["identity"]:
+        return "traffic file was replaced (rotated)"
+    if st.st_size < state["offset"]:
+        return "traffic file was truncated"
+    head = state["file"]["head"]
+    if _head_digest(traffic, head["length"]) != head["sha256"]:
+        return "traffic file was rewritten"
+    return None
+
+
+def validate_traffic_resumable(
+    spec: Union[Dict, CompiledSpec],
+    traffic: Union[str, Path],
+    state: Optional[Dict] = None,
+    ignore_unknown: bool = False,
+    cache: Optional[ValidationCache] = None,
+    max_examples: Optional[int] = DEFAULT_MAX_EXAMPLES,
+    traffic_limit: Optional[int] = None,
+    on_error: Optional[LineErrorHandler] = None,
+) -> Tuple[Dict, Dict]:
+    # Validates what was appended to ``traffic`` since ``state`` was written and
+    # returns (cumulative result, new state). The result matches a single run
+    # over the whole file.
+    kind = incremental_format(traffic)
+    settings = {
+        "format": kind,
+        "spec_sha256": spec_fingerprint(spec),
+        "ignore_unknown": ignore_unknown,
+        "max_examples": max_examples,
+    }
+    reason = resume_reason(state, traffic, settings) if state is not None else None
+    previous = state if state is not None and reason is None else None
+
+    skipped = 0
+
+    def _skipped(lineno: int, message: str) -> None:
+        nonlocal skipped
+        skipped += 1
+        if on_error:
+            on_error(lineno, message)
+
+    summary = ValidationSummary(max_examples=max_examples)
+    if previous is None:
+        reader = IncrementalReader(kind, on_error=_skipped)
+    else:
+        reader = IncrementalReader(kind, previous["offset"], previous["line"], on_error=_skipped)
+        summary.total_checks = previous["total_checks"]
+        summary.store = merge_groups([previous["groups"]], max_examples)
+    base = start_checks = summary.total_checks
+    start_offset = reader.offset
+
+    entries = iter_traffic_from(traffic, reader, final=False)
+    if traffic_limit is not None:
+        # The limit covers every run that shares this state.
+        entries = islice(entries, max(0, traffic_limit - base))
+    for finding in iter_validate(spec, summary.count(entries), ignore_unknown=ignore_unknown, cache=cache):
+        finding.entry += base
+        summary.add(finding)
+
+    st = os.stat(traffic)
+    head_length = min(reader.offset, HEAD_BYTES)
+    skipped_total = skipped + (previous["skipped_lines"] if previous is not None else 0)
+    new_state = {
+        STATE_KEY: STATE_FORMAT,
+        "version": __version__,
+        "traffic": os.path.abspath(traffic),
+        "file": {
+            "identity": [st.st_dev, st.st_ino],
+            "head": {"length": head_length, "sha256": _head_digest(traffic, head_length)},
+        },
+        "settings": settings,
+        "offset": reader.offset,
+        "line": reader.line,
+        "total_checks": summary.total_checks,
+        "skipped_lines": skipped_total,
+        "groups": summary.store.dump_groups(),
+    }
+    result = summary.result()
+    if cache is not None:
+        result["cache"] = cache.stats()
+    result["state"] = {
+        "resumed": previous is not None,
+        "reset_reason": reason,
+        "start_offset": start_offset,
+        "offset": reader.offset,
+        "new_entries": summary.total_checks - start_checks,
+        "skipped_lines": skipped_total,
+    }
+    return result, new_state
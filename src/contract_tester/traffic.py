@@ -1,14 +1,179 @@
 import base64
+import gzip
+import io
 import json
 import re
 import shlex
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import parse_qs, urlparse
 
+from .jsonstream import iter_array_items
+
+
+STDIN_PATH = "-"
+JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+_GZIP_MAGIC = b"\x1f\x8b"
+_CURL_STATUS = re.compile(rb"(HTTPSTATUS|STATUS):[ \t\r\x0b\x0c]*(\d{3})")
+_SPACE = b" \t\n\r\x0b\x0c"
+_NON_SPACE = re.compile(rb"[^ \t\n\r\x0b\x0c]")
+_EMPTY_LINE = re.compile(rb"^\r?\n", re.M)
+# Bytes a JSON document can start with; other curl bodies are not kept.
+_JSON_START = frozenset(b"{[\"-0123456789tfnNI")
+READ_CHUNK_SIZE = 1 << 16
+
+LineErrorHandler = Callable[[int, str], None]
+
+ENTRY_FIELDS = (
+    "method",
+    "path",
+    "status",
+    "response_json",
+    "query",
+    "headers",
+    "request_json",
+    "request_text",
+    "request_content_type",
+)
+_ENTRY_FIELD_SET = frozenset(ENTRY_FIELDS)
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _parse_json_body(body: Union[str, bytes]) -> Any:
+    try:
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", errors="replace")
+        return json.loads(body)
+    except Exception:
+        return None
+
+
+class TrafficEntry:
+    # One normalized request/response pair. Repeated strings are interned and
+    # the raw request body is dropped once it has been parsed as JSON. A raw
+    # response body (``response_body``) is only parsed when response_json is
+    # first read; unparseable bodies read as None. Read-only dict-style access
+    # (entry["path"], entry.get("status")) keeps older callers working.
+    __slots__ = tuple(field for field in ENTRY_FIELDS if field != "response_json") + (
+        "_response_json",
+        "_response_body",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        status: int,
+        response_json: Any = None,
+        query: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        request_json: Any = None,
+        request_text: Optional[str] = None,
+        request_content_type: Optional[str] = None,
+        response_body: Union[str, bytes, None] = None,
+    ) -> None:
+        self.method = _intern(method)
+        self.path = _intern(path)
+        self.status = status
+        self._response_json = response_json
+        self._response_body = response_body
+        self.query = query if query is not None else {}
+        self.headers = {_intern(k): v for k, v in headers.items()} if headers else {}
+        self.request_json = request_json
+        self.request_text = request_text if request_json is None else None
+        self.request_content_type = _intern(request_content_type)
+
+    @property
+    def response_json(self) -> Any:
+        body = self._response_body
+        if body is not None:
+            self._response_json = _parse_json_body(body)
+            self._response_body = None
+        return self._response_json
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _ENTRY_FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in _ENTRY_FIELD_SET:
+            return default
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _ENTRY_FIELD_SET
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(ENTRY_FIELDS)
+
+    def __len__(self) -> int:
+        return len(ENTRY_FIELDS)
+
+    def keys(self) -> Tuple[str, ...]:
+        return ENTRY_FIELDS
+
+    def values(self) -> List[Any]:
+        return [getattr(self, key) for key in ENTRY_FIELDS]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(key, getattr(self, key)) for key in ENTRY_FIELDS]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in ENTRY_FIELDS}
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TrafficEntry):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TrafficEntry({self.to_dict()!r})"
+
+
+def format_suffix(path: Path) -> str:
+    suffixes = [s.lower() for s in path.suffixes]
+    if suffixes and suffixes[-1] == ".gz":
+        suffixes.pop()
+    return suffixes[-1] if suffixes else ""
+
+
+def _open_text(path: Path, encoding: str = "utf-8", errors: str = "strict") -> IO[str]:
+    if path.suffix.lower() == ".gz":
+        return gzip.open(path, "rt", encoding=encoding, errors=errors)
+    return path.open("r", encoding=encoding, errors=errors)
+
+
+def _open_binary(path: Path) -> IO[bytes]:
+    if path.suffix.lower() == ".gz":
+        return gzip.open(path, "rb")  # type: ignore[return-value]
+    return path.open("rb")
+
+
+def _read_text(path: Path, encoding: str = "utf-8", errors: str = "strict") -> str:
+    with _open_text(path, encoding=encoding, errors=errors) as fp:
+        return fp.read()
+
+
+def _open_stdin() -> IO[str]:
+    raw = sys.stdin.buffer
+    if not isinstance(raw, io.BufferedReader):
+        raw = io.BufferedReader(raw)  # type: ignore[arg-type]
+    if raw.peek(2)[:2] == _GZIP_MAGIC:
+        return io.TextIOWrapper(gzip.GzipFile(fileobj=raw), encoding="utf-8")
+    return io.TextIOWrapper(raw, encoding="utf-8")
+
 
 def _load_json_file(path: Path):
-    raw = path.read_text(encoding="utf-8")
+    raw = _read_text(path)
     return json.loads(raw)
 
 
@@ -32,7 +197,7 @@ def _normalize_query(query: Optional[Dict]) -> Dict:
     return query
 
 
-def _normalize_entry(entry: Dict) -> Optional[Dict]:
+def normalize_entry(entry: Dict) -> Optional[TrafficEntry]:
     try:
         method = entry["method"].upper()
         path = _normalize_path(entry["path"])
@@ -47,183 +212,484 @@ def _normalize_entry(entry: Dict) -> Optional[Dict]:
             sniffed = _sniff_json(request_text)
             if sniffed is not None:
                 request_json = sniffed
-        return {
-            "method": method,
-            "path": path,
-            "status": status,
-            "response_json": response_json,
-            "query": query,
-            "headers": headers,
-            "request_json": request_json,
-            "request_text": request_text,
-            "request_content_type": request_content_type,
-        }
+        return TrafficEntry(
+            method,
+            path,
+            status,
+            response_json,
+            query,
+            headers,
+            request_json,
+            request_text,
+            request_content_type,
+        )
     except Exception:
         return None
 
 
-def _parse_har(path: Path) -> List[Dict]:
-    data = _load_json_file(path)
-    log = data.get("log", {})
-    entries = log.get("entries", []) or []
-    normalized: List[Dict] = []
-
-    for entry in entries:
-        req = entry.get("request", {}) or {}
-        res = entry.get("response", {}) or {}
-        method = (req.get("method") or "").upper()
-        url = req.get("url") or ""
-        req_path = _normalize_path(urlparse(url).path or "/")
-        query = _parse_query(url)
-        status = res.get("status")
-        content = (res.get("content") or {})
-        text = content.get("text")
-        encoding = (content.get("encoding") or "").lower()
-        mime = (content.get("mimeType") or "").lower()
-        request_headers = _har_headers(req.get("headers"))
-        request_content_type = request_headers.get("content-type")
-        request_json, request_text = _parse_request_body(
-            req.get("postData"), request_content_type
-        )
-
-        response_json = None
-        if text and ("json" in mime):
+def normalize_har_entry(entry: Dict) -> Optional[TrafficEntry]:
+    if not isinstance(entry, dict):
+        return None
+    req = entry.get("request", {}) or {}
+    res = entry.get("response", {}) or {}
+    method = (req.get("method") or "").upper()
+    url = req.get("url") or ""
+    req_path = _normalize_path(urlparse(url).path or "/")
+    query = _parse_query(url)
+    status = res.get("status")
+    content = (res.get("content") or {})
+    text = content.get("text")
+    encoding = (content.get("encoding") or "").lower()
+    mime = (content.get("mimeType") or "").lower()
+    request_headers = _har_headers(req.get("headers"))
+    request_content_type = request_headers.get("content-type")
+    request_json, request_text = _parse_request_body(
+        req.get("postData"), request_content_type
+    )
+
+    response_body = None
+    if text and ("json" in mime):
+        # Parsed only if a schema check needs it (see TrafficEntry).
+        response_body = text
+        if encoding == "base64":
             try:
-                payload = text
-                if encoding == "base64":
-                    payload = base64.b64decode(text).decode("utf-8", errors="replace")
-                response_json = json.loads(payload)
+                response_body = base64.b64decode(text)
             except Exception:
-                response_json = None
-
-        if method and status is not None:
-            normalized.append(
-                {
-                    "method": method,
-                    "path": req_path,
-                    "status": int(status),
-                    "response_json": response_json,
-                    "query": query,
-                    "headers": request_headers,
-                    "request_json": request_json,
-                    "request_text": request_text,
-                    "request_content_type": request_content_type,
-                }
-            )
-
-    return normalized
-
-
-def _parse_curl_log(path: Path) -> List[Dict]:
-    text = path.read_text(encoding="utf-8", errors="replace")
-    lines = text.splitlines()
-
-    blocks: List[List[str]] = []
-    current: List[str] = []
-    for line in lines:
-        if line.strip().startswith("curl "):
-            if current:
-                blocks.append(current)
-            current = [line]
-        else:
-            if current:
-                current.append(line)
-    if current:
-        blocks.append(current)
+                response_body = None
 
-    normalized: List[Dict] = []
-    for block in blocks:
-        cmd = block[0]
-        body_lines = block[1:]
+    if not method or status is None:
+        return None
+    return TrafficEntry(
+        method,
+        req_path,
+        int(status),
+        None,
+        query,
+        request_headers,
+        request_json,
+        request_text,
+        request_content_type,
+        response_body,
+    )
+
+
+def _iter_har(path: Path) -> Iterator[TrafficEntry]:
+    with _open_text(path, encoding="utf-8-sig") as fp:
+        for entry in iter_array_items(fp, ("log", "entries")):
+            norm = normalize_har_entry(entry)
+            if norm:
+                yield norm
 
-        method = "GET"
-        url = None
-        try:
-            tokens = shlex.split(cmd)
-            for i, tok in enumerate(tokens):
-                if tok in {"-X", "--request"} and i + 1 < len(tokens):
-                    method = tokens[i + 1].upper()
-                if tok.startswith("http://") or tok.startswith("https://"):
-                    url = tok
-        except Exception:
-            continue
 
-        status = None
-        status_idx = None
-        for i, line in enumerate(body_lines):
-            match = re.search(r"(HTTPSTATUS|STATUS):\s*(\d{3})", line)
-            if match:
-                status = int(match.group(2))
-                status_idx = i
+def _parse_har(path: Path) -> List[TrafficEntry]:
+    return list(_iter_har(path))
 
-        if status is None or url is None:
-            continue
 
-        body = "\n".join(body_lines[:status_idx]).strip()
-        body = _strip_http_headers(body)
+def _iter_jsonl(fp: IO[str], on_error: Optional[LineErrorHandler] = None) -> Iterator[TrafficEntry]:
+    for lineno, line in enumerate(fp, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError as exc:
+            if on_error:
+                on_error(lineno, f"invalid JSON ({getattr(exc, 'msg', exc)})")
+            continue
+        norm = normalize_entry(entry) if isinstance(entry, dict) else None
+        if norm is None:
+            if on_error:
+                on_error(lineno, "not a traffic entry (needs method, path and status)")
+            continue
+        yield norm
+
+
+def _iter_jsonl_file(
+    path: Path, on_error: Optional[LineErrorHandler] = None
+) -> Iterator[TrafficEntry]:
+    if str(path) == STDIN_PATH:
+        yield from _iter_jsonl(_open_stdin(), on_error)
+        return
+    with _open_text(path) as fp:
+        yield from _iter_jsonl(fp, on_error)
+
+
+# POSIX shell words as shlex.split reads them: bare runs, '...', "..." with
+# \" and \\ escapes, and backslash-escaped characters, glued together.
+_SHELL_WORD = re.compile(r"""(?:[^ \t\r\n'"\\]+|'[^']*'|"(?:[^"\\]|\\.)*"|\\.)+""", re.S)
+_SHELL_PART = re.compile(r"""([^ \t\r\n'"\\]+)|'([^']*)'|"((?:[^"\\]|\\.)*)"|\\(.)""", re.S)
+_DQUOTE_ESCAPE = re.compile(r'\\([\\"])')
+
+
+def _split_command(cmd: str) -> List[str]:
+    # shlex.split walks the command a character at a time; the regexes give
+    # the same words for well-formed commands, and shlex still reports (by
+    # raising) anything they can't match, such as an unclosed quote.
+    words = []
+    pos = 0
+    for match in _SHELL_WORD.finditer(cmd):
+        if cmd[pos : match.start()].strip(" \t\r\n"):
+            return shlex.split(cmd)
+        pos = match.end()
+        word = []
+        for bare, single, double, escaped in _SHELL_PART.findall(match.group()):
+            word.append(_DQUOTE_ESCAPE.sub(r"\1", double) if double else bare or single or escaped)
+        words.append("".join(word))
+    if cmd[pos:].strip(" \t\r\n"):
+        return shlex.split(cmd)
+    return words
+
+
+class _CurlBlock:
+    # A ``curl ...`` command line and the raw output after it, kept as the
+    # line-aligned byte chunks it arrived in. The status marker and the body
+    # are found with bytes searches when the block closes, so the output is
+    # never split into lines. A body that can be JSON is kept as bytes and
+    # parsed on first use.
+    __slots__ = ("command", "chunks", "has_status")
+
+    def __init__(self, command: str) -> None:
+        self.command = command
+        self.chunks: List[bytes] = []
+        self.has_status = False
+
+    def add(self, data: bytes) -> None:
+        self.chunks.append(data)
+        if not self.has_status and b"STATUS" in data and _CURL_STATUS.search(data):
+            self.has_status = True
+
+    def _status_line(self) -> Optional[Tuple[int, int, int]]:
+        # The last line with a status marker wins. Chunks end on a line
+        # boundary, so each search stays inside one chunk.
+        chunks = self.chunks
+        for index in range(len(chunks) - 1, -1, -1):
+            chunk = chunks[index]
+            at = len(chunk)
+            while True:
+                at = chunk.rfind(b"STATUS", 0, at)
+                if at < 0:
+                    break
+                if _CURL_STATUS.match(chunk, at):
+                    line_start = chunk.rfind(b"\n", 0, at) + 1
+                    match = _CURL_STATUS.search(chunk, line_start, chunk.find(b"\n", at))
+                    return int(match.group(2)), index, line_start
+        return None
 
-        response_json = None
-        if body:
-            try:
-                response_json = json.loads(body)
-            except Exception:
-                response_json = None
+    def _response(self) -> Tuple[Optional[int], Optional[bytes]]:
+        # Positions are (chunk, offset) pairs into the raw chunks; only a body
+        # that can be JSON is joined. A "\r" left before a "\n" is JSON
+        # whitespace, so CRLF output needs no rewriting.
+        if not self.has_status:
+            return None, None
+        found = self._status_line()
+        if found is None:
+            return None, None
+        status, last_index, last = found
+        chunks = self.chunks
+        last -= 1  # last non-blank byte before the status line
+        while True:
+            chunk = chunks[last_index]
+            while last >= 0 and chunk[last] in _SPACE:
+                last -= 1
+            if last >= 0:
+                break
+            last_index -= 1
+            if last_index < 0:
+                return status, None
+            last = len(chunks[last_index]) - 1
+        first_index = 0
+        while True:
+            match = _NON_SPACE.search(chunks[first_index])
+            if match is not None:
+                first = match.start()
+                break
+            first_index += 1
+        # With `curl -i` the headers end at the first empty line.
+        start_index, start = first_index, chunks[first_index].rfind(b"\n", 0, first) + 1
+        index, pos = first_index, first
+        while index <= last_index:
+            chunk = chunks[index]
+            blank = _EMPTY_LINE.search(chunk, pos, last if index == last_index else len(chunk))
+            if blank is not None:
+                start_index, start = index, blank.end()
+                break
+            index, pos = index + 1, 0
+        index, pos = start_index, start
+        while True:
+            head = _NON_SPACE.search(chunks[index], pos)
+            if head is not None:
+                break
+            index, pos = index + 1, 0
+        if chunks[index][head.start()] not in _JSON_START:
+            return status, None
+        stop = chunks[last_index].find(b"\n", last)
+        if start_index == last_index:
+            return status, chunks[start_index][start:stop]
+        body = [chunks[start_index][start:]]
+        body.extend(chunks[start_index + 1 : last_index])
+        body.append(chunks[last_index][:stop])
+        return status, b"".join(body)
+
+    def entry(self) -> Optional[TrafficEntry]:
+        status, response_body = self._response()
+        if status is None:
+            return None
+        method = "GET"
+        url = None
+        try:
+            tokens = _split_command(self.command)
+        except ValueError:
+            return None
+        for i, tok in enumerate(tokens):
+            if tok in {"-X", "--request"} and i + 1 < len(tokens):
+                method = tokens[i + 1].upper()
+            if tok.startswith("http://") or tok.startswith("https://"):
+                url = tok
+        if url is None:
+            return None
 
         parsed = urlparse(url)
-        req_path = _normalize_path(parsed.path or "/")
-        query = _parse_query(url)
-
         headers, request_content_type = _parse_curl_headers(tokens)
         request_json, request_text = _parse_request_payload(tokens, request_content_type)
-
-        normalized.append(
-            {
-                "method": method,
-                "path": req_path,
-                "status": status,
-                "response_json": response_json,
-                "query": query,
-                "headers": headers,
-                "request_json": request_json,
-                "request_text": request_text,
-                "request_content_type": request_content_type,
-            }
+        return TrafficEntry(
+            method,
+            _normalize_path(parsed.path or "/"),
+            status,
+            None,
+            _parse_query(url),
+            headers,
+            request_json,
+            request_text,
+            request_content_type,
+            response_body,
         )
 
-    return normalized
-
-
-def _strip_http_headers(text: str) -> str:
-    if "\r\n\r\n" in text:
-        return text.split("\r\n\r\n", 1)[1].strip()
-    if "\n\n" in text:
-        return text.split("\n\n", 1)[1].strip()
-    return text
 
-
-def load_traffic(path: Union[str, Path]) -> List[Dict]:
+def _iter_curl_log(path: Path) -> Iterator[TrafficEntry]:
+    found = False
+    with _open_binary(path) as fp:
+        for entry in _feed(fp, IncrementalReader("curl")):
+            found = True
+            yield entry
+    if not found:
+        raise ValueError("Unsupported traffic format")
+
+
+class IncrementalReader:
+    # Parses JSON Lines ("jsonl") or curl logs ("curl") from raw bytes fed in
+    # arbitrary chunks. ``offset`` is the byte position just past the last
+    # entry handed out (or line skipped) and ``line`` the line count there, so
+    # a later run can seek to ``offset`` and carry on.
+    def __init__(
+        self,
+        kind: str,
+        offset: int = 0,
+        line: int = 0,
+        on_error: Optional[LineErrorHandler] = None,
+    ) -> None:
+        if kind not in ("jsonl", "curl"):
+            raise ValueError(f"unknown incremental format {kind!r}")
+        self.kind = kind
+        self.offset = offset
+        self.line = line
+        self.on_error = on_error
+        # Pieces of an unterminated line; joined once its newline arrives, so
+        # a line spanning many chunks is copied once, not once per chunk.
+        self._pending: List[bytes] = []
+        self._pos = offset  # byte position where the pending line starts
+        self._lineno = line
+        self._block: Optional[_CurlBlock] = None
+
+    def feed(self, data: bytes) -> Iterator[TrafficEntry]:
+        cut = data.rfind(b"\n") + 1
+        if not cut:
+            if data:
+                self._pending.append(data)
+            return
+        if self._pending:
+            self._pending.append(data[:cut])
+            complete = b"".join(self._pending)
+            self._pending = []
+        else:
+            complete = data[:cut]
+        if cut < len(data):
+            self._pending.append(data[cut:])
+        if self.kind == "curl":
+            yield from self._curl(complete, len(complete))
+            return
+        for raw in complete.split(b"\n")[:-1]:
+            yield from self._line(raw, self._pos + len(raw) + 1)
+            self._pos += len(raw) + 1
+
+    def flush(self, final: bool = True) -> Iterator[TrafficEntry]:
+        # At end of input. With final=False the input may still be growing: an
+        # unterminated last line is only taken if it is already a whole JSON
+        # entry, and a curl block only once its status marker is in.
+        if self._pending and (final or self.kind == "jsonl"):
+            tail = b"".join(self._pending)
+            if final or self._complete_json(tail):
+                self._pending = []
+                if self.kind == "curl":
+                    yield from self._curl(tail + b"\n", len(tail))
+                else:
+                    yield from self._line(tail, self._pos + len(tail))
+                    self._pos += len(tail)
+        block = self._block
+        if block is not None and (final or (block.has_status and not self._pending)):
+            yield from self._close_block(self._pos, self._lineno)
+
+    @staticmethod
+    def _complete_json(raw: bytes) -> bool:
+        try:
+            return isinstance(json.loads(raw), dict)
+        except ValueError:
+            return False
+
+    def _line(self, raw: bytes, end: int) -> Iterator[TrafficEntry]:
+        self._lineno += 1
+        entry = self._jsonl_entry(raw, self._lineno)
+        self.offset, self.line = end, self._lineno
+        if entry is not None:
+            yield entry
+
+    def _curl(self, data: bytes, size: int) -> Iterator[TrafficEntry]:
+        # ``data`` is whole lines; ``size`` excludes a newline added to an
+        # unterminated last line.
+        pos = 0
+        at = data.find(b"curl ")
+        while at >= 0:
+            # Only lines mentioning "curl " are decoded, and a command line is
+            # any line that starts with it once stripped.
+            start = data.rfind(b"\n", 0, at) + 1
+            stop = data.index(b"\n", at)
+            command = data[start:stop].decode("utf-8", errors="replace").rstrip("\r")
+            if command.strip().startswith("curl "):
+                self._curl_output(data[pos:start], start)
+                if self._block is not None:
+                    yield from self._close_block(self._pos + start, self._lineno)
+                pos = stop + 1
+                self._block = _CurlBlock(command)
+                self._lineno += 1
+            at = data.find(b"curl ", stop + 1)
+        self._curl_output(data[pos:], size)
+        self._pos += size
+
+    def _curl_output(self, data: bytes, end: int) -> None:
+        if not data:
+            return
+        self._lineno += data.count(b"\n")
+        if self._block is not None:
+            self._block.add(data)
+        else:
+            self.offset, self.line = self._pos + end, self._lineno
+
+    def _close_block(self, end: int, lineno: int) -> Iterator[TrafficEntry]:
+        block, self._block = self._block, None
+        entry = block.entry() if block is not None else None
+        self.offset, self.line = end, lineno
+        if entry is not None:
+            yield entry
+
+    def _jsonl_entry(self, raw: bytes, lineno: int) -> Optional[TrafficEntry]:
+        if not raw.strip():
+            return None
+        try:
+            entry = json.loads(raw)
+        except ValueError as exc:
+            if self.on_error:
+                self.on_error(lineno, f"invalid JSON ({getattr(exc, 'msg', exc)})")
+            return None
+        norm = normalize_entry(entry) if isinstance(entry, dict) else None
+        if norm is None and self.on_error:
+            self.on_error(lineno, "not a traffic entry (needs method, path and status)")
+        return norm
+
+
+def _feed(fp: IO[bytes], reader: IncrementalReader, final: bool = True) -> Iterator[TrafficEntry]:
+    while True:
+        data = fp.read(READ_CHUNK_SIZE)
+        if not data:
+            break
+        yield from reader.feed(data)
+    yield from reader.flush(final)
+
+
+def incremental_format(path: Union[str, Path]) -> str:
+    # Formats IncrementalReader can parse from a byte offset.
+    if str(path) == STDIN_PATH:
+        raise ValueError("stdin can't be read incrementally; pass a traffic file")
+    p = Path(path)
+    with open(p, "rb") as fp:
+        if fp.read(2) == _GZIP_MAGIC:
+            raise ValueError("gzip-compressed traffic can't be read incrementally; use the plain file")
+    suffix = p.suffix.lower()
+    if suffix in JSONL_SUFFIXES:
+        return "jsonl"
+    # Other suffixes are sniffed like iter_traffic does, so a JSON document
+    # saved as .log isn't mistaken for an empty curl log.
+    if suffix in (".har", ".json") or _starts_like_json(p):
+        raise ValueError("only JSON Lines and curl logs can be read incrementally, not HAR or JSON documents")
+    return "curl"
+
+
+def iter_traffic_from(
+    path: Union[str, Path], reader: IncrementalReader, final: bool = True
+) -> Iterator[TrafficEntry]:
+    with open(path, "rb") as fp:
+        fp.seek(reader.offset)
+        yield from _feed(fp, reader, final)
+
+
+def _starts_like_json(path: Path) -> bool:
+    # Only files that open like a JSON document are read whole; anything else
+    # is streamed as a curl log.
+    with _open_binary(path) as fp:
+        while True:
+            data = fp.read(READ_CHUNK_SIZE)
+            head = data.lstrip()
+            if head or not data:
+                return head[:1] in (b"[", b"{")
+
+
+def load_traffic(
+    path: Union[str, Path], on_error: Optional[LineErrorHandler] = None
+) -> List[TrafficEntry]:
     p = Path(path)
-    if p.suffix.lower() == ".har":
+    fmt = format_suffix(p)
+    if fmt == ".har":
         return _parse_har(p)
+    if fmt in JSONL_SUFFIXES or str(path) == STDIN_PATH:
+        return list(_iter_jsonl_file(p, on_error))
 
-    try:
-        data = _load_json_file(p)
-    except Exception:
-        data = None
+    if _starts_like_json(p):
+        try:
+            data = _load_json_file(p)
+        except Exception:
+            data = None
 
-    if isinstance(data, list):
-        normalized = []
-        for entry in data:
-            norm = _normalize_entry(entry)
-            if norm:
-                normalized.append(norm)
-        return normalized
+        if isinstance(data, list):
+            normalized = []
+            for entry in data:
+                norm = normalize_entry(entry)
+                if norm:
+                    normalized.append(norm)
+            return normalized
+
+    return list(_iter_curl_log(p))
 
-    curl_items = _parse_curl_log(p)
-    if curl_items:
-        return curl_items
 
-    raise ValueError("Unsupported traffic format")
+def iter_traffic(
+    path: Union[str, Path], on_error: Optional[LineErrorHandler] = None
+) -> Iterator[TrafficEntry]:
+    p = Path(path)
+    fmt = format_suffix(p)
+    if fmt == ".har":
+        return _iter_har(p)
+    if fmt in JSONL_SUFFIXES or str(path) == STDIN_PATH:
+        return _iter_jsonl_file(p, on_error)
+    if _starts_like_json(p):
+        return iter(load_traffic(p))
+    return _iter_curl_log(p)
 
 
 def _normalize_path(path: str) -> str:
@@ -1,77 +1,27 @@
 import json
-from typing import Dict, List, Optional, Tuple, Union
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from jsonschema import Draft7Validator
-
-from .openapi import resolve_operation, resolve_schema
-
-
-def _openapi_schema_to_jsonschema(schema: Dict) -> Dict:
-    if not isinstance(schema, dict):
-        return {}
-
-    schema = dict(schema)
-
-    if schema.get("nullable") is True:
-        schema.pop("nullable", None)
-        return {"anyOf": [schema, {"type": "null"}]}
-
-    if "properties" in schema and "type" not in schema:
-        schema["type"] = "object"
-
-    return schema
-
-
-def _pick_json_schema_from_content(content: Dict) -> Optional[Dict]:
-    if not isinstance(content, dict):
-        return None
-
-    app_json = content.get("application/json") or {}
-    if isinstance(app_json, dict) and app_json.get("schema") is not None:
-        return app_json.get("schema")
-
-    for ctype, item in content.items():
-        if not isinstance(ctype, str) or not isinstance(item, dict):
-            continue
-        ctype_l = ctype.lower()
-        if "json" in ctype_l:
-            schema = item.get("schema")
-            if schema is not None:
-                return schema
-    return None
-
-
-def _pick_response_schema(operation: Dict, status: int) -> Optional[Dict]:
-    responses = operation.get("responses", {}) or {}
-    status_key = str(status)
-    response = responses.get(status_key)
-    if not response:
-        status_class = f"{str(status)[0]}XX" if status >= 100 else None
-        if status_class:
-            response = responses.get(status_class)
-    if not response:
-        response = responses.get("default")
-    if not response:
-        return None
-
-    content = response.get("content", {}) or {}
-    return _pick_json_schema_from_content(content)
-
-
-def _merge_parameters(path_item: Optional[Dict], operation: Dict) -> List[Dict]:
-    params: Dict[Tuple[str, str], Dict] = {}
-    for source in (path_item, operation):
-        if not isinstance(source, dict):
-            continue
-        for item in (source.get("parameters") or []):
-            if not isinstance(item, dict):
-                continue
-            name = item.get("name")
-            loc = item.get("in")
-            if not name or not loc:
-                continue
-            params[(name, loc)] = item
-    return list(params.values())
+from jsonschema.exceptions import best_match
+
+from .compiled import (  # noqa: F401 - re-exported for existing imports
+    CompiledSpec,
+    ParamPlan,
+    _merge_parameters,
+    _openapi_schema_to_jsonschema,
+    pick_json_schema_from_content as _pick_json_schema_from_content,
+    _pick_response_schema,
+    _resolve_schema_cached,
+    _validator_for_schema,
+    compile_spec,
+)
+from .errorstore import DEFAULT_MAX_EXAMPLES, ErrorStore, GroupKey, group_key_str
+from .memo import ValidationCache
+from .profiling import Profiler
+
+if TYPE_CHECKING:
+    from .multifile import TrafficFiles
 
 
 def _coerce_value(
@@ -108,29 +58,95 @@ def _coerce_value(
     return value
 
 
+MAX_ERROR_TEXT = 300
+MAX_INSTANCE_TEXT = 120
+
+
+def _truncate(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    return text[: limit - 3] + "..."
+
+
+def _json_path(parts: Iterable[object]) -> str:
+    out = "$"
+    for part in parts:
+        if isinstance(part, int):
+            out += f"[{part}]"
+        else:
+            out += f".{part}"
+    return out
+
+
+def _exception_text(exc: Exception) -> str:
+    return _truncate(f"{type(exc).__name__}: {exc}", MAX_ERROR_TEXT)
+
+
+class SchemaFailure:
+    __slots__ = ("validator", "instance", "_detail")
+
+    def __init__(
+        self, validator: Optional[Draft7Validator], instance: object, error: Optional[str] = None
+    ) -> None:
+        self.validator = validator
+        self.instance = instance
+        # Known up front when the schema itself is broken (e.g. an unresolvable $ref).
+        self._detail = None if error is None else {"error": error, "path": "$", "validator": ""}
+
+    def detail(self) -> Dict[str, str]:
+        # Only failures that end up in the report pay for jsonschema's error objects,
+        # whose messages embed a repr of the (possibly huge) failing instance.
+        if self._detail is None:
+            error = None
+            message = "schema validation failed"
+            if self.validator is not None:
+                try:
+                    error = best_match(self.validator.iter_errors(self.instance))
+                except Exception as exc:
+                    message = _exception_text(exc)
+            if error is None:
+                self._detail = {"error": message, "path": "$", "validator": ""}
+            else:
+                try:
+                    instance_text = json.dumps(error.instance, ensure_ascii=False, default=repr)
+                except Exception:
+                    instance_text = repr(error.instance)
+                self._detail = {
+                    "error": _truncate(error.message, MAX_ERROR_TEXT),
+                    "path": _json_path(error.absolute_path),
+                    "validator": str(error.validator),
+                    "instance": _truncate(instance_text, MAX_INSTANCE_TEXT),
+                }
+            self.validator = None
+            self.instance = None
+        return self._detail
+
+    def describe(self) -> str:
+        detail = self.detail()
+        return f"{detail['error']} (at {detail['path']}, validator: {detail['validator']})"
+
+    def __getstate__(self) -> Dict[str, str]:
+        return self.detail()
+
+    def __setstate__(self, state: Dict[str, str]) -> None:
+        self.validator = None
+        self.instance = None
+        self._detail = state
+
+
 def _validate_param(
-    spec: Dict,
-    param: Dict,
-    value: Optional[Union[str, List[str]]],
-    cache_resolved: Dict[str, Dict],
-    cache_validator: Dict[str, Draft7Validator],
-) -> Optional[str]:
-    schema = param.get("schema")
-    if not isinstance(schema, dict):
-        return None
-    validator = _validator_for_schema(
-        spec, schema, cache_resolved=cache_resolved, cache_validator=cache_validator
-    )
+    param: ParamPlan, value: Optional[Union[str, List[str]]]
+) -> Optional[SchemaFailure]:
+    validator = param.validator
     if validator is None:
         return None
     coerced = _coerce_value(value, validator.schema)
     try:
-        validator.validate(coerced)
+        if validator.is_valid(coerced):
+            return None
     except Exception as exc:
-        name = param.get("name") or "param"
-        loc = param.get("in") or "param"
-        return f"Invalid {loc} parameter '{name}': {exc}"
-    return None
+        return SchemaFailure(None, None, _exception_text(exc))
+    return SchemaFailure(validator, coerced)
 
 
 def _default_hint(key: str) -> Optional[str]:
@@ -155,76 +171,106 @@ def _default_hint(key: str) -> Optional[str]:
     return None
 
 
-def _resolve_schema_cached(
-    spec: Dict, schema: Optional[Dict], cache: Dict[str, Dict]
-) -> Optional[Dict]:
-    if not isinstance(schema, dict):
-        return schema
-    ref = schema.get("$ref")
-    if isinstance(ref, str):
-        if ref in cache:
-            return cache[ref]
-        resolved = resolve_schema(spec, schema)
-        if isinstance(resolved, dict):
-            cache[ref] = resolved
-        return resolved
-    return schema
-
-
-def _validator_for_schema(
-    spec: Dict,
-    schema: Optional[Dict],
-    cache_resolved: Optional[Dict[str, Dict]] = None,
-    cache_validator: Optional[Dict[str, Draft7Validator]] = None,
-) -> Optional[Draft7Validator]:
-    if not isinstance(schema, dict):
-        return None
-    if cache_resolved is None:
-        cache_resolved = {}
-    if cache_validator is None:
-        cache_validator = {}
-    resolved = _resolve_schema_cached(spec, schema, cache_resolved)
-    jsonschema = _openapi_schema_to_jsonschema(resolved or {})
+def _check_schema(
+    validator: Draft7Validator,
+    instance: object,
+    cache: Optional[ValidationCache],
+    scope: Tuple[int, Optional[int]],
+    profiler: Optional[Profiler] = None,
+    label: str = "",
+) -> Optional[SchemaFailure]:
+    if profiler is not None:
+        start = time.perf_counter()
+        failure = _check_schema(validator, instance, cache, scope)
+        profiler.add_schema(label, time.perf_counter() - start)
+        return failure
     try:
-        key = json.dumps(jsonschema, sort_keys=True, separators=(",", ":"))
-    except Exception:
-        key = repr(jsonschema)
-    validator = cache_validator.get(key)
-    if validator is None:
-        validator = Draft7Validator(jsonschema)
-        cache_validator[key] = validator
-    return validator
-
-
-def validate_traffic_against_spec(
-    spec: Dict,
-    traffic: List[Dict],
-    max_errors: Optional[int] = None,
-    ignore_unknown: bool = False,
-) -> Dict:
-    errors: List[str] = []
-    grouped: Dict[str, List[str]] = {}
-    error_details: List[Dict[str, str]] = []
-    total = 0
-    stopped_early = False
-    schema_cache: Dict[str, Dict] = {}
-    validator_cache: Dict[str, Draft7Validator] = {}
-
-    def _add_error(key: str, message: str, hint: Optional[str] = None):
-        errors.append(message)
-        grouped.setdefault(key, []).append(message)
-        hint = hint or _default_hint(key)
-        detail = {"key": key, "message": message}
+        if cache is None:
+            valid = validator.is_valid(instance)
+        else:
+            key = cache.key(scope, instance)
+            found, valid = cache.get(key)
+            if not found:
+                valid = validator.is_valid(instance)
+                cache.put(key, valid)
+    except Exception as exc:
+        return SchemaFailure(None, None, _exception_text(exc))
+    if valid:
+        return None
+    return SchemaFailure(validator, instance)
+
+
+def _schema_label(schema: Optional[Dict], fallback: str) -> str:
+    if isinstance(schema, dict) and isinstance(schema.get("$ref"), str):
+        return schema["$ref"]
+    return fallback
+
+
+class Finding:
+    __slots__ = ("entry", "group", "failure", "suffix", "_message")
+
+    def __init__(
+        self,
+        entry: int,
+        group: GroupKey,
+        message: str,
+        failure: Optional[SchemaFailure] = None,
+        suffix: str = "",
+    ) -> None:
+        self.entry = entry
+        self.group = group
+        self.failure = failure
+        self.suffix = suffix
+        self._message = message
+
+    @property
+    def key(self) -> str:
+        return group_key_str(self.group)
+
+    @property
+    def message(self) -> str:
+        if self.failure is None:
+            return self._message
+        return f"{self._message}: {self.failure.describe()}{self.suffix}"
+
+    def detail(self) -> Dict[str, str]:
+        key = self.key
+        detail = {"key": key, "message": self.message}
+        if self.failure is not None:
+            for field, value in self.failure.detail().items():
+                if field != "error":
+                    detail[field] = value
+        hint = _default_hint(key)
         if hint:
             detail["hint"] = hint
-        error_details.append(detail)
+        return detail
+
+    def strip(self) -> None:
+        # Count-only: drop everything needed to render the message.
+        self.failure = None
+        self.suffix = ""
+        self._message = ""
+
+    def __repr__(self) -> str:
+        return f"Finding(entry={self.entry!r}, key={self.key!r}, message={self.message!r})"
 
-    for entry in traffic:
-        total += 1
+
+def iter_validate(
+    spec: Union[Dict, CompiledSpec],
+    entries: Iterable[Dict],
+    ignore_unknown: bool = False,
+    cache: Optional[ValidationCache] = None,
+    profiler: Optional[Profiler] = None,
+) -> Iterator[Finding]:
+    compiled = compile_spec(spec)
+
+    for index, entry in enumerate(entries):
+        if profiler is not None:
+            profiler.mark("routing")
+            profiler.begin_operation(None)
         method = entry.get("method")
         path = entry.get("path")
         status = entry.get("status")
-        response_json = entry.get("response_json")
         query = entry.get("query") or {}
         headers = entry.get("headers") or {}
         request_json = entry.get("request_json")
@@ -232,149 +278,223 @@ def validate_traffic_against_spec(
         request_content_type = entry.get("request_content_type")
 
         if not isinstance(method, str) or not isinstance(path, str):
-            _add_error(
-                "operation.invalid_traffic_entry",
+            yield Finding(
+                index,
+                ("operation.invalid_traffic_entry",),
                 f"Invalid traffic entry method/path: {method} {path}",
             )
-            if max_errors and len(errors) >= max_errors:
-                stopped_early = True
-                break
             continue
 
         if not isinstance(status, int):
-            _add_error(
-                f"response.invalid_status|{method}|{path}",
+            yield Finding(
+                index,
+                ("response.invalid_status", method, path),
                 f"Invalid status for {method} {path}: {status}",
             )
-            if max_errors and len(errors) >= max_errors:
-                stopped_early = True
-                break
             continue
 
-        op, template, path_item, path_params = resolve_operation(spec, path, method)
-        if not op:
+        plan, template, path_params = compiled.resolve(path, method)
+        if plan is None:
             if not ignore_unknown:
-                _add_error("operation.missing", f"No operation for {method} {path}")
-            if max_errors and len(errors) >= max_errors:
-                stopped_early = True
-                break
+                yield Finding(index, ("operation.missing",), f"No operation for {method} {path}")
             continue
 
         group_path = template or path or ""
-        params = _merge_parameters(path_item, op)
-        for param in params:
-            name = param.get("name")
-            loc = param.get("in")
-            required = bool(param.get("required"))
-            if not name or not loc:
-                continue
-            value = None
-            if loc == "path":
-                value = path_params.get(name)
-            elif loc == "query":
-                value = query.get(name)
-            elif loc == "header":
-                value = headers.get(str(name).lower())
+        if profiler is not None:
+            profiler.begin_operation(f"{method} {group_path}")
+            profiler.mark("params")
+        for param in plan.params:
+            if param.loc == "path":
+                value = path_params.get(param.lookup)
+            elif param.loc == "query":
+                value = query.get(param.lookup)
             else:
-                continue
+                value = headers.get(param.lookup)
 
             if value is None:
-                if required:
-                    _add_error(
-                        f"request.param.missing|{method}|{group_path}",
-                        f"Missing {loc} parameter '{name}' for {method} {group_path}",
+                if param.required:
+                    yield Finding(
+                        index,
+                        ("request.param.missing", method, group_path),
+                        f"Missing {param.loc} parameter '{param.name}' for {method} {group_path}",
                     )
                 continue
 
-            err = _validate_param(spec, param, value, schema_cache, validator_cache)
-            if err:
-                _add_error(
-                    f"request.param.invalid|{method}|{group_path}",
-                    f"{err} for {method} {group_path}",
+            failure = _validate_param(param, value)
+            if failure is not None:
+                yield Finding(
+                    index,
+                    ("request.param.invalid", method, group_path),
+                    f"Invalid {param.loc} parameter '{param.name}'",
+                    failure,
+                    f" for {method} {group_path}",
                 )
-            if max_errors and len(errors) >= max_errors:
-                stopped_early = True
-                break
-        if stopped_early:
-            break
 
-        request_body = op.get("requestBody")
-        if isinstance(request_body, dict):
-            required = bool(request_body.get("required"))
-            content = request_body.get("content", {}) or {}
-            schema = _pick_json_schema_from_content(content)
+        if profiler is not None:
+            profiler.mark("request_body")
+        if plan.has_request_body:
             is_json = False
             if request_content_type:
                 is_json = "json" in str(request_content_type).lower()
             if request_json is not None:
                 is_json = True
 
-            if required and request_json is None and request_text is None:
-                _add_error(
-                    f"request.body.missing|{method}|{group_path}",
+            if plan.body_required and request_json is None and request_text is None:
+                yield Finding(
+                    index,
+                    ("request.body.missing", method, group_path),
                     f"Missing request body for {method} {group_path}",
                 )
-            elif schema is not None and is_json:
-                validator = _validator_for_schema(
-                    spec, schema, cache_resolved=schema_cache, cache_validator=validator_cache
-                )
+            elif plan.body_schema is not None and is_json:
                 if request_json is None and request_text is not None:
-                    _add_error(
-                        f"request.body.invalid_json|{method}|{group_path}",
+                    yield Finding(
+                        index,
+                        ("request.body.invalid_json", method, group_path),
                         f"Invalid JSON request body for {method} {group_path}",
                     )
-                else:
-                    try:
-                        if validator is not None:
-                            validator.validate(request_json)
-                    except Exception as exc:
-                        _add_error(
-                            f"request.body.schema|{method}|{group_path}",
-                            f"Request body schema mismatch for {method} {group_path}: {exc}",
+                elif plan.body_validator is not None:
+                    failure = _check_schema(
+                        plan.body_validator,
+                        request_json,
+                        cache,
+                        (id(plan), None),
+                        profiler,
+                        _schema_label(plan.body_schema, f"{method} {group_path} request body")
+                        if profiler is not None
+                        else "",
+                    )
+                    if failure is not None:
+                        yield Finding(
+                            index,
+                            ("request.body.schema", method, group_path),
+                            f"Request body schema mismatch for {method} {group_path}",
+                            failure,
                         )
-            elif request_json is not None and schema is None:
-                _add_error(
-                    f"request.body.schema_missing|{method}|{group_path}",
+            elif request_json is not None and plan.body_schema is None:
+                yield Finding(
+                    index,
+                    ("request.body.schema_missing", method, group_path),
                     f"No request schema for {method} {group_path}",
                 )
-            if max_errors and len(errors) >= max_errors:
-                stopped_early = True
-                break
 
-        schema = _pick_response_schema(op, status)
-        if not schema:
-            if response_json is None and status in {204, 304}:
+        if profiler is not None:
+            profiler.mark("response")
+        has_schema, validator = plan.response_validator(status)
+        if not has_schema:
+            if status in {204, 304} and entry.get("response_json") is None:
                 continue
-            _add_error(
-                f"response.schema_missing|{method}|{group_path}|{status}",
+            yield Finding(
+                index,
+                ("response.schema_missing", method, group_path, status),
                 f"No response schema for {method} {group_path} {status}",
             )
-            if max_errors and len(errors) >= max_errors:
-                stopped_early = True
-                break
             continue
 
-        validator = _validator_for_schema(
-            spec, schema, cache_resolved=schema_cache, cache_validator=validator_cache
+        if validator is None:
+            continue
+        # Read only now: HAR and curl bodies are parsed on first access.
+        response_json = entry.get("response_json")
+        failure = _check_schema(
+            validator,
+            response_json,
+            cache,
+            (id(plan), status),
+            profiler,
+            _schema_label(_pick_response_schema(plan.op, status), f"{method} {group_path} {status} response")
+            if profiler is not None
+            else "",
         )
-
-        try:
-            if validator is not None:
-                validator.validate(response_json)
-        except Exception as exc:
-            _add_error(
-                f"response.schema_mismatch|{method}|{group_path}|{status}",
-                f"Schema mismatch for {method} {group_path} {status}: {exc}",
+        if failure is not None:
+            yield Finding(
+                index,
+                ("response.schema_mismatch", method, group_path, status),
+                f"Schema mismatch for {method} {group_path} {status}",
+                failure,
             )
-            if max_errors and len(errors) >= max_errors:
-                stopped_early = True
-                break
-
-    return {
-        "total_checks": total,
-        "error_count": len(errors),
-        "errors": errors,
-        "errors_grouped": grouped,
-        "error_details": error_details,
-        "stopped_early": stopped_early,
-    }
+
+
+class ValidationSummary:
+    def __init__(
+        self,
+        max_errors: Optional[int] = None,
+        max_examples: Optional[int] = DEFAULT_MAX_EXAMPLES,
+        files: Optional["TrafficFiles"] = None,
+    ) -> None:
+        self.max_errors = max_errors
+        self.total_checks = 0
+        self.stopped_early = False
+        self.store = ErrorStore(max_examples=max_examples)
+        self.files = files
+
+    def count(self, entries: Iterable[Dict]) -> Iterator[Dict]:
+        for entry in entries:
+            self.total_checks += 1
+            yield entry
+
+    def add(self, finding: Finding) -> bool:
+        # Past the per-group example cap a finding is only counted, never rendered.
+        detail = finding.detail() if self.store.wants_example(finding.group) else None
+        self.store.add(finding.group, finding.entry, detail)
+        if self.files is not None:
+            self.files.add(finding.entry, finding.group)
+        if self.max_errors and self.store.total >= self.max_errors:
+            self.stopped_early = True
+        return self.stopped_early
+
+    def result(self) -> Dict:
+        result = {"total_checks": self.total_checks}
+        result.update(self.store.result_fields())
+        result["stopped_early"] = self.stopped_early
+        if self.files is not None:
+            result["files"] = self.files.result(self.total_checks)
+        return result
+
+
+def summarize_findings(
+    findings: Iterable[Finding],
+    total_checks: int,
+    max_errors: Optional[int] = None,
+    max_examples: Optional[int] = DEFAULT_MAX_EXAMPLES,
+) -> Dict:
+    summary = ValidationSummary(max_errors=max_errors, max_examples=max_examples)
+    summary.total_checks = total_checks
+    for finding in findings:
+        if summary.add(finding):
+            summary.total_checks = min(total_checks, finding.entry + 1)
+            break
+    return summary.result()
+
+
+def validate_traffic_against_spec(
+    spec: Union[Dict, CompiledSpec],
+    traffic: Iterable[Dict],
+    max_errors: Optional[int] = None,
+    ignore_unknown: bool = False,
+    cache: Optional[ValidationCache] = None,
+    max_examples: Optional[int] = DEFAULT_MAX_EXAMPLES,
+    profiler: Optional[Profiler] = None,
+    files: Optional["TrafficFiles"] = None,
+) -> Dict:
+    summary = ValidationSummary(max_errors=max_errors, max_examples=max_examples, files=files)
+    entries = summary.count(traffic)
+    if profiler is not None:
+        entries = profiler.iter_phase("traffic_load", entries)
+    findings = iter_validate(
+        spec, entries, ignore_unknown=ignore_unknown, cache=cache, profiler=profiler
+    )
+    for finding in findings:
+        if profiler is None:
+            stop = summary.add(finding)
+        else:
+            previous = profiler.mark("reporting")
+            stop = summary.add(finding)
+            profiler.mark(previous)
+        if stop:
+            break
+    if profiler is not None:
+        profiler.mark("reporting")
+        profiler.begin_operation(None)
+    result = summary.result()
+    if cache is not None:
+        result["cache"] = cache.stats()
+    return result
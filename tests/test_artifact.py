@@ -0,0 +1,141 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+from contract_tester import cli
+from contract_tester.artifact import ARTIFACT_FORMAT, load_compiled_spec, write_artifact
+from contract_tester.openapi import ARTIFACT_KEY, load_spec
+from contract_tester.validate import validate_traffic_against_spec
+
+
+class TestArtifact(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.spec = {
+            "openapi": "3.0.0",
+            "components": {
+                "schemas": {
+                    "User": {
+                        "type": "object",
+                        "properties": {"id": {"type": "integer"}},
+                        "required": ["id"],
+                    }
+                }
+            },
+            "paths": {
+                "/users/{user_id}": {
+                    "get": {
+                        "responses": {
+                            "200": {
+                                "content": {
+                                    "application/json": {"schema": {"$ref": "#/components/schemas/User"}}
+                                }
+                            }
+                        }
+                    }
+                },
+                "/users/me": {
+                    "get": {
+                        "responses": {
+                            "200": {"content": {"application/json": {"schema": {"type": "object"}}}}
+                        }
+                    }
+                },
+            },
+        }
+        self.spec_path = self.dir / "api.yaml"
+        self.spec_path.write_text(yaml.safe_dump(self.spec, sort_keys=False), encoding="utf-8")
+        self.traffic = [
+            {"method": "GET", "path": "/users/1", "status": 200, "response_json": {"id": 1}},
+            {"method": "GET", "path": "/users/2", "status": 200, "response_json": {"id": "x"}},
+            {"method": "GET", "path": "/users/me", "status": 200, "response_json": {}},
+        ]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_artifact_contents(self):
+        data = write_artifact(self.spec_path)
+        out = self.dir / "api.ctspec.json"
+        self.assertTrue(out.is_file())
+        self.assertEqual(json.loads(out.read_text(encoding="utf-8")), data)
+        self.assertEqual(data[ARTIFACT_KEY], ARTIFACT_FORMAT)
+        self.assertEqual(data["source"]["path"], "api.yaml")
+        self.assertEqual(data["routes"], ["/users/{user_id}", "/users/me"])
+        self.assertEqual(set(data["schemas"]), {"#/components/schemas/User"})
+
+    def test_validation_matches_source_spec(self):
+        out = self.dir / "api.ctspec.json"
+        write_artifact(self.spec_path, out)
+        expected = validate_traffic_against_spec(load_spec(self.spec_path), self.traffic)
+        self.assertEqual(validate_traffic_against_spec(load_compiled_spec(out), self.traffic), expected)
+        self.assertEqual(validate_traffic_against_spec(load_spec(out), self.traffic), expected)
+        self.assertEqual(expected["error_count"], 1)
+
+    def test_plain_json_spec_is_parsed_once(self):
+        spec_json = self.dir / "api.json"
+        spec_json.write_text(json.dumps(self.spec), encoding="utf-8")
+        with patch("json.loads", wraps=json.loads) as loads:
+            compiled = load_compiled_spec(spec_json)
+        self.assertEqual(compiled.spec, self.spec)
+        self.assertEqual(loads.call_count, 1)
+
+    def test_stale_artifact_is_rebuilt(self):
+        out = self.dir / "api.ctspec.json"
+        write_artifact(self.spec_path, out)
+        self.spec["paths"]["/teams"] = {"get": {"responses": {"200": {"description": "ok"}}}}
+        self.spec_path.write_text(yaml.safe_dump(self.spec, sort_keys=False), encoding="utf-8")
+
+        compiled = load_compiled_spec(out)
+        self.assertIn("/teams", compiled.spec["paths"])
+        rewritten = json.loads(out.read_text(encoding="utf-8"))
+        self.assertIn("/teams", rewritten["routes"])
+
+    def test_unsupported_format_without_source(self):
+        out = self.dir / "api.ctspec.json"
+        data = write_artifact(self.spec_path, out)
+        data[ARTIFACT_KEY] = ARTIFACT_FORMAT + 1
+        out.write_text(json.dumps(data), encoding="utf-8")
+        self.assertTrue(load_compiled_spec(out).spec["paths"])
+        self.assertEqual(json.loads(out.read_text(encoding="utf-8"))[ARTIFACT_KEY], ARTIFACT_FORMAT)
+
+        out.write_text(json.dumps(data), encoding="utf-8")
+        os.remove(self.spec_path)
+        with self.assertRaises(ValueError):
+            load_compiled_spec(out)
+
+    def test_artifact_works_without_source(self):
+        out = self.dir / "api.ctspec.json"
+        write_artifact(self.spec_path, out)
+        os.remove(self.spec_path)
+        result = validate_traffic_against_spec(load_compiled_spec(out), self.traffic)
+        self.assertEqual(result["error_count"], 1)
+
+    def test_cli_compile_and_validate(self):
+        out = self.dir / "compiled.json"
+        traffic_path = self.dir / "traffic.json"
+        traffic_path.write_text(json.dumps(self.traffic), encoding="utf-8")
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            rc = cli.main(["compile", "--spec", str(self.spec_path), "--out", str(out), "--json"])
+        self.assertEqual(rc, 0)
+        self.assertEqual(json.loads(buf.getvalue())["routes"], 2)
+
+        buf = io.StringIO()
+        with patch("contract_tester.cli.get_license_status", return_value={"valid": True}):
+            with redirect_stdout(buf):
+                rc = cli.main(["validate", "--spec", str(out), "--traffic", str(traffic_path), "--json"])
+        self.assertEqual(rc, 1)
+        self.assertEqual(json.loads(buf.getvalue())["error_count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.generate import TRAFFIC_FORMATS, generate, make_entries, make_spec
+from contract_tester.openapi import load_spec
+from contract_tester.traffic import load_traffic
+from contract_tester.validate import validate_traffic_against_spec
+
+
+class TestBenchGenerate(unittest.TestCase):
+    def test_error_rate_controls_errors(self):
+        spec = make_spec(40)
+        self.assertEqual(len(spec["paths"]), 40)
+        clean = validate_traffic_against_spec(spec, make_entries(spec, 200, error_rate=0.0))
+        self.assertEqual(clean["error_count"], 0)
+        broken = validate_traffic_against_spec(spec, make_entries(spec, 200, error_rate=1.0))
+        self.assertEqual(broken["error_count"], 200)
+        # Pets are checked through nested $refs (ItemList -> Item -> ItemV1 -> Pet).
+        self.assertTrue(any("(at $.pet, validator: oneOf)" in e for e in broken["errors"]))
+        self.assertTrue(any("(at $[0].pet, validator: oneOf)" in e for e in broken["errors"]))
+
+    def test_formats_load_to_same_results(self):
+        with tempfile.TemporaryDirectory() as td:
+            files = generate(Path(td), paths=12, entries=60, error_rate=0.3, payload_bytes=8)
+            spec = load_spec(files["spec_yaml"])
+            self.assertEqual(spec, load_spec(files["spec_json"]))
+            results = []
+            for fmt in TRAFFIC_FORMATS:
+                traffic = load_traffic(files[fmt])
+                self.assertEqual(len(traffic), 60, fmt)
+                result = validate_traffic_against_spec(spec, traffic)
+                results.append((result["error_count"], result["error_group_counts"]))
+        self.assertGreater(results[0][0], 0)
+        self.assertTrue(all(r == results[0] for r in results), results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from tests import SRC
+
+HEAVY_MODULES = ("jsonschema", "yaml", "cryptography")
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _heavy_imports(argv):
+    code = (
+        "import json, sys\n"
+        f"sys.path.insert(0, {SRC!r})\n"
+        "from contract_tester.cli import main\n"
+        "try:\n"
+        f"    main({argv!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(json.dumps(sorted({{m.split('.')[0] for m in sys.modules}} & set({list(HEAVY_MODULES)!r}))))\n"
+    )
+    env = dict(os.environ)
+    env.pop("CONTRACT_TESTER_LICENSE", None)
+    env.pop("CONTRACT_TESTER_LICENSE_FILE", None)
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, cwd=FIXTURES
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+class TestCliStartup(unittest.TestCase):
+    def test_version_skips_heavy_imports(self):
+        self.assertEqual(_heavy_imports(["--version"]), [])
+
+    def test_diff_of_json_specs_skips_schema_and_yaml(self):
+        spec = os.path.join(FIXTURES, "sample_spec.json")
+        self.assertEqual(_heavy_imports(["diff", "--old", spec, "--new", spec, "--json"]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
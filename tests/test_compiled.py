@@ -0,0 +1,99 @@
+import unittest
+from unittest.mock import patch
+
+from contract_tester.compiled import CompiledSpec, compile_spec
+from contract_tester.validate import validate_traffic_against_spec
+
+
+class TestCompiledSpec(unittest.TestCase):
+    def setUp(self):
+        self.spec = {
+            "openapi": "3.0.0",
+            "components": {
+                "schemas": {
+                    "User": {
+                        "type": "object",
+                        "properties": {"id": {"type": "integer"}},
+                        "required": ["id"],
+                    }
+                }
+            },
+            "paths": {
+                "/users/{id}": {
+                    "parameters": [
+                        {"name": "X-Trace", "in": "header", "schema": {"type": "string"}},
+                        {"name": "id", "in": "path", "required": True, "schema": {"type": "integer"}},
+                    ],
+                    "get": {
+                        "parameters": [
+                            {"name": "id", "in": "path", "required": True, "schema": {"type": "string"}},
+                            {"name": "c", "in": "cookie", "schema": {"type": "string"}},
+                        ],
+                        "responses": {
+                            "200": {
+                                "content": {
+                                    "application/json": {"schema": {"$ref": "#/components/schemas/User"}}
+                                }
+                            },
+                            "4XX": {"content": {"application/json": {"schema": {"type": "object"}}}},
+                        },
+                    },
+                    "put": {
+                        "requestBody": {
+                            "required": True,
+                            "content": {
+                                "application/json": {"schema": {"$ref": "#/components/schemas/User"}}
+                            },
+                        },
+                        "responses": {"204": {"description": "No Content"}},
+                    },
+                }
+            },
+        }
+
+    def test_plan_is_built_once(self):
+        compiled = CompiledSpec(self.spec)
+        plan_a, template, params = compiled.resolve("/users/1", "GET")
+        plan_b, _, _ = compiled.resolve("/users/2/", "get")
+        self.assertIs(plan_a, plan_b)
+        self.assertEqual(template, "/users/{id}")
+        self.assertEqual(params, {"id": "1"})
+
+    def test_merged_parameters(self):
+        plan, _, _ = CompiledSpec(self.spec).resolve("/users/1", "GET")
+        by_name = {p.name: p for p in plan.params}
+        self.assertEqual(set(by_name), {"X-Trace", "id"})
+        self.assertEqual(by_name["X-Trace"].lookup, "x-trace")
+        self.assertEqual(by_name["id"].validator.schema, {"type": "string"})
+
+    def test_response_table(self):
+        plan, _, _ = CompiledSpec(self.spec).resolve("/users/1", "GET")
+        has_schema, validator = plan.response_validator(200)
+        self.assertTrue(has_schema)
+        self.assertEqual(validator.schema["required"], ["id"])
+        self.assertIs(plan.response_validator(200)[1], validator)
+        self.assertTrue(plan.response_validator(404)[0])
+        self.assertEqual(plan.response_validator(500), (False, None))
+
+    def test_validators_shared_across_operations(self):
+        compiled = CompiledSpec(self.spec)
+        get_plan, _, _ = compiled.resolve("/users/1", "GET")
+        put_plan, _, _ = compiled.resolve("/users/1", "PUT")
+        self.assertTrue(put_plan.body_required)
+        self.assertIs(put_plan.body_validator, get_plan.response_validator(200)[1])
+
+    def test_hot_loop_does_not_rebuild_validators(self):
+        compiled = compile_spec(self.spec)
+        traffic = [
+            {"method": "GET", "path": "/users/1", "status": 200, "response_json": {"id": 1}},
+            {"method": "GET", "path": "/users/2", "status": 200, "response_json": {}},
+        ]
+        first = validate_traffic_against_spec(compiled, traffic)
+        with patch("contract_tester.compiled._validator_for_schema", side_effect=AssertionError):
+            second = validate_traffic_against_spec(compiled, traffic * 3)
+        self.assertEqual(first["error_count"], 1)
+        self.assertEqual(second["error_count"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+
+from contract_tester.errorstore import ErrorStore, top_error_groups
+from contract_tester.parallel import validate_traffic_parallel
+from contract_tester.report import build_html_report
+from contract_tester.validate import validate_traffic_against_spec
+
+
+class TestErrorStore(unittest.TestCase):
+    def test_counts_and_capped_examples(self):
+        store = ErrorStore(max_examples=2)
+        for entry in range(5):
+            store.add(("a", "GET", "/x"), entry, {"message": f"a{entry}"})
+        store.add(("b",), 2, {"message": "b2"})
+        fields = store.result_fields()
+        self.assertEqual(fields["error_count"], 6)
+        self.assertEqual(fields["error_group_counts"], {"a|GET|/x": 5, "b": 1})
+        self.assertEqual(fields["errors_grouped"]["a|GET|/x"], ["a0", "a1"])
+        self.assertEqual(fields["errors"], ["a0", "a1", "b2"])
+        self.assertFalse(store.wants_example(("a", "GET", "/x")))
+        self.assertTrue(store.wants_example(("c",)))
+
+    def test_top_groups_by_count(self):
+        store = ErrorStore(max_examples=0)
+        for group, count in ((("small",), 1), (("big",), 5), (("mid",), 3), (("mid2",), 3)):
+            for i in range(count):
+                store.add(group, i)
+        self.assertEqual(store.top_groups(3), [(("big",), 5), (("mid",), 3), (("mid2",), 3)])
+        self.assertEqual(top_error_groups(store.result_fields(), 2), [("big", 5), ("mid", 3)])
+
+    def test_top_groups_from_legacy_result(self):
+        result = {"errors_grouped": {"a": ["x"], "b": ["x", "y"]}}
+        self.assertEqual(top_error_groups(result, 5), [("b", 2), ("a", 1)])
+
+
+class TestValidationGroups(unittest.TestCase):
+    def setUp(self):
+        self.spec = {
+            "openapi": "3.0.0",
+            "paths": {
+                "/users/{id}": {
+                    "get": {
+                        "responses": {
+                            "200": {"content": {"application/json": {"schema": {"type": "object"}}}}
+                        }
+                    }
+                }
+            },
+        }
+        self.traffic = []
+        for i in range(120):
+            if i % 3 == 0:
+                self.traffic.append({"method": "GET", "path": f"/missing/{i}", "status": 200})
+            else:
+                self.traffic.append({"method": "GET", "path": f"/users/{i}", "status": 200, "response_json": [i]})
+
+    def test_exact_totals_with_capped_examples(self):
+        result = validate_traffic_against_spec(self.spec, self.traffic, max_examples=3)
+        self.assertEqual(result["error_count"], 120)
+        self.assertEqual(len(result["errors"]), 6)
+        self.assertEqual(
+            result["error_group_counts"],
+            {"operation.missing": 40, "response.schema_mismatch|GET|/users/{id}|200": 80},
+        )
+        self.assertEqual(len(result["errors_grouped"]["operation.missing"]), 3)
+        self.assertIn("/missing/0", result["errors"][0])
+
+    def test_parallel_matches_with_cap(self):
+        expected = validate_traffic_against_spec(self.spec, self.traffic, max_examples=4)
+        result = validate_traffic_parallel(
+            self.spec, self.traffic, workers=2, batch_size=7, max_examples=4
+        )
+        self.assertEqual(result, expected)
+
+    def test_report_lists_groups_by_count(self):
+        result = validate_traffic_against_spec(self.spec, self.traffic, max_examples=1)
+        html = build_html_report(result)
+        self.assertLess(html.index("response.schema_mismatch"), html.index("operation.missing"))
+        self.assertIn("(80)", html)
+        self.assertIn("Showing 2 example(s) of 120 errors.", html)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+import gc
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import unittest
+from pathlib import Path
+
+from benchmarks.generate import make_entries, make_spec, write_spec
+from contract_tester.follow import WINDOW_BUCKETS, RollingCounts, TrafficFollower
+from contract_tester.validate import validate_traffic_against_spec
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _jsonl(entries):
+    return "".join(json.dumps(entry) + "\n" for entry in entries).encode("utf-8")
+
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.005)
+
+
+class TestRollingCounts(unittest.TestCase):
+    def test_window_slides(self):
+        rolling = RollingCounts(60.0)
+        rolling.add_checks(3, now=0.5)
+        rolling.add_error("a", now=0.5)
+        rolling.add_checks(2, now=30.0)
+        rolling.add_error("b", now=30.0)
+        rolling.add_error("b", now=30.2)
+        snap = rolling.snapshot(now=59.0)
+        self.assertEqual((snap["checks"], snap["error_count"]), (5, 3))
+        self.assertEqual(snap["error_group_counts"], {"b": 2, "a": 1})
+        snap = rolling.snapshot(now=75.0)
+        self.assertEqual((snap["checks"], snap["error_group_counts"]), (2, {"b": 2}))
+        self.assertEqual(rolling.snapshot(now=1000.0)["checks"], 0)
+        for second in range(5000):
+            rolling.add_checks(1, now=float(second))
+        self.assertLessEqual(len(rolling.buckets), WINDOW_BUCKETS)
+
+
+class TestTrafficFollower(unittest.TestCase):
+    def setUp(self):
+        self.spec = make_spec(6)
+        self.entries = make_entries(self.spec, 60, error_rate=0.3, payload_bytes=4, seed=9)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "traffic.jsonl"
+        self.path.write_bytes(_jsonl(self.entries[:10]))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _start(self, **kwargs):
+        summaries = []
+        follower = TrafficFollower(
+            self.spec, self.path, poll_interval=0.005, summary_interval=0.05, on_summary=summaries.append, **kwargs
+        )
+        stop = threading.Event()
+        results = []
+        thread = threading.Thread(target=lambda: results.append(follower.run(stop)))
+        thread.start()
+
+        def _finish():
+            stop.set()
+            thread.join(10)
+            return results[0]
+
+        return follower, summaries, _finish
+
+    def test_tails_appends_rotation_and_truncation(self):
+        follower, summaries, finish = self._start()
+        _wait_for(lambda: follower.summary.total_checks == 10)
+
+        data = _jsonl(self.entries[10:30])
+        with open(self.path, "ab") as fp:
+            fp.write(data[:101])
+            fp.flush()
+            time.sleep(0.05)
+            self.assertEqual(follower.summary.total_checks, 10)  # the half-written line waits
+            fp.write(data[101:])
+        _wait_for(lambda: follower.summary.total_checks == 30)
+
+        os.replace(self.path, self.path.with_suffix(".1"))
+        self.path.write_bytes(_jsonl(self.entries[30:45]))
+        _wait_for(lambda: follower.summary.total_checks == 45)
+
+        self.path.write_bytes(_jsonl(self.entries[45:50]))
+        _wait_for(lambda: follower.truncated == 1 and follower.summary.total_checks == 50)
+        _wait_for(lambda: len(summaries) >= 2)
+        result = finish()
+
+        follow = result.pop("follow")
+        self.assertEqual((follow["reopened"], follow["truncated"]), (1, 1))
+        self.assertEqual(result, validate_traffic_against_spec(self.spec, self.entries[:50]))
+        self.assertEqual(sum(s["since_last"]["checks"] for s in summaries), summaries[-1]["total_checks"])
+        self.assertEqual(summaries[-1]["window"]["checks"], summaries[-1]["total_checks"])
+
+    def test_stops_at_entry_limit(self):
+        follower, _, finish = self._start(max_entries=4)
+        _wait_for(lambda: follower.limit_reached())
+        self.assertEqual(finish()["total_checks"], 4)
+
+    def test_memory_stays_flat(self):
+        # A short window fills the bucket ring at once, so any later growth is a leak.
+        follower, summaries, finish = self._start(max_examples=2, window=0.3)
+        _wait_for(lambda: follower.summary.total_checks == 10)
+        batch = _jsonl(self.entries) * 20
+        tracemalloc.start()
+        try:
+            retained = []
+            for round_ in range(1, 5):
+                with open(self.path, "ab") as fp:
+                    fp.write(batch)
+                _wait_for(lambda: follower.summary.total_checks == 10 + round_ * 1200)
+                summaries.clear()
+                gc.collect()
+                retained.append(tracemalloc.get_traced_memory()[0])
+        finally:
+            tracemalloc.stop()
+            finish()
+        # Retaining the 2400 entries of rounds 3-4 would take about 4.5 MB; allow
+        # for one-off growth such as the interpreter resizing its intern table.
+        self.assertLess(retained[-1] - retained[1], 2 * 1024 * 1024, retained)
+
+
+class TestFollowCommand(unittest.TestCase):
+    def test_follow_until_sigterm(self):
+        spec = make_spec(4)
+        entries = make_entries(spec, 12, error_rate=0.5, payload_bytes=4, seed=2)
+        with tempfile.TemporaryDirectory() as td:
+            spec_path = Path(td) / "spec.json"
+            traffic = Path(td) / "traffic.jsonl"
+            write_spec(spec, spec_path)
+            traffic.write_bytes(_jsonl(entries[:5]))
+            env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT / "src"), os.environ.get("PYTHONPATH", "")]))
+            proc = subprocess.Popen(
+                [sys.executable, "-m", "contract_tester.cli", "validate", "--spec", str(spec_path)]
+                + ["--traffic", str(traffic), "--follow", "--summary-interval", "0.1", "--json"],
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            try:
+                time.sleep(0.5)
+                with open(traffic, "ab") as fp:
+                    fp.write(_jsonl(entries[5:]))
+                time.sleep(0.5)
+            finally:
+                proc.send_signal(signal.SIGTERM)
+                stdout, stderr = proc.communicate(timeout=20)
+        lines = [json.loads(line) for line in stdout.splitlines() if line.startswith("{")]
+        self.assertTrue(any("follow_summary" in line for line in lines), stdout)
+        result = lines[-1]
+        self.assertEqual(result["total_checks"], 12, stderr)
+        self.assertEqual(result["error_count"], validate_traffic_against_spec(spec, entries)["error_count"])
+        self.assertEqual(proc.returncode, 1 if result["error_count"] else 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
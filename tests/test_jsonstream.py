@@ -0,0 +1,67 @@
+import io
+import json
+import unittest
+
+from contract_tester.jsonstream import iter_array_items
+
+
+def _items(text, path=("log", "entries"), chunk_size=3):
+    return list(iter_array_items(io.StringIO(text), path, chunk_size=chunk_size))
+
+
+class TestJsonStream(unittest.TestCase):
+    def test_items_match_json_loads_at_any_chunk_size(self):
+        doc = {
+            "version": 1.25,
+            "log": {
+                "creator": {"name": "x", "nested": [1, {"a": "]}"}]},
+                "pages": [{"id": 'p"1'}],
+                "entries": [
+                    {"n": 12345, "s": "caf\u00e9 {[\n", "t": True, "z": None},
+                    {"n": -0.5e3, "s": "\\\\", "list": [[], {}]},
+                    {"unicode": "☃"},
+                ],
+                "after": "ignored",
+            },
+        }
+        text = json.dumps(doc, indent=1)
+        for chunk_size in (1, 2, 3, 5, 8, 64, 1 << 20):
+            self.assertEqual(_items(text, chunk_size=chunk_size), doc["log"]["entries"])
+
+    def test_values_ending_near_eof_are_kept(self):
+        # The last items end within a few characters of EOF, where a failed
+        # read for more input used to drop them.
+        for text, items in (
+            ('{"e": [1, 2, 3]}', [1, 2, 3]),
+            ('{"log": {"entries": [{}, {}]}}', [{}, {}]),
+            ('{"e": ["a", -1.5, true, null, [0]]}', ["a", -1.5, True, None, [0]]),
+            ('{"e": [7]}  \n', [7]),
+        ):
+            path = ("log", "entries") if text.startswith('{"log"') else ("e",)
+            for chunk_size in (1, 2, 3, 4, 5, 7, 8, 16, 1 << 20):
+                self.assertEqual(_items(text, path, chunk_size), items, (text, chunk_size))
+
+    def test_missing_or_wrong_type_yields_nothing(self):
+        self.assertEqual(_items('{"log": {"pages": []}}'), [])
+        self.assertEqual(_items('{"log": {"entries": null}}'), [])
+        self.assertEqual(_items('{"other": 1}'), [])
+
+    def test_malformed_raises(self):
+        with self.assertRaises(ValueError):
+            _items('{"log": {"entries": [{"a": 1}, {"a": }]}}')
+        with self.assertRaises(ValueError):
+            _items('{"log": {"entries": [{"a": "unterminated')
+        with self.assertRaises(ValueError):
+            _items("[1, 2]")
+
+    def test_items_are_yielded_lazily(self):
+        text = '{"log": {"entries": [{"a": 1}, {"a": 2}, {"a": '
+        it = iter_array_items(io.StringIO(text), ("log", "entries"), chunk_size=4)
+        self.assertEqual(next(it), {"a": 1})
+        self.assertEqual(next(it), {"a": 2})
+        with self.assertRaises(ValueError):
+            next(it)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,14 @@
+import json
 import os
 import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
-from contract_tester.license import get_license_status
+from contract_tester import license as license_mod
+from contract_tester.license import clear_license_cache, get_license_status
+
+_OK = {"valid": True, "code": "ok", "message": "License is valid.", "source": None, "key": None}
 
 
 class TestLicenseStatus(unittest.TestCase):
@@ -27,6 +31,74 @@ class TestLicenseStatus(unittest.TestCase):
         self.assertEqual(status["code"], "missing_key")
         self.assertIsNone(status["source"])
 
+    def _env(self, td: Path, **extra: str) -> dict:
+        env = {
+            "CONTRACT_TESTER_LICENSE": "CT1.token.sig",
+            "CONTRACT_TESTER_REVOKED_FILE": str(td / "revoked.txt"),
+            "CONTRACT_TESTER_LICENSE_CACHE": "",
+        }
+        env.update(extra)
+        return env
+
+    def test_status_is_memoized_per_process(self):
+        clear_license_cache()
+        with tempfile.TemporaryDirectory() as td:
+            with patch.dict(os.environ, self._env(Path(td)), clear=False):
+                with patch.object(license_mod, "verify_license_key", return_value=dict(_OK)) as verify:
+                    first = get_license_status()
+                    second = get_license_status()
+        self.assertEqual(verify.call_count, 1)
+        self.assertTrue(first["valid"])
+        self.assertEqual(first["source"], "env")
+        self.assertEqual(second["key"], "CT1.token.sig")
+        first["valid"] = False
+        self.assertTrue(second["valid"])
+
+    def test_disk_cache_skips_verification_until_inputs_change(self):
+        with tempfile.TemporaryDirectory() as td:
+            base = Path(td)
+            cache = base / "cache.json"
+            with patch.dict(os.environ, self._env(base, CONTRACT_TESTER_LICENSE_CACHE=str(cache)), clear=False):
+                clear_license_cache()
+                with patch.object(license_mod, "verify_license_key", return_value=dict(_OK)):
+                    self.assertTrue(get_license_status()["valid"])
+                self.assertTrue(cache.is_file())
+                self.assertNotIn("CT1.token.sig", cache.read_text(encoding="utf-8"))
+
+                clear_license_cache()
+                with patch.object(license_mod, "verify_license_key", side_effect=AssertionError("not cached")):
+                    self.assertTrue(get_license_status()["valid"])
+
+                (base / "revoked.txt").write_text("lic_1\n", encoding="utf-8")
+                clear_license_cache()
+                revoked = dict(_OK, valid=False, code="revoked")
+                with patch.object(license_mod, "verify_license_key", return_value=revoked) as verify:
+                    self.assertEqual(get_license_status()["code"], "revoked")
+                self.assertEqual(verify.call_count, 1)
+
+    def test_tampered_disk_cache_is_verified_again(self):
+        with tempfile.TemporaryDirectory() as td:
+            base = Path(td)
+            cache = base / "cache.json"
+            with patch.dict(os.environ, self._env(base, CONTRACT_TESTER_LICENSE_CACHE=str(cache)), clear=False):
+                clear_license_cache()
+                bad = dict(_OK, valid=False, code="bad_signature")
+                with patch.object(license_mod, "verify_license_key", return_value=bad):
+                    self.assertFalse(get_license_status()["valid"])
+                data = json.loads(cache.read_text(encoding="utf-8"))
+                (fingerprint, entry), = data["entries"].items()
+                forged = [
+                    dict(entry, status=dict(entry["status"], valid=True, code="ok")),
+                    {"status": dict(entry["status"], valid=True, code="ok")},
+                    dict(_OK),
+                ]
+                for forged_entry in forged:
+                    cache.write_text(json.dumps({"entries": {fingerprint: forged_entry}}), encoding="utf-8")
+                    clear_license_cache()
+                    with patch.object(license_mod, "verify_license_key", return_value=bad) as verify:
+                        self.assertFalse(get_license_status()["valid"])
+                    self.assertEqual(verify.call_count, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
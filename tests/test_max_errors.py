@@ -1,6 +1,10 @@
 import unittest
 
-from contract_tester.validate import validate_traffic_against_spec
+from contract_tester.validate import (
+    iter_validate,
+    summarize_findings,
+    validate_traffic_against_spec,
+)
 
 
 class TestMaxErrors(unittest.TestCase):
@@ -25,6 +29,37 @@ class TestMaxErrors(unittest.TestCase):
         result = validate_traffic_against_spec(self.spec, self.traffic, max_errors=2)
         self.assertEqual(result["error_count"], 2)
         self.assertTrue(result["stopped_early"])
+        self.assertEqual(result["total_checks"], 2)
+
+    def test_stops_pulling_entries(self):
+        pulled = []
+
+        def entries():
+            for entry in self.traffic:
+                pulled.append(entry)
+                yield entry
+
+        result = validate_traffic_against_spec(self.spec, entries(), max_errors=1)
+        self.assertEqual(result["total_checks"], 1)
+        self.assertEqual(len(pulled), 1)
+
+    def test_iter_validate_is_lazy(self):
+        findings = iter_validate(self.spec, iter(self.traffic))
+        first = next(findings)
+        self.assertEqual(first.entry, 0)
+        self.assertEqual(first.key, "operation.missing")
+        self.assertIn("/missing/1", first.message)
+
+    def test_summarize_findings_matches_wrapper(self):
+        findings = list(iter_validate(self.spec, self.traffic))
+        self.assertEqual(
+            summarize_findings(findings, total_checks=3, max_errors=2),
+            validate_traffic_against_spec(self.spec, self.traffic, max_errors=2),
+        )
+        summary = summarize_findings(findings, total_checks=3)
+        self.assertEqual(summary["error_count"], 3)
+        self.assertEqual(len(summary["errors_grouped"]["operation.missing"]), 3)
+        self.assertIn("hint", summary["error_details"][0])
 
 
 if __name__ == "__main__":
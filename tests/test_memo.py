@@ -0,0 +1,86 @@
+import unittest
+
+from contract_tester.memo import ValidationCache, body_digest
+from contract_tester.parallel import validate_traffic_parallel
+from contract_tester.validate import validate_traffic_against_spec
+
+
+class TestValidationCache(unittest.TestCase):
+    def setUp(self):
+        self.spec = {
+            "openapi": "3.0.0",
+            "paths": {
+                "/health": {
+                    "get": {
+                        "responses": {
+                            "200": {
+                                "content": {
+                                    "application/json": {
+                                        "schema": {
+                                            "type": "object",
+                                            "properties": {"status": {"type": "string"}},
+                                            "required": ["status"],
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    },
+                    "post": {
+                        "requestBody": {
+                            "content": {
+                                "application/json": {"schema": {"type": "object", "required": ["status"]}}
+                            }
+                        },
+                        "responses": {"200": {"content": {"application/json": {"schema": {"type": "object"}}}}},
+                    },
+                }
+            },
+        }
+        ok = {"method": "GET", "path": "/health", "status": 200, "response_json": {"status": "ok"}}
+        bad = {"method": "GET", "path": "/health", "status": 200, "response_json": {"up": True}}
+        post = {
+            "method": "POST",
+            "path": "/health",
+            "status": 200,
+            "response_json": {},
+            "request_json": {"b": 1, "a": 2},
+        }
+        self.traffic = [ok, bad, post] * 20
+
+    def test_digest_is_canonical(self):
+        self.assertEqual(body_digest({"a": 1, "b": [1, 2]}), body_digest({"b": [1, 2], "a": 1}))
+        self.assertNotEqual(body_digest({"a": 1}), body_digest({"a": "1"}))
+
+    def test_cached_result_matches_uncached(self):
+        cache = ValidationCache(100)
+        expected = validate_traffic_against_spec(self.spec, self.traffic)
+        result = validate_traffic_against_spec(self.spec, self.traffic, cache=cache)
+        stats = result.pop("cache")
+        self.assertEqual(result, expected)
+        self.assertEqual(stats["misses"], 4)
+        self.assertEqual(stats["hits"], 76)
+        self.assertEqual(stats["size"], 4)
+
+    def test_lru_eviction(self):
+        cache = ValidationCache(2)
+        keys = [cache.key("scope", {"n": i}) for i in range(3)]
+        cache.put(keys[0], None)
+        cache.put(keys[1], "bad")
+        self.assertEqual(cache.get(keys[0]), (True, None))
+        cache.put(keys[2], None)
+        self.assertEqual(cache.get(keys[1]), (False, None))
+        self.assertEqual(cache.get(keys[0]), (True, None))
+        self.assertEqual(cache.stats(), {"max_size": 2, "size": 2, "hits": 2, "misses": 1})
+
+    def test_parallel_cache_stats(self):
+        result = validate_traffic_parallel(
+            self.spec, self.traffic, workers=2, batch_size=15, cache_size=100
+        )
+        stats = result.pop("cache")
+        self.assertEqual(result, validate_traffic_against_spec(self.spec, self.traffic))
+        self.assertEqual(stats["hits"] + stats["misses"], 80)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import tracemalloc
+import unittest
+from pathlib import Path
+
+from benchmarks.generate import iter_entries, make_spec, write_har
+from contract_tester.profiling import MemoryProfiler
+from contract_tester.traffic import iter_traffic
+from contract_tester.validate import validate_traffic_against_spec
+
+BENCH_ENV = "CONTRACT_TESTER_BENCH"
+ENTRIES = 100_000
+# Peak traced memory must not grow with the number of entries; these budgets
+# leave roughly 3x headroom over what streaming uses today (~5 and ~9 MB).
+HAR_STREAM_BUDGET_MB = 16
+VALIDATE_BUDGET_MB = 24
+
+
+class TestMemoryProfiler(unittest.TestCase):
+    def test_phases_fold_into_memory_phases(self):
+        spec = make_spec(8)
+        profiler = MemoryProfiler(rss_interval=0).start()
+        try:
+            profiler.mark("traffic_load")
+            blob = bytearray(4 * 2**20)
+            del blob
+            validate_traffic_against_spec(spec, list(iter_entries(spec, 20, error_rate=0.5)), profiler=profiler)
+            result = profiler.result()
+        finally:
+            profiler.stop()
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(list(result["phases"]), ["traffic_load", "validation", "reporting"])
+        self.assertGreaterEqual(result["phases"]["traffic_load"]["peak_traced_mb"], 4)
+        self.assertEqual(result["peak_traced_mb"], max(p["peak_traced_mb"] for p in result["phases"].values()))
+
+
+@unittest.skipUnless(os.environ.get(BENCH_ENV), f"set {BENCH_ENV}=1 to run memory budget benchmarks")
+class TestMemoryBudget(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.spec = make_spec(200)
+        cls.har = Path(cls.tmp.name) / "traffic.har"
+        write_har(iter_entries(cls.spec, ENTRIES, error_rate=0.05, payload_bytes=256), cls.har)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_har_streaming_stays_within_budget(self):
+        tracemalloc.start()
+        try:
+            count = sum(1 for _ in iter_traffic(self.har))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(count, ENTRIES)
+        self.assertLess(peak / 2**20, HAR_STREAM_BUDGET_MB)
+
+    def test_validation_stays_within_budget(self):
+        profiler = MemoryProfiler().start()
+        try:
+            result = validate_traffic_against_spec(self.spec, iter_traffic(self.har), profiler=profiler)
+            memory = profiler.result()
+        finally:
+            profiler.stop()
+        self.assertEqual(result["total_checks"], ENTRIES)
+        self.assertLess(memory["peak_traced_mb"], VALIDATE_BUDGET_MB, memory)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.generate import make_entries, make_spec, write_har, write_jsonl, write_spec
+from contract_tester import cli
+from contract_tester import pipeline as pipeline_module
+from contract_tester.multifile import READ_AHEAD_BATCHES, TrafficFiles, expand_traffic_paths
+from contract_tester.parallel import validate_traffic_parallel
+from contract_tester.validate import validate_traffic_against_spec
+
+
+class TestMultipleTrafficFiles(unittest.TestCase):
+    def setUp(self):
+        self.spec = make_spec(12)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "suites" / "nested").mkdir(parents=True)
+        self.chunks = [
+            make_entries(self.spec, count, error_rate=0.3, payload_bytes=4, seed=seed)
+            for seed, count in enumerate((40, 0, 25, 60), start=1)
+        ]
+        self.chunks[2][3] = dict(self.chunks[2][3], path="/unknown")
+        self.paths = [
+            self.root / "suites" / "a.har",
+            self.root / "suites" / "b.jsonl",
+            self.root / "suites" / "nested" / "c.jsonl",
+            self.root / "suites" / "nested" / "d.har",
+        ]
+        for path, chunk in zip(self.paths, self.chunks):
+            (write_har if path.suffix == ".har" else write_jsonl)(chunk, path)
+        (self.root / "suites" / "notes.txt").write_text("not traffic", encoding="utf-8")
+        self.everything = [entry for chunk in self.chunks for entry in chunk]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_expand_paths(self):
+        suites = str(self.root / "suites")
+        self.assertEqual(expand_traffic_paths([suites]), [str(p) for p in self.paths])
+        self.assertEqual(
+            expand_traffic_paths([str(self.root / "suites" / "**" / "*.har"), str(self.paths[0])]),
+            [str(self.paths[0]), str(self.paths[3])],
+        )
+        self.assertEqual(expand_traffic_paths(["-"]), ["-"])
+        with self.assertRaisesRegex(ValueError, "No traffic files match"):
+            expand_traffic_paths([str(self.root / "*.zip")])
+        with self.assertRaises(ValueError):
+            expand_traffic_paths(["-", suites])
+
+    def test_combined_result_and_subtotals(self):
+        single = validate_traffic_against_spec(self.spec, self.everything)
+        for read_ahead in (1, 3):
+            files = TrafficFiles([str(p) for p in self.paths], read_ahead=read_ahead)
+            result = validate_traffic_against_spec(self.spec, files, files=files)
+            rows = result.pop("files")
+            self.assertEqual(result, single)
+            self.assertEqual([row["total_checks"] for row in rows], [len(c) for c in self.chunks])
+            for row, chunk in zip(rows, self.chunks):
+                alone = validate_traffic_against_spec(self.spec, chunk)
+                self.assertEqual(row["error_count"], alone["error_count"], row["path"])
+                self.assertEqual(row["error_group_counts"], alone["error_group_counts"], row["path"])
+
+    def test_workers_and_max_errors(self):
+        files = TrafficFiles([str(p) for p in self.paths])
+        result = validate_traffic_parallel(self.spec, files, workers=2, batch_size=16, files=files)
+        self.assertEqual(sum(row["error_count"] for row in result["files"]), result["error_count"])
+
+        files = TrafficFiles([str(p) for p in self.paths])
+        result = validate_traffic_against_spec(self.spec, files, max_errors=15, files=files)
+        rows = result["files"]
+        self.assertTrue(result["stopped_early"])
+        self.assertEqual(sum(row["error_count"] for row in rows), 15)
+        self.assertEqual(sum(row["total_checks"] for row in rows), result["total_checks"])
+        self.assertEqual(rows[-1]["total_checks"], 0)
+
+    def test_read_ahead_is_bounded_per_file(self):
+        big = [str(self.root / "big1.jsonl"), str(self.root / "big2.jsonl")]
+        for seed, path in enumerate(big):
+            write_jsonl(make_entries(self.spec, 5000, payload_bytes=4, seed=seed), Path(path))
+        parsed = []
+        real_iter_traffic = pipeline_module.iter_traffic
+
+        def counting_iter_traffic(path, on_error=None):
+            for entry in real_iter_traffic(path, on_error=on_error):
+                parsed.append(path)
+                yield entry
+
+        with patch.object(pipeline_module, "iter_traffic", counting_iter_traffic):
+            entries = iter(TrafficFiles(big, read_ahead=2))
+            next(entries)
+            time.sleep(0.3)
+            # Queued batches, the one being put and the one being consumed.
+            limit = (READ_AHEAD_BATCHES + 2) * pipeline_module.DEFAULT_PIPELINE_BATCH_SIZE
+            self.assertLessEqual(parsed.count(big[0]), limit)
+            self.assertLessEqual(parsed.count(big[1]), limit)
+            self.assertGreater(parsed.count(big[1]), 0)
+            started = time.perf_counter()
+            entries.close()
+            self.assertLess(time.perf_counter() - started, 2.0)
+
+    def test_cli_accepts_directories(self):
+        write_spec(self.spec, self.root / "spec.json")
+        out = StringIO()
+        report = self.root / "report.html"
+        with patch("sys.stdout", out), patch(
+            "contract_tester.cli.get_license_status", return_value={"valid": True, "code": "ok"}
+        ):
+            rc = cli.main(
+                ["validate", "--spec", str(self.root / "spec.json"), "--traffic", str(self.root / "suites")]
+                + ["--json", "--report", str(report)]
+            )
+        self.assertEqual(rc, 1)
+        payload = json.loads(out.getvalue())
+        self.assertEqual(payload["total_checks"], len(self.everything))
+        self.assertEqual([row["path"] for row in payload["files"]], [str(p) for p in self.paths])
+        self.assertIn(os.path.basename(str(self.paths[3])), report.read_text(encoding="utf-8"))
+
+    def test_cli_rejects_pipeline_with_several_files(self):
+        err = StringIO()
+        with patch("sys.stderr", err):
+            rc = cli.main(["validate", "--spec", "x.json", "--traffic", *map(str, self.paths), "--pipeline", "thread"])
+        self.assertEqual(rc, 2)
+        self.assertIn("single traffic file", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+from contract_tester.parallel import validate_traffic_parallel
+from contract_tester.validate import validate_traffic_against_spec
+
+
+class TestParallelValidation(unittest.TestCase):
+    def setUp(self):
+        self.spec = {
+            "openapi": "3.0.0",
+            "paths": {
+                "/users/{id}": {
+                    "get": {
+                        "parameters": [
+                            {"name": "id", "in": "path", "required": True, "schema": {"type": "integer"}}
+                        ],
+                        "responses": {
+                            "200": {
+                                "content": {
+                                    "application/json": {
+                                        "schema": {
+                                            "type": "object",
+                                            "properties": {"id": {"type": "integer"}},
+                                            "required": ["id"],
+                                        }
+                                    }
+                                }
+                            }
+                        },
+                    }
+                }
+            },
+        }
+        self.traffic = []
+        for i in range(230):
+            if i % 7 == 0:
+                self.traffic.append({"method": "GET", "path": f"/users/x{i}", "status": 200, "response_json": {"id": i}})
+            elif i % 11 == 0:
+                self.traffic.append({"method": "GET", "path": f"/users/{i}", "status": 200, "response_json": {}})
+            elif i % 13 == 0:
+                self.traffic.append({"method": "GET", "path": f"/other/{i}", "status": 200, "response_json": {}})
+            else:
+                self.traffic.append({"method": "GET", "path": f"/users/{i}", "status": 200, "response_json": {"id": i}})
+
+    def test_matches_single_process(self):
+        expected = validate_traffic_against_spec(self.spec, self.traffic)
+        result = validate_traffic_parallel(self.spec, iter(self.traffic), workers=2, batch_size=16)
+        self.assertEqual(result, expected)
+        self.assertGreater(result["error_count"], 0)
+
+    def test_max_errors_is_global(self):
+        expected = validate_traffic_against_spec(self.spec, self.traffic, max_errors=9)
+        result = validate_traffic_parallel(
+            self.spec, self.traffic, workers=3, max_errors=9, batch_size=10
+        )
+        self.assertEqual(result, expected)
+        self.assertTrue(result["stopped_early"])
+        self.assertEqual(result["error_count"], 9)
+
+    def test_ignore_unknown(self):
+        expected = validate_traffic_against_spec(self.spec, self.traffic, ignore_unknown=True)
+        result = validate_traffic_parallel(
+            self.spec, self.traffic, workers=2, ignore_unknown=True, batch_size=50
+        )
+        self.assertEqual(result, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
+import random
 import unittest
 
-from contract_tester.openapi import get_operation
+from contract_tester.openapi import build_router, get_operation, resolve_operation
 
 
 class TestPathMatching(unittest.TestCase):
@@ -43,6 +44,72 @@ class TestPathMatching(unittest.TestCase):
         op = get_operation(self.spec, "/users/123?x=1", "GET")
         self.assertIsNotNone(op)
 
+    def test_path_params_extracted(self):
+        op, template, path_item, params = resolve_operation(self.spec, "/users/7/posts/9", "GET")
+        self.assertIs(op, self.spec["paths"]["/users/{id}/posts/{postId}"]["get"])
+        self.assertEqual(template, "/users/{id}/posts/{postId}")
+        self.assertIs(path_item, self.spec["paths"]["/users/{id}/posts/{postId}"])
+        self.assertEqual(params, {"id": "7", "postId": "9"})
+
+    def test_literal_count_beats_earlier_literal(self):
+        spec = {
+            "paths": {
+                "/a/{x}/{y}": {"get": {"operationId": "one"}},
+                "/{x}/b/c": {"get": {"operationId": "two"}},
+            }
+        }
+        op = get_operation(spec, "/a/b/c", "GET")
+        self.assertEqual(op["operationId"], "two")
+
+    def test_tie_goes_to_first_declared(self):
+        spec = {
+            "paths": {
+                "/{x}/b": {"get": {"operationId": "one"}},
+                "/a/{y}": {"get": {"operationId": "two"}},
+            }
+        }
+        op, template, _, params = resolve_operation(spec, "/a/b", "GET")
+        self.assertEqual(op["operationId"], "one")
+        self.assertEqual(params, {"x": "a"})
+
+    def test_method_not_on_best_template(self):
+        spec = {
+            "paths": {
+                "/users/me": {"get": {"operationId": "me"}},
+                "/users/{id}": {"delete": {"operationId": "delete"}},
+            }
+        }
+        op = get_operation(spec, "/users/me", "DELETE")
+        self.assertEqual(op["operationId"], "delete")
+
+    def test_lookups_without_a_router_see_spec_changes(self):
+        spec = {"paths": {"/users/{id}": {"get": {"operationId": "get"}}}}
+        self.assertEqual(get_operation(spec, "/users/1", "GET")["operationId"], "get")
+        spec["paths"] = {"/teams/{id}": {"get": {"operationId": "team"}}}
+        self.assertIsNone(get_operation(spec, "/users/1", "GET"))
+        self.assertEqual(get_operation(spec, "/teams/1", "GET")["operationId"], "team")
+
+    def test_router_matches_linear_scan(self):
+        rng = random.Random(7)
+        words = ["users", "posts", "me", "latest", "a", "b"]
+        paths = {}
+        for _ in range(200):
+            parts = [
+                "{p%d}" % i if rng.random() < 0.4 else rng.choice(words)
+                for i in range(rng.randint(1, 4))
+            ]
+            methods = {m: {"operationId": f"{m}:{'/'.join(parts)}"} for m in rng.sample(["get", "post"], 1)}
+            paths.setdefault("/" + "/".join(parts), methods)
+        spec = {"paths": paths}
+        router = build_router(spec)
+        for _ in range(500):
+            req = "/" + "/".join(rng.choice(words + ["1", "2"]) for _ in range(rng.randint(1, 4)))
+            for method in ("GET", "POST"):
+                self.assertEqual(
+                    resolve_operation(spec, req, method, router=router),
+                    resolve_operation(spec, req, method),
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
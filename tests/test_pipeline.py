@@ -0,0 +1,89 @@
+import json
+import os
+import tempfile
+import unittest
+
+from contract_tester.pipeline import validate_traffic_pipelined
+from contract_tester.traffic import iter_traffic
+from contract_tester.validate import validate_traffic_against_spec
+
+
+class TestPipelinedValidation(unittest.TestCase):
+    def setUp(self):
+        self.spec = {
+            "openapi": "3.0.0",
+            "paths": {
+                "/users/{id}": {
+                    "get": {
+                        "parameters": [
+                            {"name": "id", "in": "path", "required": True, "schema": {"type": "integer"}}
+                        ],
+                        "responses": {
+                            "200": {
+                                "content": {
+                                    "application/json": {
+                                        "schema": {
+                                            "type": "object",
+                                            "properties": {"id": {"type": "integer"}},
+                                            "required": ["id"],
+                                        }
+                                    }
+                                }
+                            }
+                        },
+                    }
+                }
+            },
+        }
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "traffic.jsonl")
+        with open(self.path, "w", encoding="utf-8") as f:
+            for i in range(230):
+                body = {} if i % 11 == 0 else {"id": i}
+                path = f"/users/x{i}" if i % 7 == 0 else f"/users/{i}"
+                f.write(json.dumps({"method": "GET", "path": path, "status": 200, "response_json": body}) + "\n")
+                if i == 100:
+                    f.write("{broken\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_matches_sequential_run(self):
+        expected = validate_traffic_against_spec(self.spec, iter_traffic(self.path))
+        for mode in ("thread", "process"):
+            skipped = []
+            result = validate_traffic_pipelined(
+                self.spec,
+                self.path,
+                mode=mode,
+                queue_depth=1,
+                batch_size=16,
+                on_error=lambda lineno, reason: skipped.append(lineno),
+            )
+            pipeline = result.pop("pipeline")
+            self.assertEqual(result, expected, mode)
+            self.assertEqual(skipped, [102], mode)
+            self.assertEqual(pipeline["stages"]["parse"]["items"], 230)
+            self.assertEqual(pipeline["stages"]["validate"]["items"], 230)
+            self.assertIn(pipeline["bottleneck"], ("parse", "validate"))
+
+    def test_max_errors_and_limit(self):
+        expected = validate_traffic_against_spec(self.spec, iter_traffic(self.path), max_errors=5)
+        result = validate_traffic_pipelined(self.spec, self.path, mode="process", max_errors=5, batch_size=8)
+        result.pop("pipeline")
+        self.assertEqual(result, expected)
+
+        limited = validate_traffic_pipelined(self.spec, self.path, limit=25)
+        self.assertEqual(limited["total_checks"], 25)
+
+    def test_parse_errors_reach_the_caller(self):
+        missing = os.path.join(self.tmp.name, "missing.json")
+        for mode in ("thread", "process"):
+            with self.assertRaises(FileNotFoundError):
+                validate_traffic_pipelined(self.spec, missing, mode=mode)
+        with self.assertRaises(ValueError):
+            validate_traffic_pipelined(self.spec, "-", mode="process")
+
+
+if __name__ == "__main__":
+    unittest.main()
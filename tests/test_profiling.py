@@ -0,0 +1,143 @@
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+from contract_tester import cli
+from contract_tester.profiling import PHASES, Profiler
+from contract_tester.validate import validate_traffic_against_spec
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.spec = {
+            "openapi": "3.0.0",
+            "components": {
+                "schemas": {"User": {"type": "object", "required": ["id"], "properties": {"id": {"type": "integer"}}}}
+            },
+            "paths": {
+                "/users/{id}": {
+                    "get": {
+                        "parameters": [{"name": "id", "in": "path", "required": True, "schema": {"type": "integer"}}],
+                        "responses": {
+                            "200": {
+                                "content": {"application/json": {"schema": {"$ref": "#/components/schemas/User"}}}
+                            }
+                        },
+                    }
+                },
+                "/users": {
+                    "post": {
+                        "requestBody": {"content": {"application/json": {"schema": {"type": "object"}}}},
+                        "responses": {"201": {"content": {"application/json": {"schema": {"type": "object"}}}}},
+                    }
+                },
+            },
+        }
+        self.traffic = [
+            {"method": "GET", "path": "/users/1", "status": 200, "response_json": {"id": 1}},
+            {"method": "GET", "path": "/users/x", "status": 200, "response_json": {"id": "x"}},
+            {"method": "POST", "path": "/users", "status": 201, "request_json": {}, "response_json": {}},
+            {"method": "GET", "path": "/nope", "status": 200},
+        ]
+
+    def test_profiled_result_matches_plain_run(self):
+        profiler = Profiler()
+        result = validate_traffic_against_spec(self.spec, self.traffic, profiler=profiler)
+        self.assertEqual(result, validate_traffic_against_spec(self.spec, self.traffic))
+
+        profile = profiler.result()
+        self.assertEqual(
+            list(profile["phases"]),
+            [p for p in PHASES if p in ("traffic_load", "routing", "params", "request_body", "response", "reporting")],
+        )
+        ops = {row["operation"]: row["calls"] for row in profile["slowest_operations"]}
+        self.assertEqual(ops, {"GET /users/{id}": 2, "POST /users": 1})
+        schemas = {row["schema"]: row["calls"] for row in profile["slowest_schemas"]}
+        self.assertEqual(
+            schemas,
+            {"#/components/schemas/User": 2, "POST /users request body": 1, "POST /users 201 response": 1},
+        )
+        self.assertGreaterEqual(profile["total_wall_s"], 0)
+
+    def test_phases_are_exclusive(self):
+        profiler = Profiler()
+        profiler.mark("response")
+        previous = profiler.mark("reporting")
+        self.assertEqual(previous, "response")
+        profiler.mark(previous)
+        profiler.mark(None)
+        phases = profiler.result()["phases"]
+        self.assertEqual(list(phases), ["response", "reporting"])
+        self.assertGreaterEqual(phases["response"]["wall_s"], 0)
+
+    def test_cli_profile_json(self):
+        with tempfile.TemporaryDirectory() as td:
+            spec_path = os.path.join(td, "spec.json")
+            traffic_path = os.path.join(td, "traffic.json")
+            with open(spec_path, "w", encoding="utf-8") as f:
+                json.dump(self.spec, f)
+            with open(traffic_path, "w", encoding="utf-8") as f:
+                json.dump(self.traffic, f)
+            out = io.StringIO()
+            with patch("contract_tester.cli.get_license_status", return_value={"valid": True}):
+                with redirect_stdout(out):
+                    rc = cli.main(
+                        ["validate", "--spec", spec_path, "--traffic", traffic_path, "--profile", "--json"]
+                    )
+                mem_out = io.StringIO()
+                with redirect_stdout(mem_out):
+                    cli.main(["validate", "--spec", spec_path, "--traffic", traffic_path, "--mem-report", "--json"])
+                err = io.StringIO()
+                with redirect_stderr(err):
+                    rc_both = cli.main(
+                        ["validate", "--spec", spec_path, "--traffic", traffic_path, "--profile", "--mem-report"]
+                    )
+                    rc_workers = cli.main(
+                        ["validate", "--spec", spec_path, "--traffic", traffic_path, "--profile", "--workers", "2"]
+                    )
+        self.assertEqual(rc, 1)
+        profile = json.loads(out.getvalue())["profile"]
+        self.assertIn("spec_load", profile["phases"])
+        self.assertIn("reporting", profile["phases"])
+        memory = json.loads(mem_out.getvalue())["memory"]
+        self.assertIn("validation", memory["phases"])
+        self.assertNotIn("profile", json.loads(mem_out.getvalue()))
+        self.assertEqual(rc_both, 2)
+        self.assertEqual(rc_workers, 2)
+        self.assertIn("--profile", err.getvalue())
+
+    def test_cli_profiles_the_html_report(self):
+        from contract_tester import report
+
+        real_build = report.build_html_report
+
+        def slow_build(result):
+            time.sleep(0.2)
+            return real_build(result)
+
+        with tempfile.TemporaryDirectory() as td:
+            spec_path = os.path.join(td, "spec.json")
+            traffic_path = os.path.join(td, "traffic.json")
+            report_path = os.path.join(td, "report.html")
+            with open(spec_path, "w", encoding="utf-8") as f:
+                json.dump(self.spec, f)
+            with open(traffic_path, "w", encoding="utf-8") as f:
+                json.dump(self.traffic, f)
+            args = ["validate", "--spec", spec_path, "--traffic", traffic_path, "--report", report_path, "--json"]
+            out = io.StringIO()
+            with patch("contract_tester.cli.get_license_status", return_value={"valid": True}), patch.object(
+                report, "build_html_report", slow_build
+            ), redirect_stdout(out):
+                cli.main(args + ["--profile"])
+            self.assertTrue(os.path.getsize(report_path))
+        profile = json.loads(out.getvalue())["profile"]
+        self.assertGreaterEqual(profile["phases"]["reporting"]["wall_s"], 0.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,286 @@
+import asyncio
+import gzip
+import http.client
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+from contract_tester import proxy as proxy_module
+from contract_tester.proxy import STATS_PATH, ValidatingProxy
+
+ROOT = Path(__file__).resolve().parents[1]
+
+SPEC = {
+    "openapi": "3.0.0",
+    "paths": {
+        "/users/{id}": {
+            "get": {
+                "parameters": [{"name": "id", "in": "path", "required": True, "schema": {"type": "integer"}}],
+                "responses": {
+                    "200": {
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {"id": {"type": "integer"}},
+                                    "required": ["id"],
+                                }
+                            }
+                        }
+                    }
+                },
+            }
+        },
+        "/users": {
+            "post": {
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {"type": "object", "required": ["name"], "properties": {"name": {"type": "string"}}}
+                        }
+                    },
+                },
+                "responses": {"204": {"description": "created"}},
+            }
+        },
+    },
+}
+
+
+class _Upstream(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if not self.path.startswith("/users/"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        user = self.path.split("?", 1)[0].rsplit("/", 1)[-1]
+        payload = {"id": int(user)} if user != "13" else {"id": "thirteen"}
+        body = json.dumps(payload).encode("utf-8")
+        if user == "7":
+            body = gzip.compress(body)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if user == "7":
+            self.send_header("Content-Encoding", "gzip")
+        if user == "8":
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for part in (body[:3], body[3:]):
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(part), part))
+            self.wfile.write(b"0\r\n\r\n")
+            return
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            data = b""
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                chunk = self.rfile.read(size + 2)[:-2]
+                if not size:
+                    break
+                data += chunk
+        else:
+            data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.posted.append(data)
+        self.send_response(204)
+        self.end_headers()
+
+
+class TestValidatingProxy(unittest.TestCase):
+    def setUp(self):
+        self.upstream = ThreadingHTTPServer(("127.0.0.1", 0), _Upstream)
+        self.upstream.posted = []
+        threading.Thread(target=self.upstream.serve_forever, daemon=True).start()
+        self.addCleanup(self.upstream.server_close)
+        self.addCleanup(self.upstream.shutdown)
+        self.loop = asyncio.new_event_loop()
+        self.loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.loop_thread.start()
+
+    def tearDown(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.loop_thread.join()
+        self.loop.close()
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout=30)
+
+    def _start(self, **kwargs):
+        proxy = ValidatingProxy(SPEC, f"http://127.0.0.1:{self.upstream.server_address[1]}", **kwargs)
+        port = self._run(proxy.start("127.0.0.1", 0))
+        return proxy, port
+
+    def test_forwards_and_validates(self):
+        proxy, port = self._start()
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        bodies = {}
+        for user in (1, 13, 7, 8):
+            conn.request("GET", f"/users/{user}?x=1")
+            response = conn.getresponse()
+            self.assertEqual(response.status, 200)
+            bodies[user] = response.read()
+        self.assertEqual(json.loads(bodies[1]), {"id": 1})
+        self.assertEqual(json.loads(gzip.decompress(bodies[7])), {"id": 7})
+        self.assertEqual(json.loads(bodies[8]), {"id": 8})
+
+        conn.request("POST", "/users", body=json.dumps({"name": "ada"}), headers={"Content-Type": "application/json"})
+        response = conn.getresponse()
+        response.read()
+        self.assertEqual(response.status, 204)
+        conn.request(
+            "POST", "/users", body=iter([b'{"nam', b'e": 5}']), headers={"Content-Type": "application/json"},
+            encode_chunked=True,
+        )
+        response = conn.getresponse()
+        response.read()
+        self.assertEqual(response.status, 204)
+        conn.request("GET", "/nowhere/else")
+        conn.getresponse().read()
+        conn.close()
+        self.assertEqual(self.upstream.posted, [b'{"name": "ada"}', b'{"name": 5}'])
+
+        self._run(proxy.close())
+        result = proxy.result()
+        self.assertEqual(result["total_checks"], 7)
+        self.assertEqual(
+            result["error_group_counts"],
+            {
+                "response.schema_mismatch|GET|/users/{id}|200": 1,
+                "request.body.schema|POST|/users": 1,
+                "operation.missing": 1,
+            },
+        )
+        stats = result["proxy"]
+        self.assertEqual((stats["exchanges"], stats["validated"], stats["dropped"]), (7, 7, 0))
+        latency = stats["added_latency_ms"]
+        self.assertEqual(latency["samples"], 7)
+        self.assertLessEqual(latency["p50"], latency["p99"])
+
+    def test_slow_validation_never_blocks_requests(self):
+        proxy, port = self._start(queue_size=1)
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        with proxy.lock:  # stands in for a very slow schema
+            for user in range(1, 6):
+                conn.request("GET", f"/users/{user}")
+                self.assertEqual(conn.getresponse().read(), json.dumps({"id": user}).encode())
+            # The reply reaches us just before the exchange is queued.
+            deadline = time.monotonic() + 10
+            while proxy.exchanges < 5 and time.monotonic() < deadline:
+                time.sleep(0.001)
+        conn.close()
+        self._run(proxy.close())
+        result = proxy.result()["proxy"]
+        self.assertEqual(result["exchanges"], 5)
+        # At most one exchange is held by the stalled validator and one waits in the queue.
+        self.assertGreaterEqual(result["dropped"], 3)
+        self.assertEqual(result["validated"] + result["dropped"], 5)
+
+    def test_validation_error_does_not_stop_the_validator(self):
+        real = proxy_module.iter_validate
+        calls = []
+
+        def flaky(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return real(*args, **kwargs)
+
+        proxy, port = self._start()
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        with patch.object(proxy_module, "iter_validate", flaky):
+            for user in (1, 13, 2):
+                conn.request("GET", f"/users/{user}")
+                conn.getresponse().read()
+            conn.close()
+            self._run(proxy.close())
+        result = proxy.result()
+        self.assertEqual((result["proxy"]["failed"], result["proxy"]["validated"]), (1, 2))
+        self.assertEqual(result["total_checks"], 2)
+
+    def test_stats_endpoint_and_bad_gateway(self):
+        proxy, port = self._start()
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        conn.request("GET", STATS_PATH)
+        self.assertEqual(json.loads(conn.getresponse().read())["exchanges"], 0)
+        conn.close()
+        self._run(proxy.close())
+
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            dead_port = probe.getsockname()[1]
+        proxy = ValidatingProxy(SPEC, f"http://127.0.0.1:{dead_port}")
+        port = self._run(proxy.start("127.0.0.1", 0))
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        conn.request("GET", "/users/1")
+        self.assertEqual(conn.getresponse().status, 502)
+        conn.close()
+        self._run(proxy.close())
+
+
+class TestProxyCommand(unittest.TestCase):
+    def test_proxy_reports_on_sigterm(self):
+        upstream = ThreadingHTTPServer(("127.0.0.1", 0), _Upstream)
+        threading.Thread(target=upstream.serve_forever, daemon=True).start()
+        self.addCleanup(upstream.server_close)
+        self.addCleanup(upstream.shutdown)
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        spec_path = Path(tmp.name) / "spec.json"
+        spec_path.write_text(json.dumps(SPEC), encoding="utf-8")
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT / "src"), os.environ.get("PYTHONPATH", "")]))
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "contract_tester.cli", "proxy", "--spec", str(spec_path)]
+            + ["--upstream", f"http://127.0.0.1:{upstream.server_address[1]}", "--listen", f"127.0.0.1:{port}", "--json"],
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            deadline = time.monotonic() + 20
+            while True:
+                try:
+                    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+                    conn.request("GET", "/users/13")
+                    break
+                except ConnectionRefusedError:
+                    self.assertIsNone(proc.poll(), "proxy exited early")
+                    self.assertLess(time.monotonic(), deadline)
+                    time.sleep(0.05)
+            self.assertEqual(conn.getresponse().status, 200)
+            conn.close()
+        finally:
+            proc.send_signal(signal.SIGTERM)
+            stdout, stderr = proc.communicate(timeout=10)
+        self.assertEqual(proc.returncode, 1, stderr)
+        result = json.loads(stdout)
+        self.assertEqual(result["error_count"], 1)
+        self.assertEqual(result["proxy"]["exchanges"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
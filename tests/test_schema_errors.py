@@ -0,0 +1,110 @@
+import pickle
+import unittest
+from unittest.mock import patch
+
+from contract_tester import validate
+from contract_tester.validate import iter_validate, validate_traffic_against_spec
+
+
+class TestSchemaErrors(unittest.TestCase):
+    def setUp(self):
+        self.spec = {
+            "openapi": "3.0.0",
+            "paths": {
+                "/items": {
+                    "get": {
+                        "parameters": [{"name": "limit", "in": "query", "schema": {"type": "integer"}}],
+                        "responses": {
+                            "200": {
+                                "content": {
+                                    "application/json": {
+                                        "schema": {
+                                            "type": "object",
+                                            "properties": {
+                                                "items": {"type": "array", "items": {"type": "integer"}}
+                                            },
+                                        }
+                                    }
+                                }
+                            }
+                        },
+                    }
+                }
+            },
+        }
+
+    def _entry(self, body, query=None):
+        return {"method": "GET", "path": "/items", "status": 200, "response_json": body, "query": query or {}}
+
+    def test_structured_detail_and_truncation(self):
+        body = {"items": [1, 2, "x" * 10000]}
+        result = validate_traffic_against_spec(self.spec, [self._entry(body)])
+        detail = result["error_details"][0]
+        self.assertEqual(detail["path"], "$.items[2]")
+        self.assertEqual(detail["validator"], "type")
+        self.assertLessEqual(len(detail["instance"]), validate.MAX_INSTANCE_TEXT)
+        self.assertLess(len(detail["message"]), 500)
+        self.assertTrue(detail["message"].startswith("Schema mismatch for GET /items 200: "))
+
+    def test_param_message_format(self):
+        result = validate_traffic_against_spec(self.spec, [self._entry({}, {"limit": "ten"})])
+        self.assertEqual(
+            result["errors"][0],
+            "Invalid query parameter 'limit': 'ten' is not of type 'integer' (at $, validator: type)"
+            " for GET /items",
+        )
+
+    def test_rendering_is_deferred(self):
+        traffic = [self._entry({"items": ["bad"]}) for _ in range(50)]
+        with patch("contract_tester.validate.best_match", wraps=validate.best_match) as spy:
+            findings = list(iter_validate(self.spec, traffic))
+            self.assertEqual(len(findings), 50)
+            self.assertEqual(spy.call_count, 0)
+            result = validate_traffic_against_spec(self.spec, traffic, max_errors=3)
+        self.assertEqual(result["error_count"], 3)
+        self.assertEqual(spy.call_count, 3)
+
+    def test_finding_pickles_rendered(self):
+        finding = next(iter_validate(self.spec, [self._entry({"items": [None]})]))
+        clone = pickle.loads(pickle.dumps(finding))
+        self.assertEqual(clone.message, finding.message)
+        self.assertEqual(clone.detail(), finding.detail())
+
+    def test_property_level_refs(self):
+        operation = self.spec["paths"]["/items"]["get"]
+        content = operation["responses"]["200"]["content"]["application/json"]
+        content["schema"] = {"$ref": "#/components/schemas/A"}
+        operation["parameters"][0]["schema"] = {"$ref": "#/components/schemas/Missing"}
+        self.spec["components"] = {
+            "schemas": {
+                "A": {"type": "object", "properties": {"b": {"$ref": "#/components/schemas/B"}}},
+                "B": {
+                    "type": "object",
+                    "properties": {
+                        "n": {"type": "integer"},
+                        "next": {"$ref": "#/components/schemas/B"},
+                    },
+                },
+            }
+        }
+        traffic = [self._entry({"b": {"next": {"n": 1}}}), self._entry({"b": {"next": {"n": "x"}}})]
+        result = validate_traffic_against_spec(self.spec, traffic)
+        self.assertEqual(result["error_count"], 1)
+        self.assertEqual(result["error_details"][0]["path"], "$.b.next.n")
+
+        # A ref that can't be resolved is reported, not raised.
+        content["schema"] = {
+            "type": "object",
+            "properties": {"b": {"$ref": "#/components/schemas/Missing"}},
+        }
+        result = validate_traffic_against_spec(self.spec, [self._entry({"b": 1}, {"limit": "1"})])
+        self.assertEqual(
+            result["error_group_counts"],
+            {"request.param.invalid|GET|/items": 1, "response.schema_mismatch|GET|/items|200": 1},
+        )
+        for error in result["errors"]:
+            self.assertIn("PointerToNowhere", error)
+
+
+if __name__ == "__main__":
+    unittest.main()
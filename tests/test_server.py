@@ -0,0 +1,217 @@
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from contract_tester import server as server_module
+from contract_tester.server import ValidationServer, ValidationService
+
+ROOT = Path(__file__).resolve().parents[1]
+LICENSED = {"valid": True, "code": "ok"}
+
+
+def _spec(id_type):
+    return {
+        "openapi": "3.0.0",
+        "paths": {
+            "/users/{id}": {
+                "get": {
+                    "responses": {
+                        "200": {
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "object",
+                                        "properties": {"id": {"type": id_type}},
+                                        "required": ["id"],
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+    }
+
+
+def _entry(user_id):
+    return {"method": "GET", "path": f"/users/{user_id}", "status": 200, "response_json": {"id": user_id}}
+
+
+class _Client:
+    def __init__(self, path):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(path)
+        self.reader = self.sock.makefile("rb")
+
+    def send(self, request):
+        data = request if isinstance(request, bytes) else json.dumps(request).encode("utf-8") + b"\n"
+        self.sock.sendall(data)
+
+    def recv(self):
+        return json.loads(self.reader.readline())
+
+    def call(self, request):
+        self.send(request)
+        return self.recv()
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+
+class TestValidationServer(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.spec_path = Path(self.tmp.name) / "spec.json"
+        self.spec_path.write_text(json.dumps(_spec("integer")), encoding="utf-8")
+        self.socket_path = os.path.join(self.tmp.name, "ct.sock")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _start(self, **kwargs):
+        service = ValidationService(self.spec_path, LICENSED, **kwargs)
+        server = ValidationServer(self.socket_path, service)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        def _stop():
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+        self.addCleanup(_stop)
+        client = _Client(self.socket_path)
+        self.addCleanup(client.close)
+        return service, client
+
+    def test_single_entries_and_batches(self):
+        _, client = self._start()
+        self.assertEqual(client.call({"id": 1, "entry": _entry(7)}), {"id": 1, "ok": True, "errors": []})
+        bad = client.call({"id": 2, "entry": dict(_entry(7), response_json={"id": "7"})})
+        self.assertFalse(bad["ok"])
+        self.assertEqual(bad["errors"][0]["key"], "response.schema_mismatch|GET|/users/{id}|200")
+
+        client.send({"id": "b", "entries": [_entry(1), {"path": "/x"}, dict(_entry(2), response_json={})]})
+        replies = [client.recv() for _ in range(4)]
+        self.assertEqual([r.get("index") for r in replies[:3]], [0, 1, 2])
+        self.assertTrue(replies[0]["ok"])
+        self.assertIn("not a traffic entry", replies[1]["error"])
+        self.assertFalse(replies[2]["ok"])
+        self.assertEqual(replies[3], {"id": "b", "done": True, "count": 3, "error_count": 1})
+
+        self.assertIn("invalid JSON", client.call(b"{nope\n")["error"])
+        self.assertFalse(client.call({"op": "bogus"})["ok"])
+        stats = client.call({"op": "stats"})["stats"]
+        self.assertEqual(stats["checked"], 4)
+        self.assertEqual(stats["error_count"], 2)
+
+    def test_stats_reply_is_sent_outside_the_lock(self):
+        service = ValidationService(self.spec_path, LICENSED)
+        replies = service.handle({"id": 1, "op": "stats"})
+        self.assertTrue(next(replies)["ok"])
+        # The reply is being written; other connections can still take the lock.
+        acquired = []
+        other = threading.Thread(target=lambda: acquired.append(service.lock.acquire(timeout=2)))
+        other.start()
+        other.join()
+        self.assertEqual(acquired, [True])
+        service.lock.release()
+
+    def test_validation_error_is_reported_per_entry(self):
+        _, client = self._start()
+        real = server_module.iter_validate
+
+        def flaky(spec, entries, **kwargs):
+            entries = list(entries)
+            if entries[0]["path"] == "/users/2":
+                raise RuntimeError("boom")
+            return real(spec, entries, **kwargs)
+
+        with patch.object(server_module, "iter_validate", flaky):
+            reply = client.call({"id": 1, "entry": _entry(2)})
+            self.assertEqual(reply, {"id": 1, "ok": False, "error": "RuntimeError: boom"})
+            client.send({"id": "b", "entries": [_entry(1), _entry(2), _entry(3)]})
+            replies = [client.recv() for _ in range(4)]
+        self.assertEqual([r.get("ok") for r in replies[:3]], [True, False, True])
+        self.assertEqual(replies[1]["index"], 1)
+        self.assertEqual(replies[3], {"id": "b", "done": True, "count": 3, "error_count": 0})
+
+    def test_hot_reload_on_spec_change(self):
+        service, client = self._start(reload_interval=0.01)
+        self.assertTrue(client.call({"entry": _entry(7)})["ok"])
+        self.spec_path.write_text(json.dumps(_spec("string")), encoding="utf-8")
+        os.utime(self.spec_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+        time.sleep(0.02)
+        self.assertFalse(client.call({"entry": _entry(7)})["ok"])
+        self.assertEqual(service.generation, 2)
+
+        # A broken spec keeps the last good one and reports why.
+        self.spec_path.write_text("{broken", encoding="utf-8")
+        os.utime(self.spec_path, ns=(time.time_ns(), time.time_ns() + 2 * 10**9))
+        reply = client.call({"op": "reload"})
+        self.assertFalse(reply["ok"])
+        self.assertEqual(reply["generation"], 2)
+        self.assertFalse(client.call({"entry": _entry(7)})["ok"])
+
+    def test_round_trip_latency(self):
+        _, client = self._start()
+        request = json.dumps({"entry": _entry(7)}).encode("utf-8") + b"\n"
+        client.call(request)
+        rounds = 500
+        start = time.perf_counter()
+        for _ in range(rounds):
+            client.send(request)
+            client.reader.readline()
+        per_check = (time.perf_counter() - start) / rounds
+        self.assertLess(per_check, 0.005)
+
+    def test_refuses_live_socket(self):
+        self._start()
+        with self.assertRaisesRegex(ValueError, "in use"):
+            ValidationServer(self.socket_path, ValidationService(self.spec_path, LICENSED))
+
+
+class TestServeCommand(unittest.TestCase):
+    def test_serve_until_sigterm(self):
+        with tempfile.TemporaryDirectory() as td:
+            spec_path = Path(td) / "spec.json"
+            spec_path.write_text(json.dumps(_spec("integer")), encoding="utf-8")
+            socket_path = os.path.join(td, "ct.sock")
+            env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT / "src"), os.environ.get("PYTHONPATH", "")]))
+            proc = subprocess.Popen(
+                [sys.executable, "-m", "contract_tester.cli", "serve", "--spec", str(spec_path), "--socket", socket_path],
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            try:
+                deadline = time.monotonic() + 20
+                while not os.path.exists(socket_path):
+                    self.assertIsNone(proc.poll(), "server exited early")
+                    self.assertLess(time.monotonic(), deadline)
+                    time.sleep(0.05)
+                client = _Client(socket_path)
+                self.assertTrue(client.call({"entry": _entry(3)})["ok"])
+                client.close()
+            finally:
+                proc.send_signal(signal.SIGTERM)
+                _, stderr = proc.communicate(timeout=10)
+            self.assertEqual(proc.returncode, 0, stderr)
+            self.assertIn("Served 1 entries", stderr)
+            self.assertFalse(os.path.exists(socket_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+import base64
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from benchmarks.generate import make_entries, make_spec, write_jsonl, write_spec
+from contract_tester.report import build_html_report
+from contract_tester.shard import merge_partials, parse_shard, shard_of, validate_traffic_shard
+from contract_tester.validate import validate_traffic_against_spec
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _entries(spec, count=400):
+    entries = make_entries(spec, count, error_rate=0.2, payload_bytes=4, seed=7)
+    # Spread a few non-schema groups through the corpus so group order matters.
+    for i in range(0, count, 37):
+        entries[i] = dict(entries[i], path=f"/unknown/{i}")
+    for i in range(5, count, 53):
+        entries[i] = dict(entries[i], status="oops")
+    return entries
+
+
+def _html(result):
+    return "\n".join(line for line in build_html_report(result).splitlines() if "Generated:" not in line)
+
+
+class TestShardMerge(unittest.TestCase):
+    def setUp(self):
+        self.spec = make_spec(12)
+        self.entries = _entries(self.spec)
+
+    def _merged(self, count, key="position", max_examples=3):
+        partials = []
+        for index in range(1, count + 1):
+            _, partial = validate_traffic_shard(
+                self.spec, iter(self.entries), index, count, key=key, max_examples=max_examples
+            )
+            partials.append(partial)
+        return merge_partials(partials[::-1])
+
+    def test_merge_matches_single_run(self):
+        for count in (1, 2, 3, 7):
+            for key in ("position", "content"):
+                for max_examples in (0, 1, 3, None):
+                    single = validate_traffic_against_spec(self.spec, self.entries, max_examples=max_examples)
+                    merged = self._merged(count, key, max_examples)
+                    self.assertEqual(json.dumps(merged), json.dumps(single), (count, key, max_examples))
+        self.assertEqual(_html(self._merged(3)), _html(validate_traffic_against_spec(self.spec, self.entries, max_examples=3)))
+
+    def test_shards_partition_entries(self):
+        for key in ("position", "content"):
+            seen = []
+            for index in range(1, 5):
+                result, _ = validate_traffic_shard(self.spec, self.entries, index, 4, key=key)
+                seen.append(result["total_checks"])
+                self.assertEqual(result["shard"]["entries_seen"], len(self.entries))
+            self.assertEqual(sum(seen), len(self.entries))
+            self.assertTrue(all(seen), key)
+
+    def test_content_key_is_stable(self):
+        entry = self.entries[3]
+        self.assertEqual(shard_of(0, entry, 5, "content"), shard_of(99, dict(entry), 5, "content"))
+
+    def test_parse_shard(self):
+        self.assertEqual(parse_shard("2/4"), (2, 4))
+        for bad in ("0/4", "5/4", "2", "a/b", "1/0"):
+            with self.assertRaises(ValueError):
+                parse_shard(bad)
+
+    def test_merge_rejects_incomplete_or_mismatched_partials(self):
+        partials = [validate_traffic_shard(self.spec, self.entries, i, 3)[1] for i in (1, 2, 3)]
+        with self.assertRaisesRegex(ValueError, "missing shard"):
+            merge_partials(partials[:2])
+        with self.assertRaisesRegex(ValueError, "duplicate shard"):
+            merge_partials(partials + [partials[0]])
+        other = validate_traffic_shard(self.spec, self.entries[:-1], 3, 3)[1]
+        with self.assertRaisesRegex(ValueError, "entries_seen"):
+            merge_partials(partials[:2] + [other])
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def _license_env():
+    key = ec.generate_private_key(ec.SECP256R1())
+    public_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode("utf-8")
+    future = (datetime.now(timezone.utc).date() + timedelta(days=30)).isoformat()
+    payload = _b64url(json.dumps({"sub": "ci", "plan": "pro", "exp": future}, sort_keys=True).encode("utf-8"))
+    sig = _b64url(key.sign(payload.encode("ascii"), ec.ECDSA(hashes.SHA256())))
+    env = dict(os.environ)
+    env.pop("CONTRACT_TESTER_LICENSE_FILE", None)
+    env.pop("CONTRACT_TESTER_LICENSE_CACHE", None)
+    env["CONTRACT_TESTER_LICENSE"] = f"CT1.{payload}.{sig}"
+    env["CONTRACT_TESTER_LICENSE_PUBLIC_KEY"] = public_pem
+    env["PYTHONPATH"] = os.pathsep.join([str(ROOT / "src"), env.get("PYTHONPATH", "")])
+    return env
+
+
+class TestShardProcesses(unittest.TestCase):
+    def test_shard_processes_merge_to_single_run(self):
+        spec = make_spec(12)
+        with tempfile.TemporaryDirectory() as td:
+            tmp = Path(td)
+            write_spec(spec, tmp / "spec.json")
+            write_jsonl(_entries(spec, 300), tmp / "traffic.jsonl")
+            env = _license_env()
+            base = [sys.executable, "-m", "contract_tester.cli", "validate", "--spec", "spec.json"]
+            base += ["--traffic", "traffic.jsonl", "--max-examples", "2"]
+
+            shards = [
+                subprocess.Popen(
+                    base + ["--shard", f"{i}/3", "--partial-out", f"part{i}.json", "--json"],
+                    cwd=td,
+                    env=env,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
+                for i in (1, 2, 3)
+            ]
+            for proc in shards:
+                _, stderr = proc.communicate(timeout=60)
+                self.assertEqual(proc.returncode, 1, stderr)
+
+            single = subprocess.run(
+                base + ["--json", "--report", "single.html"], cwd=td, env=env, capture_output=True, text=True
+            )
+            merged = subprocess.run(
+                [sys.executable, "-m", "contract_tester.cli", "merge", "part3.json", "part1.json", "part2.json"]
+                + ["--json", "--report", "merged.html"],
+                cwd=td,
+                env=env,
+                capture_output=True,
+                text=True,
+            )
+            self.assertEqual(single.returncode, 1, single.stderr)
+            self.assertEqual(merged.returncode, 1, merged.stderr)
+            self.assertTrue(json.loads(single.stdout)["license_status"]["valid"])
+            self.assertEqual(merged.stdout, single.stdout)
+
+            def _report(name):
+                lines = (tmp / name).read_text(encoding="utf-8").splitlines()
+                return [line for line in lines if "Generated:" not in line]
+
+            self.assertEqual(_report("merged.html"), _report("single.html"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import json
+import os
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.generate import make_entries, make_spec, write_spec
+from contract_tester import cli
+from contract_tester.state import load_state, validate_traffic_resumable
+from contract_tester.traffic import IncrementalReader, load_traffic
+from contract_tester.validate import validate_traffic_against_spec
+
+CURL_LOG = """curl -X GET "https://api.example.com/users/1"
+{"id": 1}
+HTTPSTATUS:200
+curl -X POST "https://api.example.com/users" -H "Content-Type: application/json" -d '{"name":"a"}'
+HTTP/1.1 201 Created
+Content-Type: application/json
+
+{"ok": true}
+STATUS: 201
+"""
+
+
+def _jsonl(entries):
+    return "".join(json.dumps(entry) + "\n" for entry in entries).encode("utf-8")
+
+
+class TestIncrementalReader(unittest.TestCase):
+    def test_resumes_at_any_byte(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "traffic.log"
+            path.write_text(CURL_LOG, encoding="utf-8")
+            expected = [entry.to_dict() for entry in load_traffic(path)]
+        samples = (
+            ("curl", CURL_LOG.encode("utf-8"), expected),
+            ("jsonl", _jsonl(expected) + b"not json\n" + _jsonl(expected[:1])[:-1], expected + expected[:1]),
+        )
+        for kind, data, want in samples:
+            for cut in range(len(data) + 1):
+                first = IncrementalReader(kind)
+                got = list(first.feed(data[:cut])) + list(first.flush(final=False))
+                second = IncrementalReader(kind, first.offset, first.line)
+                got += list(second.feed(data[first.offset:])) + list(second.flush())
+                self.assertEqual([entry.to_dict() for entry in got], want, (kind, cut))
+
+    def test_unfinished_tail_is_left_for_later(self):
+        reader = IncrementalReader("jsonl")
+        data = _jsonl([{"method": "GET", "path": "/a", "status": 200}])
+        self.assertEqual(len(list(reader.feed(data + b'{"method": "GET", "pa'))), 1)
+        self.assertEqual(list(reader.flush(final=False)), [])
+        self.assertEqual(reader.offset, len(data))
+
+        reader = IncrementalReader("curl")
+        block = CURL_LOG.encode("utf-8").split(b"curl -X POST")[0]
+        self.assertEqual(list(reader.feed(block[:-16])), [])
+        self.assertEqual(list(reader.flush(final=False)), [])
+        self.assertEqual(reader.offset, 0)
+        self.assertEqual(len(list(reader.feed(block[-16:])) + list(reader.flush(final=False))), 1)
+        self.assertEqual(reader.offset, len(block))
+
+
+class TestResumableValidation(unittest.TestCase):
+    def setUp(self):
+        self.spec = make_spec(8)
+        self.entries = make_entries(self.spec, 90, error_rate=0.3, payload_bytes=4, seed=5)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.traffic = Path(self.tmp.name) / "traffic.jsonl"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _append(self, entries):
+        with open(self.traffic, "ab") as fp:
+            fp.write(_jsonl(entries))
+
+    def test_runs_add_up_to_a_single_pass(self):
+        state = None
+        for chunk in (self.entries[:30], [], self.entries[30:31], self.entries[31:]):
+            self._append(chunk)
+            state = json.loads(json.dumps(state))
+            result, state = validate_traffic_resumable(self.spec, self.traffic, state, max_examples=3)
+        progress = result.pop("state")
+        self.assertTrue(progress["resumed"])
+        self.assertEqual(progress["new_entries"], 59)
+        self.assertEqual(state["offset"], self.traffic.stat().st_size)
+        self.assertEqual(result, validate_traffic_against_spec(self.spec, self.entries, max_examples=3))
+
+    def test_resets_on_truncation_rotation_and_spec_change(self):
+        self._append(self.entries[:40])
+        _, state = validate_traffic_resumable(self.spec, self.traffic)
+
+        self.traffic.write_bytes(_jsonl(self.entries[40:50]))
+        result, _ = validate_traffic_resumable(self.spec, self.traffic, state)
+        self.assertEqual(result["state"]["reset_reason"], "traffic file was truncated")
+        self.assertEqual(result["total_checks"], 10)
+
+        rotated = Path(self.tmp.name) / "traffic.jsonl.1"
+        os.replace(self.traffic, rotated)
+        self._append(self.entries[:60])
+        result, _ = validate_traffic_resumable(self.spec, self.traffic, state)
+        self.assertEqual(result["state"]["reset_reason"], "traffic file was replaced (rotated)")
+        self.assertEqual(result["total_checks"], 60)
+
+        _, state = validate_traffic_resumable(self.spec, self.traffic)
+        result, _ = validate_traffic_resumable(make_spec(9), self.traffic, state)
+        self.assertEqual(result["state"]["reset_reason"], "spec or settings changed")
+        self.assertFalse(result["state"]["resumed"])
+
+    def test_in_place_rewrite_is_noticed(self):
+        self._append(self.entries[:20])
+        _, state = validate_traffic_resumable(self.spec, self.traffic)
+        with open(self.traffic, "r+b") as fp:
+            fp.write(b" " * 10)
+        result, _ = validate_traffic_resumable(self.spec, self.traffic, state)
+        self.assertEqual(result["state"]["reset_reason"], "traffic file was rewritten")
+
+    def test_json_document_is_not_read_as_a_curl_log(self):
+        traffic = Path(self.tmp.name) / "t.log"
+        traffic.write_text(json.dumps(self.entries[:2]), encoding="utf-8")
+        with self.assertRaisesRegex(ValueError, "HAR or JSON documents"):
+            validate_traffic_resumable(self.spec, traffic)
+
+    def test_cli_state_file(self):
+        spec_path = Path(self.tmp.name) / "spec.json"
+        state_path = Path(self.tmp.name) / "state.json"
+        write_spec(self.spec, spec_path)
+        argv = ["validate", "--spec", str(spec_path), "--traffic", str(self.traffic), "--state", str(state_path)]
+        results = []
+        for chunk in (self.entries[:50], self.entries[50:]):
+            self._append(chunk)
+            out = StringIO()
+            with patch("sys.stdout", out), patch(
+                "contract_tester.cli.get_license_status", return_value={"valid": True, "code": "ok"}
+            ):
+                cli.main(argv + ["--json"])
+            results.append(json.loads(out.getvalue()))
+        self.assertEqual(results[1]["state"]["new_entries"], 40)
+        self.assertEqual(results[1]["total_checks"], 90)
+        self.assertEqual(load_state(state_path)["total_checks"], 90)
+
+        err = StringIO()
+        with patch("sys.stderr", err):
+            rc = cli.main(argv + ["--workers", "2"])
+        self.assertEqual(rc, 2)
+        self.assertIn("--state", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,12 @@
+import gzip
+import json
 import os
+import shlex
 import tempfile
+import types
 import unittest
 
-from contract_tester.traffic import load_traffic
+from contract_tester.traffic import READ_CHUNK_SIZE, _split_command, iter_traffic, load_traffic
 
 
 class TestTrafficCurl(unittest.TestCase):
@@ -30,6 +34,100 @@ HTTPSTATUS:201
         self.assertEqual(items[0]["status"], 201)
         self.assertEqual(items[0]["response_json"]["name"], "Ada")
 
+    def test_headers_blank_lines_and_last_status(self):
+        content = (
+            "ignored preamble\r\n"
+            "curl -i 'https://api.example.com/users/7?expand=1'\r\n"
+            "HTTP/1.1 200 OK\r\n"
+            "Content-Type: application/json\r\n"
+            "\r\n"
+            "{\r\n"
+            '  "id": 7\r\n'
+            "}\r\n"
+            "HTTPSTATUS:200\r\n"
+            "curl https://api.example.com/page\n"
+            "<html>STATUS: 500</html>\n"
+            "STATUS: 503\n"
+        )
+        path = self._write_file(content, ".log")
+        try:
+            items = load_traffic(path)
+        finally:
+            os.remove(path)
+        self.assertEqual([(i["path"], i["status"]) for i in items], [("/users/7", 200), ("/page", 503)])
+        self.assertEqual(items[0]["response_json"], {"id": 7})
+        self.assertEqual(items[0]["query"], {"expand": "1"})
+        self.assertIsNone(items[1]["response_json"])
+
+    def test_streams_large_bodies_and_gzip(self):
+        body = json.dumps({"items": ["x" * 100] * (3 * READ_CHUNK_SIZE // 100)})
+        content = "".join(
+            f"curl -s https://api.example.com/items/{i}\n{body}\nHTTPSTATUS:200\n" for i in range(3)
+        )
+        path = self._write_file(content, ".log")
+        gz_path = path + ".gz"
+        with gzip.open(gz_path, "wt", encoding="utf-8") as f:
+            f.write(content)
+        try:
+            entries = iter_traffic(path)
+            self.assertIsInstance(entries, types.GeneratorType)
+            first = next(entries)
+            self.assertEqual(len(first["response_json"]["items"]), len(json.loads(body)["items"]))
+            self.assertEqual(len(list(entries)), 2)
+            self.assertEqual([e.to_dict() for e in load_traffic(gz_path)], [e.to_dict() for e in load_traffic(path)])
+        finally:
+            os.remove(path)
+            os.remove(gz_path)
+
+    def test_lines_end_only_at_newlines(self):
+        content = 'curl https://api.example.com/notes\n{"text": "a\u2028b"}\nHTTPSTATUS:200\n'
+        path = self._write_file(content, ".log")
+        try:
+            items = load_traffic(path)
+        finally:
+            os.remove(path)
+        self.assertEqual(items[0]["response_json"], {"text": "a\u2028b"})
+
+    def test_indented_commands_and_string_bodies(self):
+        content = (
+            'curl https://api.example.com/status\n"ok"\nHTTPSTATUS:200\n'
+            + " " * 80
+            + "curl https://api.example.com/ids\n[1]\nHTTPSTATUS:200\n"
+            + "\u00a0curl https://api.example.com/nbsp\nHTTPSTATUS:204\n"
+            + "curl \nsay curl now\nHTTPSTATUS:201\n"
+        )
+        path = self._write_file(content, ".log")
+        try:
+            items = load_traffic(path)
+        finally:
+            os.remove(path)
+        self.assertEqual(
+            [(i["path"], i["status"], i["response_json"]) for i in items],
+            [("/status", 200, "ok"), ("/ids", 200, [1]), ("/nbsp", 201, None)],
+        )
+
+    def test_log_without_entries_is_rejected(self):
+        path = self._write_file("no commands here\n", ".log")
+        try:
+            with self.assertRaisesRegex(ValueError, "Unsupported traffic format"):
+                load_traffic(path)
+            with self.assertRaisesRegex(ValueError, "Unsupported traffic format"):
+                list(iter_traffic(path))
+        finally:
+            os.remove(path)
+
+    def test_split_command_matches_shlex(self):
+        commands = [
+            "curl -s -X POST https://h/x -H 'Content-Type: application/json' -d '{\"a\": [1, 2]}'",
+            'curl "https://h/a b" -d "say \\"hi\\" \\$HOME \\\\ done" --data-raw=x\\ y',
+            "curl -d '' -H \"\" https://h/'it'\"'\"s",
+            "curl\t-X\tGET https://h/\x0bvt",
+        ]
+        for cmd in commands:
+            self.assertEqual(_split_command(cmd), shlex.split(cmd), cmd)
+        with self.assertRaises(ValueError):
+            _split_command("curl -d '{unterminated")
+
 
 if __name__ == "__main__":
     unittest.main()
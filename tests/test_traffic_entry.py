@@ -0,0 +1,106 @@
+import json
+import os
+import pickle
+import tempfile
+import unittest
+
+from contract_tester.traffic import ENTRY_FIELDS, TrafficEntry, load_traffic
+from contract_tester.validate import validate_traffic_against_spec
+
+SPEC = {
+    "openapi": "3.0.0",
+    "paths": {
+        "/users/{id}": {
+            "get": {
+                "responses": {
+                    "200": {
+                        "content": {
+                            "application/json": {
+                                "schema": {"type": "object", "required": ["id"]}
+                            }
+                        }
+                    },
+                    "404": {"description": "not found"},
+                }
+            }
+        }
+    },
+}
+
+
+class TestTrafficEntry(unittest.TestCase):
+    def test_dict_style_access(self):
+        entry = TrafficEntry("GET", "/users/1", 200, {"id": 1}, headers={"accept": "*/*"})
+        self.assertFalse(hasattr(entry, "__dict__"))
+        self.assertEqual(entry["path"], "/users/1")
+        self.assertEqual(entry.get("status"), 200)
+        self.assertIsNone(entry.get("nope"))
+        self.assertEqual(entry.get("nope", 1), 1)
+        self.assertIn("method", entry)
+        self.assertNotIn("get", entry)
+        with self.assertRaises(KeyError):
+            entry["keys"]
+        self.assertEqual(list(entry), list(ENTRY_FIELDS))
+        self.assertEqual(dict(entry.items()), entry.to_dict())
+        self.assertEqual(entry, entry.to_dict())
+        self.assertEqual(entry.query, {})
+        self.assertEqual(pickle.loads(pickle.dumps(entry)), entry)
+
+    def test_request_text_dropped_after_parse(self):
+        parsed = TrafficEntry("POST", "/users", 201, request_json={"a": 1}, request_text='{"a": 1}')
+        self.assertIsNone(parsed.request_text)
+        broken = TrafficEntry("POST", "/users", 201, request_text="{oops", request_content_type="application/json")
+        self.assertEqual(broken.request_text, "{oops")
+
+    def test_loaded_strings_are_shared(self):
+        rows = [
+            {
+                "method": "post",
+                "path": "/users",
+                "status": 201,
+                "request_text": json.dumps({"n": i}),
+                "request_content_type": "application/json",
+                "headers": {"Content-Type": "application/json"},
+            }
+            for i in range(3)
+        ]
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "traffic.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(rows, f)
+            entries = load_traffic(path)
+        self.assertTrue(all(isinstance(e, TrafficEntry) for e in entries))
+        first, second = entries[0], entries[1]
+        self.assertIs(first.method, second.method)
+        self.assertIs(first.path, second.path)
+        self.assertIs(first.request_content_type, second.request_content_type)
+        self.assertIs(next(iter(first.headers)), next(iter(second.headers)))
+        # Nothing parsed the body, so the raw text is kept.
+        self.assertEqual(first.request_text, '{"n": 0}')
+
+    def test_response_body_parsed_on_first_read(self):
+        entry = TrafficEntry("GET", "/users/1", 200, response_body=b'{"id": 1}')
+        copy = pickle.loads(pickle.dumps(entry))
+        self.assertEqual(copy._response_body, b'{"id": 1}')
+        self.assertEqual(entry.response_json, {"id": 1})
+        self.assertIsNone(entry._response_body)
+        self.assertEqual(copy, entry)
+        self.assertIsNone(TrafficEntry("GET", "/users/1", 200, response_body="{oops").response_json)
+
+    def test_validation_parses_only_checked_bodies(self):
+        entries = [
+            TrafficEntry("GET", "/users/1", 200, response_body='{"id": 1}'),
+            TrafficEntry("GET", "/users/2", 200, response_body="{oops"),
+            TrafficEntry("GET", "/users/3", 404, response_body='{"error": "gone"}'),
+            TrafficEntry("GET", "/orders/1", 200, response_body='{"id": 1}'),
+        ]
+        result = validate_traffic_against_spec(SPEC, entries, ignore_unknown=True)
+        self.assertEqual(
+            result["error_group_counts"],
+            {"response.schema_mismatch|GET|/users/{id}|200": 1, "response.schema_missing|GET|/users/{id}|404": 1},
+        )
+        self.assertEqual([e._response_body is None for e in entries], [True, True, False, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
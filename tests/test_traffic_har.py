@@ -4,7 +4,7 @@ import os
 import tempfile
 import unittest
 
-from contract_tester.traffic import load_traffic
+from contract_tester.traffic import iter_traffic, load_traffic
 
 
 class TestTrafficHar(unittest.TestCase):
@@ -46,6 +46,45 @@ class TestTrafficHar(unittest.TestCase):
         self.assertEqual(len(items), 1)
         self.assertEqual(items[0]["response_json"], payload)
 
+    def test_streamed_entries(self):
+        har = {
+            "log": {
+                "version": "1.2",
+                "pages": [{"id": "page_1", "title": "x"}],
+                "entries": [
+                    "not-an-entry",
+                    {
+                        "request": {
+                            "method": "post",
+                            "url": "https://example.com/users/1/?a=1",
+                            "headers": [{"name": "Content-Type", "value": "application/json"}],
+                            "postData": {"mimeType": "application/json", "text": "{\"name\": \"Ada\"}"},
+                        },
+                        "response": {
+                            "status": 201,
+                            "content": {"mimeType": "application/json", "text": "{\"id\": 1}"},
+                        },
+                    },
+                    {"request": {"url": "https://example.com/missing-method"}, "response": {"status": 200}},
+                ],
+            }
+        }
+
+        har_path = self._write_file(json.dumps(har, indent=2), ".har")
+        try:
+            items = iter_traffic(har_path)
+            first = next(items)
+            rest = list(items)
+        finally:
+            os.remove(har_path)
+
+        self.assertEqual(rest, [])
+        self.assertEqual(first["method"], "POST")
+        self.assertEqual(first["path"], "/users/1")
+        self.assertEqual(first["query"], {"a": "1"})
+        self.assertEqual(first["request_json"], {"name": "Ada"})
+        self.assertEqual(first["response_json"], {"id": 1})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,87 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+from contract_tester import cli
+from contract_tester.traffic import iter_traffic, load_traffic
+
+
+class _FakeStdin:
+    def __init__(self, data: bytes):
+        self.buffer = io.BufferedReader(io.BytesIO(data))
+
+
+class TestTrafficJsonl(unittest.TestCase):
+    def setUp(self):
+        self.lines = [
+            json.dumps({"method": "get", "path": "/users/1?x=1", "status": 200, "response_json": {"id": 1}}),
+            "",
+            "{not json",
+            json.dumps({"method": "GET", "path": "/users/2"}),
+            json.dumps([1, 2]),
+            json.dumps({"method": "POST", "path": "/users", "status": "201", "request_text": "{\"a\": 1}"}),
+        ]
+        self.text = "\n".join(self.lines) + "\n"
+
+    def _write_file(self, data: bytes, suffix: str) -> str:
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def _check(self, items):
+        self.assertEqual(len(items), 2)
+        self.assertEqual(items[0]["method"], "GET")
+        self.assertEqual(items[0]["path"], "/users/1")
+        self.assertEqual(items[1]["status"], 201)
+        self.assertEqual(items[1]["request_json"], {"a": 1})
+
+    def test_jsonl_file_reports_bad_lines(self):
+        path = self._write_file(self.text.encode("utf-8"), ".jsonl")
+        bad = []
+        try:
+            items = list(iter_traffic(path, on_error=lambda n, reason: bad.append(n)))
+        finally:
+            os.remove(path)
+        self._check(items)
+        self.assertEqual(bad, [3, 4, 5])
+
+    def test_gzip_ndjson(self):
+        path = self._write_file(gzip.compress(self.text.encode("utf-8")), ".ndjson.gz")
+        try:
+            items = load_traffic(path)
+        finally:
+            os.remove(path)
+        self._check(items)
+
+    def test_stdin_plain_and_gzip(self):
+        for data in (self.text.encode("utf-8"), gzip.compress(self.text.encode("utf-8"))):
+            with patch("sys.stdin", _FakeStdin(data)):
+                items = list(iter_traffic("-"))
+            self._check(items)
+
+    def test_cli_reads_stdin(self):
+        spec = {"openapi": "3.0.0", "paths": {"/users/{id}": {"get": {"responses": {"200": {}}}}}}
+        spec_path = self._write_file(json.dumps(spec).encode("utf-8"), ".json")
+        out, err = io.StringIO(), io.StringIO()
+        try:
+            with patch("sys.stdin", _FakeStdin(self.text.encode("utf-8"))):
+                with redirect_stdout(out), redirect_stderr(err):
+                    rc = cli.main(["validate", "--spec", spec_path, "--traffic", "-", "--json"])
+        finally:
+            os.remove(spec_path)
+        result = json.loads(out.getvalue()[out.getvalue().index("{"):])
+        self.assertEqual(rc, 1)
+        self.assertEqual(result["total_checks"], 2)
+        self.assertEqual(result["skipped_lines"], 3)
+        self.assertIn("line 3", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()